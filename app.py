@@ -17,63 +17,47 @@ VC Term Sheet Analyzer v2.1 - 한국 자산운용사 최적화 버전
 """
 
 import streamlit as st
-
-# =============================================================================
-# 페이지 설정
-# =============================================================================
-st.set_page_config(
-    page_title="VC Term Sheet Analyzer | 인프라프론티어",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
 import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from typing import Dict
+import cProfile
+import io
 import math
+import os
+import pstats
+import tempfile
+import time
+import uuid
 
-# =============================================================================
-# 수학 함수 (scipy 없이 직접 구현)
-# =============================================================================
-def norm_cdf(x):
-    """표준정규분포 누적분포함수"""
-    a1, a2, a3, a4, a5 = 0.254829592, -0.284496736, 1.421413741, -1.453152027, 1.061405429
-    p = 0.3275911
-    sign = 1 if x >= 0 else -1
-    x = abs(x) / math.sqrt(2)
-    t = 1.0 / (1.0 + p * x)
-    y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * math.exp(-x * x)
-    return 0.5 * (1.0 + sign * y)
-
-def black_scholes_call(S: float, K: float, T: float, r: float, sigma: float) -> float:
-    """Black-Scholes 콜옵션 가치"""
-    if T <= 0 or sigma <= 0 or S <= 0:
-        return max(0, S - K)
-    if K <= 0:
-        return S
-    d1 = (math.log(S / K) + (r + sigma**2 / 2) * T) / (sigma * math.sqrt(T))
-    d2 = d1 - sigma * math.sqrt(T)
-    return max(0, S * norm_cdf(d1) - K * math.exp(-r * T) * norm_cdf(d2))
+from termsheet import (
+    FundInput,
+    GlobalInput,
+    SHARED_CACHE,
+    RoundInput,
+    build_termsheet_graph,
+    cache_stats,
+    rounds_snapshot,
+    snapshot,
+)
+from termsheet.charts import create_sensitivity_heatmap, create_waterfall_chart
+from termsheet.jobs import JobService, breakeven_job
+from termsheet.prewarm import Prewarmer
+from termsheet.scenarios import (
+    SCENARIO_METRICS,
+    compare_scenarios,
+    evaluate_scenarios,
+    make_scenario,
+    scenario_variant,
+)
+from termsheet.sensitivity import SENSITIVITY_PARAMS, default_axis, sensitivity_grid
+from termsheet.store import DEFAULT_STORE_PATH, ResultStore, content_hash
+from termsheet.profiling import TRACER, span, start_cprofile, start_span
 
-def re_option_call(S: float, K: float, H: float, r: float, sigma: float) -> float:
-    """Random Expiration Option (VC 투자에 적합한 옵션 모델)"""
-    if H <= 0:
-        return max(0, S - K)
-    total = 0
-    for i in range(1, 21):
-        t = i * H / 20
-        prob = (1 / H) * math.exp(-t / H) * (H / 20)
-        total += prob * black_scholes_call(S, K, t, r, sigma)
-    return total * H
+JOB_POLL_INTERVAL = 0.5  # 작업 진행률 폴링 주기 (초)
 
 # =============================================================================
 # CSS 스타일 (다크 글래스모피즘)
 # =============================================================================
-st.markdown("""
+CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700;900&family=JetBrains+Mono:wght@400;500;600&display=swap');
     
@@ -267,510 +251,887 @@ st.markdown("""
         background: rgba(99, 102, 241, 0.05);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# =============================================================================
-# 데이터 클래스
-# =============================================================================
-@dataclass
-class RoundInput:
-    """투자 라운드 입력"""
-    name: str
-    active: bool = False
-    security_type: str = "RCPS"  # RCPS, CPS, BW 등
-    investment: float = 0  # 투자금액 (억원)
-    shares: float = 0  # 주식 수 (주)
-    liquidation_pref: float = 1.0  # 청산우선권 배수
-    
-    @property
-    def redemption_value(self) -> float:
-        """상환가치 = 투자금액 × 청산우선권"""
-        return self.investment * self.liquidation_pref
-    
-    @property
-    def rvps(self) -> float:
-        """주당상환가치 (RVPS) = RV / 주식수"""
-        if self.shares > 0:
-            return self.redemption_value / self.shares
-        return float('inf')
+def setup_page():
+    """페이지 설정 및 CSS 주입 (Streamlit 실행 시에만 호출)"""
+    st.set_page_config(
+        page_title="VC Term Sheet Analyzer | 인프라프론티어",
+        page_icon="📊",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(CSS, unsafe_allow_html=True)
 
-@dataclass
-class FundInput:
-    """펀드 정보"""
-    committed_capital: float = 500  # 약정총액 (억원)
-    management_fee_rate: float = 2.0  # 관리보수율 (%)
-    carried_interest: float = 20  # 성과보수율 (%)
-    hurdle_rate: float = 8.0  # 허들레이트 (%)
+def format_currency(value: float) -> str:
+    """통화 포맷 (억원 기준)"""
+    # 1조 이상이면 조 단위로 표시
+    if abs(value) >= 10000:
+        return f"{value/10000:,.1f}조원"
+    return f"{value:,.1f}억원"
 
-@dataclass
-class GlobalInput:
-    """글로벌 설정"""
-    founders_shares: float = 1_000_000  # 창업자 주식 (주)
-    current_valuation: float = 100  # 현재 기업가치 (억원)
-    exit_valuation: float = 500  # 예상 Exit 가치 (억원)
-    volatility: float = 80  # 변동성 (%)
-    risk_free_rate: float = 3.5  # 무위험이자율 (%)
-    holding_period: float = 5  # 예상 보유기간 (년)
+@st.cache_resource
+def get_result_store() -> ResultStore:
+    """프로세스 전체가 공유하는 영구 결과 저장소 (세션·서버 재시작 간 재사용)"""
+    return ResultStore(DEFAULT_STORE_PATH)
 
-# =============================================================================
-# 핵심 계산 함수
-# =============================================================================
-def get_conversion_order(rounds: List[RoundInput]) -> List[Tuple[str, float]]:
-    """RVPS 기준 전환 순서 계산 (낮은 순)"""
-    active = [(r.name, r.rvps) for r in rounds if r.active and r.shares > 0]
-    return sorted(active, key=lambda x: x[1])
+@st.cache_resource
+def get_job_service() -> JobService:
+    """프로세스 전체가 공유하는 작업 풀 (무거운 계산을 스크립트 스레드 밖에서 실행)"""
+    return JobService()
 
-def calculate_conversion_points(rounds: List[RoundInput], founders_shares: float) -> Dict:
-    """각 시리즈의 전환포인트 계산"""
-    order = get_conversion_order(rounds)
-    results = {}
-    
-    converted_shares = founders_shares
-    remaining_rv = sum(r.redemption_value for r in rounds if r.active)
-    
-    for name, rvps in order:
-        r = next(r for r in rounds if r.name == name)
-        total_shares_if_convert = converted_shares + r.shares
-        ownership = r.shares / total_shares_if_convert
-        prior_rv = remaining_rv - r.redemption_value
+@st.cache_resource
+def get_prewarmer() -> Prewarmer:
+    """입력 편집이 멈추면 Breakeven·Figure 등을 백그라운드에서 미리 계산"""
+    return Prewarmer(get_job_service(), get_result_store())
+
+def derived_values():
+    """현재 입력을 반영한 파생값 그래프 (바뀐 필드에 의존하는 노드만 무효화)"""
+    graph = st.session_state.depgraph
+    graph.update(
+        st.session_state.rounds,
+        st.session_state.global_input,
+        st.session_state.fund_input,
+    )
+    return graph
+
+def render_profiling_panel(container, cache_before: Dict, profiler: cProfile.Profile = None):
+    """디버그 패널: 이번 rerun의 스팬별 호출 횟수/누적 시간, 캐시 적중, cProfile 덤프"""
+    with container:
+        st.markdown("### 🐞 Rerun 프로파일")
         
-        # 전환포인트: 전환가치 > 상환가치가 되는 기업가치
-        conversion_point = r.redemption_value / ownership + prior_rv
+        rows = TRACER.report()
+        if rows:
+            st.dataframe(
+                pd.DataFrame(rows).rename(columns={
+                    'name': '구간', 'calls': '호출', 'total_ms': '누적 (ms)', 'mean_ms': '평균 (ms)',
+                }),
+                width="stretch",
+                hide_index=True,
+                column_config={
+                    '누적 (ms)': st.column_config.NumberColumn(format="%.2f"),
+                    '평균 (ms)': st.column_config.NumberColumn(format="%.3f"),
+                },
+            )
         
-        results[name] = {
-            'rvps': rvps,
-            'rv': r.redemption_value,
-            'shares': r.shares,
-            'conversion_point': conversion_point,
-            'ownership_pct': ownership * 100,
-            'order': len(results) + 1
-        }
+        cache_rows = []
+        for name, after in cache_stats().items():
+            before = cache_before.get(name, {})
+            hits = max(0, after['hits'] - before.get('hits', 0))
+            misses = max(0, after['misses'] - before.get('misses', 0))
+            cache_rows.append({
+                '캐시': name,
+                '적중': hits,
+                '실패': misses,
+                '적중률': f"{hits / (hits + misses) * 100:.0f}%" if hits + misses else "-",
+                '크기': (f"{after['size']}/{after['maxsize']}" if after.get('max_bytes') is None
+                         else f"{after['size']}건 · {after['bytes'] / 2**20:.1f}/{after['max_bytes'] / 2**20:.0f}MB"),
+                '축출': max(0, after['evictions'] - before.get('evictions', 0)),
+            })
+        st.dataframe(pd.DataFrame(cache_rows), width="stretch", hide_index=True)
         
-        converted_shares += r.shares
-        remaining_rv -= r.redemption_value
-    
-    return results
-
-def calculate_exit_payoffs(exit_value: float, rounds: List[RoundInput], founders_shares: float) -> Dict:
-    """특정 Exit 가치에서의 수령액 계산"""
-    cp_data = calculate_conversion_points(rounds, founders_shares)
-    order = get_conversion_order(rounds)
-    
-    payoffs = {}
-    remaining = exit_value
-    converted = set()
-    
-    # 전환 여부 판단
-    for name, _ in order:
-        if name in cp_data and exit_value >= cp_data[name]['conversion_point']:
-            converted.add(name)
-    
-    # 상환 (역순: 후순위부터)
-    for name, _ in reversed(order):
-        if name in converted:
-            continue
-        r = next(r for r in rounds if r.name == name)
-        payout = min(r.redemption_value, remaining)
-        payoffs[name] = {'상환': payout, '전환': 0, '합계': payout}
-        remaining = max(0, remaining - payout)
-    
-    # 전환 (지분 배분)
-    if remaining > 0:
-        total_shares = founders_shares + sum(
-            next(r.shares for r in rounds if r.name == n) for n in converted
+        shared = cache_stats()['shared']
+        st.caption(
+            f"공유 캐시 (전체 세션): 적중률 {shared['hit_rate'] * 100:.0f}% · "
+            f"{shared['bytes'] / 2**20:.1f}MB / {shared['max_bytes'] / 2**20:.0f}MB · "
+            f"축출 {shared['evictions']}건 · 만료 {shared['expirations']}건 (TTL {shared['ttl']:.0f}초)"
         )
         
-        # 창업자
-        founder_payout = (founders_shares / total_shares) * remaining
-        payoffs['창업자'] = {'상환': 0, '전환': founder_payout, '합계': founder_payout}
+        store = get_result_store().stats()
+        st.caption(
+            f"결과 저장소: {store['entries']}건 · {store['bytes'] / 1024:.0f}KB · "
+            f"적중률 {store['hit_rate'] * 100:.0f}% (엔진 {store['engine_version']})"
+        )
         
-        # 전환한 투자자
-        for name in converted:
-            r = next(r for r in rounds if r.name == name)
-            payout = (r.shares / total_shares) * remaining
-            payoffs[name] = {'상환': 0, '전환': payout, '합계': payout}
-    else:
-        payoffs['창업자'] = {'상환': 0, '전환': 0, '합계': 0}
-    
-    return payoffs
+        jobs = get_job_service().stats()
+        st.caption(
+            f"작업 풀: 워커 {jobs['workers']}개 · 실행 {jobs['running_tasks']} · 대기 {jobs['queued_tasks']} "
+            f"(사용자당 {jobs['per_user_limit']}) · "
+            + (", ".join(f"{status} {count}" for status, count in jobs['jobs'].items()) or "작업 없음")
+        )
+        prewarm = get_prewarmer().stats()
+        st.caption(
+            f"사전 계산: 예약 {prewarm['scheduled']} · 완료 {prewarm['completed']} · "
+            f"취소 {prewarm['cancelled']} · 대기 {prewarm['pending']}"
+        )
+        
+        if profiler is not None:
+            path = os.path.join(
+                tempfile.gettempdir(), f"termsheet_rerun_{time.strftime('%Y%m%d_%H%M%S')}.pstats"
+            )
+            profiler.dump_stats(path)
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(15)
+            st.caption(f"cProfile 저장: {path}")
+            st.code(stream.getvalue(), language=None)
+            with open(path, 'rb') as fh:
+                st.download_button("pstats 다운로드", fh.read(), file_name=os.path.basename(path))
 
-def calculate_partial_valuation(r: RoundInput, rounds: List[RoundInput], 
-                                founders_shares: float, g: GlobalInput, use_re: bool = True) -> float:
-    """Partial Valuation 계산 (옵션 모델)"""
-    cp_data = calculate_conversion_points(rounds, founders_shares)
-    
-    if r.name not in cp_data:
-        return 0
-    
-    V = g.current_valuation
-    rf = g.risk_free_rate / 100
-    sigma = g.volatility / 100
-    H = g.holding_period
-    
-    opt_func = re_option_call if use_re else black_scholes_call
-    
-    data = cp_data[r.name]
-    order = get_conversion_order(rounds)
-    
-    # 선순위 RV 합계
-    prior_rv = 0
-    for name, _ in order:
-        if name == r.name:
-            break
-        prior_rv += cp_data[name]['rv']
-    
-    rv = data['rv']
-    cp = data['conversion_point']
-    ownership = data['ownership_pct'] / 100
-    
-    # Partial Valuation = C(prior_rv) - C(prior_rv + rv) + ownership × C(cp)
-    p1 = opt_func(V, prior_rv, H, rf, sigma) if prior_rv > 0 else V
-    p2 = opt_func(V, prior_rv + rv, H, rf, sigma)
-    p3 = ownership * opt_func(V, cp, H, rf, sigma)
-    
-    return max(0, p1 - p2 + p3)
+# =============================================================================
+# 탭 화면
+# =============================================================================
+def render_input_tab():
+    """투자조건 입력 탭"""
+    st.markdown('<div class="section-title">📝 EXIT DIAGRAM INPUTS</div>', unsafe_allow_html=True)
+    st.caption("vcvtools.com 방식의 Term Sheet 입력")
 
-def calculate_lp_cost(fund: FundInput, investment: float) -> float:
-    """LP Cost 계산"""
-    # 총 관리보수 = 약정총액 × 관리보수율 × 10년 (가정)
-    lifetime_fees = fund.committed_capital * (fund.management_fee_rate / 100) * 10
-    investable = fund.committed_capital - lifetime_fees
-    if investable > 0:
-        return (fund.committed_capital / investable) * investment
-    return investment
+    # 라운드 활성화 체크박스
+    cols = st.columns(6)
+    for idx, r in enumerate(st.session_state.rounds):
+        with cols[idx]:
+            badge_class = r.name.lower().replace(" ", "-")
+            st.markdown(
+                f"<span class='series-badge {badge_class}'>{r.name}</span>",
+                unsafe_allow_html=True,
+            )
+            r.active = st.checkbox(
+                "활성", value=r.active, key=f"active_{r.name}", label_visibility="collapsed"
+            )
 
-def calculate_gp_lp_split(partial_val: float, fund: FundInput, investment: float) -> Dict:
-    """GP/LP 분배 계산"""
-    lp_cost = calculate_lp_cost(fund, investment)
-    
-    # 수익 계산
-    profit = max(0, partial_val - investment)
-    
-    # 허들 적용
-    hurdle_amount = investment * (fund.hurdle_rate / 100) * 5  # 5년 가정
-    
-    if profit <= hurdle_amount:
-        gp_carry = 0
-    else:
-        excess = profit - hurdle_amount
-        gp_carry = excess * (fund.carried_interest / 100)
-    
-    lp_val = partial_val - gp_carry
-    
-    return {
-        'lp_cost': lp_cost,
-        'partial_val': partial_val,
-        'profit': profit,
-        'hurdle': hurdle_amount,
-        'gp_carry': gp_carry,
-        'lp_valuation': lp_val,
-        'lp_return_pct': ((lp_val - lp_cost) / lp_cost * 100) if lp_cost > 0 else 0
-    }
+    st.markdown("---")
 
-# =============================================================================
-# 시각화 함수
-# =============================================================================
-def create_exit_diagram(rounds: List[RoundInput],
-                        founders_shares: float,
-                        max_exit: float = None) -> go.Figure:
-    """Exit Diagram (Composite)"""
+    # 활성 / 유효 라운드
+    active_rounds = [r for r in st.session_state.rounds if r.active]
+    valid_rounds = [r for r in active_rounds if r.shares > 0]
 
-    cp_data = calculate_conversion_points(rounds, founders_shares)
+    if active_rounds:
+        st.markdown("#### 라운드별 상세 조건")
 
-    # 전환포인트가 없으면 빈 Figure 반환
-    if not cp_data:
-        return go.Figure()
+        input_cols = st.columns(len(active_rounds))
+        for idx, r in enumerate(active_rounds):
+            with input_cols[idx]:
+                st.markdown(f"**{r.name}**")
 
-    # max_exit 자동 설정
-    if max_exit is None:
-        finite_cps = [
-            d["conversion_point"]
-            for d in cp_data.values()
-            if d.get("conversion_point") is not None and math.isfinite(d["conversion_point"])
-        ]
-        if finite_cps:
-            max_cp = max(finite_cps)
-            max_exit = max_cp * 1.5
-        else:
-            max_exit = 1000  # fallback
+                r.security_type = st.selectbox(
+                    "증권유형", ["RCPS", "CPS", "BW", "CB"],
+                    key=f"type_{r.name}",
+                    help="RCPS: 상환전환우선주, CPS: 전환우선주",
+                )
 
-    exit_vals = np.linspace(0, max_exit, 200)
+                r.investment = st.number_input(
+                    "투자금액 (억원)",
+                    min_value=0.0, max_value=10000.0,
+                    value=float(r.investment), step=1.0,
+                    key=f"inv_{r.name}",
+                )
 
-    # 이해관계자 리스트
-    parties = ["창업자"] + [r.name for r in rounds if r.active]
-    payoff_data = {p: [] for p in parties}
+                r.shares = st.number_input(
+                    "주식수 (주)",
+                    min_value=0.0, max_value=1_000_000_000.0,
+                    value=float(r.shares), step=1.0,
+                    key=f"shares_{r.name}",
+                )
 
-    # 각 Exit 가치마다 수령액 계산
-    for ev in exit_vals:
-        payoffs = calculate_exit_payoffs(ev, rounds, founders_shares)
-        for p in parties:
-            payoff_data[p].append(payoffs.get(p, {}).get("합계", 0))
+                r.liquidation_pref = st.selectbox(
+                    "청산우선권",
+                    [1.0, 1.5, 2.0, 2.5, 3.0],
+                    index=(
+                        [1.0, 1.5, 2.0, 2.5, 3.0].index(r.liquidation_pref)
+                        if r.liquidation_pref in [1.0, 1.5, 2.0, 2.5, 3.0] else 0
+                    ),
+                    key=f"lp_{r.name}",
+                    help="상환 시 투자금액의 배수",
+                )
 
-    colors = {
-        "창업자": "#10b981",
-        "Series A": "#6366f1",
-        "Series B": "#f97316",
-        "Series C": "#22c55e",
-        "Series D": "#d946ef",
-        "Series E": "#ec4899",
-        "Series F": "#6b7280",
-    }
+                r.participating = st.checkbox(
+                    "참가적",
+                    value=r.participating,
+                    key=f"part_{r.name}",
+                    help="청산우선권을 받은 뒤 남은 가치에도 지분율만큼 참가 (PCP)",
+                )
+                if r.participating:
+                    r.participation_cap = st.number_input(
+                        "참가 상한 (배수, 0=무제한)",
+                        min_value=0.0, max_value=10.0,
+                        value=float(r.participation_cap), step=0.5,
+                        key=f"cap_{r.name}",
+                        help="청산우선권 + 참가분 합계의 투자금액 대비 상한 (PCPC)",
+                    )
 
-    fig = go.Figure()
+        st.markdown("---")
 
-    # 각 이해관계자 라인 추가
-    for p in parties:
-        fig.add_trace(
-            go.Scatter(
-                x=exit_vals,
-                y=payoff_data[p],
-                name=p,
-                mode="lines",
-                line=dict(width=3, color=colors.get(p, "#64748b")),
-                hovertemplate=(
-                    f"<b>{p}</b><br>"
-                    "Exit: %{x:.1f}억<br>"
-                    "수령액: %{y:.2f}억<extra></extra>"
-                ),
+        # ------------------------------
+        # 1) RVPS 및 전환순서
+        # ------------------------------
+        if valid_rounds:
+            st.markdown(
+                '<div class="section-title">📋 전환순서 (Conversion Order)</div>',
+                unsafe_allow_html=True,
             )
-        )
+            st.caption("📖 강의자료: Conversion-Order Shortcut - RVPS가 낮을수록 먼저 전환")
 
-    # 전환포인트 수직선 및 라벨
-    for name, data in cp_data.items():
-        cp = data.get("conversion_point")
-        if cp is None or not math.isfinite(cp):
-            continue
+            graph = derived_values()
+            order = graph['conversion_order']
 
-        fig.add_vline(
-            x=cp,
-            line_dash="dash",
-            line_color=colors.get(name, "#64748b"),
-        )
-        fig.add_annotation(
-            x=cp,
-            y=0,
-            yref="paper",
-            yanchor="bottom",
-            showarrow=False,
-            text=f"{name} CP",
-            font=dict(size=10, color=colors.get(name, "#64748b")),
-        )
+            end_span = start_span("Tab 1: RVPS 테이블 HTML")
+            by_name = {r.name: r for r in st.session_state.rounds}
+            # 참가적 시리즈가 있으면 정렬 기준(전환 시 포기하는 주당 가치)을 별도 열로 표시
+            has_participating = any(by_name[name].participating for name, _ in order)
+            key_header = "<th>전환기준 (주당)</th>" if has_participating else ""
+            rvps_html = f"""
+<table class="result-table">
+<tr><th>Series</th><th>투자금액</th><th>주식수 (주)</th><th>청산배수</th><th>상환가치 (RV)</th><th>RVPS</th>{key_header}</tr>
+"""
+            for name, rvps in order:
+                r = by_name[name]
+                if has_participating:
+                    per_share = r.conversion_value / r.shares
+                    key_text = f"{per_share:.4f}" if math.isfinite(per_share) else "전환 안 함"
+                    rvps_cell, key_cell = f"{rvps:.4f}", f"<td><strong>{key_text}</strong></td>"
+                else:
+                    rvps_cell, key_cell = f"<strong>{rvps:.4f}</strong>", ""
+                rvps_html += f"""
+<tr>
+    <td><span class="series-badge {name.lower().replace(' ','-')}">{name}</span></td>
+    <td>{r.investment:.1f}억</td>
+    <td>{r.shares:,.0f}</td>
+    <td>{r.liquidation_pref}x</td>
+    <td>{r.redemption_value:.1f}억</td>
+    <td>{rvps_cell}</td>
+    {key_cell}
+</tr>
+"""
+            rvps_html += "</table>"
+            end_span()
+            st.markdown(rvps_html, unsafe_allow_html=True)
 
-    fig.update_layout(
-        title=dict(
-            text="Exit Diagram (Composite)",
-            font=dict(size=16, color="#f8fafc"),
-        ),
-        xaxis=dict(
-            title=dict(text="Exit 가치 (억원)", font=dict(color="#94a3b8")),
-            tickfont=dict(color="#64748b"),
-            gridcolor="rgba(255,255,255,0.05)",
-        ),
-        yaxis=dict(
-            title=dict(text="수령액 (억원)", font=dict(color="#94a3b8")),
-            tickfont=dict(color="#64748b"),
-            gridcolor="rgba(255,255,255,0.05)",
-        ),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        legend=dict(
-            bgcolor="rgba(20,20,30,0.8)",
-            font=dict(color="#f8fafc"),
-        ),
-        hovermode="x unified",
-        height=450,
-    )
+            order_badges = " → ".join(
+                f"<span class='series-badge {n.lower().replace(' ','-')}'>{n}</span>"
+                for n, _ in order
+            )
+            st.markdown(
+                f"""
+<div class="conversion-order-box">
+    <strong>전환순서:</strong> {order_badges}
+</div>
+""",
+                unsafe_allow_html=True,
+            )
 
-    return fig
+            st.markdown(
+                """
+<div class="info-box">
+    💡 <strong>해석:</strong> RVPS가 낮다 = 주당 상환받을 금액이 적다 = 전환해서 지분을 받는 것이 더 빨리 유리해짐
+</div>
+""",
+                unsafe_allow_html=True,
+            )
+            if has_participating:
+                st.caption(
+                    "참가적 시리즈는 전환 시 포기하는 주당 가치(전환기준) 순으로 전환합니다: "
+                    "상한 참가적은 max(상한 총액, RV) / 주식수, 상한 없는 참가적은 전환하지 않음."
+                )
 
+            # ------------------------------
+            # 2) 지분 구조 & 밸류에이션 요약 (한 번만!)
+            # ------------------------------
+            st.markdown(
+                '<div class="section-title">📊 지분 구조 & 밸류에이션 요약</div>',
+                unsafe_allow_html=True,
+            )
 
-def create_series_diagrams(rounds: List[RoundInput], founders_shares: float, max_exit: float = None) -> go.Figure:
-    """개별 Series Exit Diagram"""
-    active = [r for r in rounds if r.active]
-    if not active:
-        return go.Figure()
-    
-    cp_data = calculate_conversion_points(rounds, founders_shares)
-    
-    if max_exit is None:
-        max_cp = max(d['conversion_point'] for d in cp_data.values())
-        max_exit = max_cp * 1.5
-    
-    exit_vals = np.linspace(0, max_exit, 200)
-    
-    n_plots = min(len(active) + 1, 4)
-    titles = ['창업자'] + [r.name for r in active[:3]]
-    
-    fig = make_subplots(rows=1, cols=n_plots, subplot_titles=titles, horizontal_spacing=0.08)
+            ownership = graph['ownership']
+
+            col_left, col_right = st.columns([1.1, 1.3])
+
+            # 파이 차트
+            with col_left:
+                fig_pie = graph['ownership_figure']
+                st.plotly_chart(
+                    fig_pie,
+                    width="stretch",  # use_container_width 대체
+                    key="ownership_pie_chart",  # 중복 방지
+                )
+
+            # 메트릭 + 테이블
+            with col_right:
+                st.markdown("#### 💰 밸류에이션")
+
+                total_investment = sum(r.investment for r in valid_rounds)
+                total_investor_ownership = sum(
+                    ownership.get(r.name, {}).get("ownership", 0)
+                    for r in valid_rounds
+                )
+
+                if total_investor_ownership > 0:
+                    implied_post = total_investment / (total_investor_ownership / 100)
+                else:
+                    implied_post = 0.0
+                implied_pre = implied_post - total_investment
+
+                mcol1, mcol2, mcol3 = st.columns(3)
+                with mcol1:
+                    st.markdown(
+                        f"""
+                            <div class="metric-card">
+                                <div class="metric-label">총 투자금액</div>
+                                <div class="metric-value">{total_investment:,.1f}억</div>
+                            </div>
+                            """,
+                        unsafe_allow_html=True,
+                    )
+                with mcol2:
+                    st.markdown(
+                        f"""
+                            <div class="metric-card">
+                                <div class="metric-label">POST MONEY</div>
+                                <div class="metric-value">{implied_post:,.1f}억</div>
+                            </div>
+                            """,
+                        unsafe_allow_html=True,
+                    )
+                with mcol3:
+                    st.markdown(
+                        f"""
+                            <div class="metric-card">
+                                <div class="metric-label">PRE MONEY</div>
+                                <div class="metric-value">{implied_pre:,.1f}억</div>
+                            </div>
+                            """,
+                        unsafe_allow_html=True,
+                    )
+
+            # ------------------------------
+            # 3) 지분 내역 테이블
+            # ------------------------------
+            st.markdown("#### 📋 지분 내역")
+
+            founder_info = ownership.get("창업자")
+
+            if founder_info is None:
+                founders_shares = st.session_state.global_input.founders_shares
+                investor_shares_sum = sum(
+                    ownership.get(r.name, {}).get("shares", r.shares)
+                    for r in valid_rounds
+                )
+                total_shares = founders_shares + investor_shares_sum
+                founder_own = (
+                    0.0 if total_shares == 0 else founders_shares / total_shares * 100
+                )
+                founder_info = {
+                    "shares": founders_shares,
+                    "ownership": founder_own,
+                }
+
+            table_data = []
+            table_data.append(
+                {
+                    "구분": "창업자",
+                    "주식수 (주)": f"{founder_info['shares']:,.0f}",
+                    "지분율": f"{founder_info['ownership']:.2f}%",
+                    "투자금액": "-",
+                }
+            )
+
+            for r in valid_rounds:
+                if r.name in ownership:
+                    row = ownership[r.name]
+                    table_data.append(
+                        {
+                            "구분": r.name,
+                            "주식수 (주)": f"{row.get('shares', r.shares):,.0f}",
+                            "지분율": f"{row.get('ownership', 0):.2f}%",
+                            "투자금액": f"{r.investment:,.1f}억",
+                        }
+                    )
+
+            st.dataframe(
+                pd.DataFrame(table_data),
+                width="stretch",
+                hide_index=True,
+            )
+
+        else:
+            st.info("각 Series의 주식수(주)를 0보다 크게 입력하면 RVPS와 지분 구조가 계산됩니다.")
+    else:
+        st.info("👆 위에서 분석할 Series를 선택하세요.")
+
+def render_exit_tab():
+    """Exit Diagram 탭"""
+    st.markdown('<div class="section-title">📊 Exit Diagram</div>', unsafe_allow_html=True)
+    st.caption("📖 강의자료: 전환 또는 상환 결정 (p.5), Exit Valuation of CP (p.6)")
     
-    colors = {'창업자': '#10b981', 'Series A': '#6366f1', 'Series B': '#f97316', 'Series C': '#22c55e'}
-    parties = ['창업자'] + [r.name for r in active]
+    valid_rounds = [r for r in st.session_state.rounds if r.active and r.shares > 0]
     
-    for idx, party in enumerate(parties[:n_plots]):
-        payoffs = []
-        for ev in exit_vals:
-            p = calculate_exit_payoffs(ev, rounds, founders_shares)
-            payoffs.append(p.get(party, {}).get('합계', 0))
+    if not valid_rounds:
+        st.warning("📝 투자조건 입력 탭에서 라운드 정보를 입력하세요.")
+    else:
+        # Cap Table/Figure는 라운드·창업자 주식이 바뀔 때만 다시 계산
+        graph = derived_values()
+        cap_table = graph['cap_table']
+        cp_data = cap_table.cp_data
         
-        fig.add_trace(
-            go.Scatter(x=exit_vals, y=payoffs, line=dict(width=2, color=colors.get(party, '#64748b')), showlegend=False),
-            row=1, col=idx+1
-        )
-    
-    fig.update_layout(
-        height=280,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#f8fafc')
+        # 전환포인트 메트릭
+        st.markdown("#### 전환포인트 (Conversion Points)")
+        
+        cp_cols = st.columns(len(cp_data))
+        for idx, (name, data) in enumerate(cp_data.items()):
+            cp = data['conversion_point']
+            cp_text = f"{cp:.1f}억" if math.isfinite(cp) else "전환 안 함"
+            with cp_cols[idx]:
+                st.markdown(f"""
+                    <div class="metric-card">
+                        <div class="metric-label">{name}</div>
+                        <div class="metric-value">{cp_text}</div>
+                        <div class="metric-sub">지분율: {data['ownership_pct']:.1f}%</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # 개별 Exit Diagram
+        st.markdown("#### Series Diagrams")
+        fig_series = graph['series_figure']
+        st.plotly_chart(fig_series, width="stretch")
+        
+        # Composite Diagram
+        st.markdown("#### Composite Diagram")
+        fig_composite = graph['exit_figure']
+        st.plotly_chart(fig_composite, width="stretch")
+        
+        # 특정 Exit Value 분석 (슬라이더 이동은 이 구간만 다시 실행)
+        st.markdown("---")
+        st.markdown("#### 특정 Exit 가치에서의 분배")
+        render_exit_distribution(cap_table)
+
+@st.fragment
+def render_exit_distribution(cap_table):
+    """특정 Exit 가치에서의 분배 (fragment: 슬라이더 이동 시 이 구간만 rerun)"""
+    # 무제한 참가적 우선주는 전환하지 않으므로 (전환포인트 inf) 유한한 값만 사용
+    max_cp = max(
+        (d['conversion_point'] for d in cap_table.cp_data.values() if math.isfinite(d['conversion_point'])),
+        default=0.0,
+    ) or float(cap_table.breakpoints[-1]) or 500.0
+    exit_val = st.slider(
+        "Exit 가치 (억원)",
+        min_value=0.0,
+        max_value=float(max_cp * 2),
+        value=float(st.session_state.global_input.exit_valuation)
     )
-    fig.update_xaxes(gridcolor='rgba(255,255,255,0.05)', title_text='Exit (억원)')
-    fig.update_yaxes(gridcolor='rgba(255,255,255,0.05)', title_text='수령액')
-    
-    return fig
 
-def create_waterfall_chart(gp_lp_data: Dict, series_name: str) -> go.Figure:
-    """GP/LP 분배 워터폴 차트"""
-    fig = go.Figure(go.Waterfall(
-        name="분배 흐름",
-        orientation="v",
-        measure=["relative", "relative", "relative", "relative", "total"],
-        x=["투자원금", "수익", "허들 공제", "GP Carry", "LP 수령액"],
-        y=[
-            gp_lp_data['lp_cost'],
-            gp_lp_data['profit'],
-            -gp_lp_data['hurdle'] if gp_lp_data['hurdle'] > 0 else 0,
-            -gp_lp_data['gp_carry'],
-            0
-        ],
-        connector={"line": {"color": "rgba(99,102,241,0.5)"}},
-        increasing={"marker": {"color": "#10b981"}},
-        decreasing={"marker": {"color": "#ef4444"}},
-        totals={"marker": {"color": "#6366f1"}}
-    ))
+    payoffs = cap_table.payoffs_at(exit_val)
+
+    # 분배 결과 테이블
+    end_span = start_span("Tab 2: 분배 테이블 HTML")
+    payoff_html = """
+<table class="result-table">
+<tr><th>이해관계자</th><th>상환액</th><th>참가액</th><th>전환액</th><th>합계</th><th>비율</th></tr>
+"""
+    for party, data in payoffs.items():
+        pct = (data["합계"] / exit_val * 100) if exit_val > 0 else 0
+        payoff_html += f"""
+<tr>
+    <td><strong>{party}</strong></td>
+    <td>{data['상환']:.2f}억</td>
+    <td>{data['참가']:.2f}억</td>
+    <td>{data['전환']:.2f}억</td>
+    <td><strong>{data['합계']:.2f}억</strong></td>
+    <td>{pct:.1f}%</td>
+</tr>
+"""
+    payoff_html += "</table>"
+    end_span()
+
+    st.markdown(payoff_html, unsafe_allow_html=True)
+
+def render_valuation_tab():
+    """Valuation 분석 탭"""
+    st.markdown('<div class="section-title">💼 AUTO OUTPUTS - Valuation 분석</div>', unsafe_allow_html=True)
+    st.caption("📖 강의자료: Option Pricing Model, GP/LP 분배")
     
-    fig.update_layout(
-        title=f"{series_name} GP/LP 분배 워터폴",
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='#f8fafc'),
-        height=350
-    )
+    valid_rounds = [r for r in st.session_state.rounds if r.active and r.shares > 0]
     
-    return fig
+    if not valid_rounds:
+        st.warning("📝 투자조건 입력 탭에서 라운드 정보를 입력하세요.")
+    else:
+        # Partial Valuation 결과
+        st.markdown("#### Partial Valuation & GP/LP 분배")
+        
+        # 펀드 조건만 바뀌면 Partial Valuation은 재사용하고 GP/LP 분배만 다시 계산
+        results = derived_values()['gp_lp']
+        
+        # 결과 테이블
+        end_span = start_span("Tab 3: 결과 테이블 HTML")
+        result_html = """
+<table class="result-table">
+<tr><th>Series</th><th>투자금액</th><th>LP Cost</th><th>Partial Val</th><th>GP Carry</th><th>LP Valuation</th><th>LP 수익률</th></tr>
+"""
+        for res in results:
+            return_color = "#10b981" if res["lp_return_pct"] >= 0 else "#ef4444"
+            result_html += f"""
+<tr>
+    <td><span class="series-badge {res['series'].lower().replace(' ','-')}">{res['series']}</span></td>
+    <td>{res['investment']:.1f}억</td>
+    <td>{res['lp_cost']:.2f}억</td>
+    <td><strong>{res['partial_val']:.2f}억</strong></td>
+    <td>{res['gp_carry']:.2f}억</td>
+    <td><strong>{res['lp_valuation']:.2f}억</strong></td>
+    <td style="color:{return_color}"><strong>{res['lp_return_pct']:.1f}%</strong></td>
+</tr>
+"""
+        result_html += "</table>"
+        end_span()
 
-# -----------------------------------------------------------------------------
-# 지분 구조 / 밸류에이션 유틸
-# -----------------------------------------------------------------------------
-def calculate_ownership(rounds: List[RoundInput], founders_shares: float) -> Dict:
-    """
-    투자 후 지분 구조 계산 (founders_shares와 각 라운드 shares 단위 동일: 주 기준)
-    반환 예:
-    {
-        '창업자': {'shares': 1000000, 'ownership': 25.0},
-        'Series A': {'shares': 3000000, 'ownership': 75.0, 'investment': 20},
-        'total_shares': 4000000
-    }
-    """
-    total_shares = founders_shares + sum(
-        r.shares for r in rounds if r.active and r.shares > 0
+        st.markdown(result_html, unsafe_allow_html=True)
+
+        
+        # 워터폴 차트
+        st.markdown("---")
+        st.markdown("#### GP/LP 분배 워터폴")
+        render_waterfall_section(results)
+        
+        # 민감도 분석
+        st.markdown("---")
+        st.markdown("#### 민감도 분석 (Sensitivity)")
+        st.caption("파라미터 그리드 전체에서 Partial Valuation / LP 수익률 변화")
+        render_sensitivity_section([r['series'] for r in results])
+        
+        # Breakeven 계산
+        st.markdown("---")
+        st.markdown("#### Implied-post Valuation (Breakeven)")
+        render_breakeven_section()
+
+@st.fragment
+def render_waterfall_section(results):
+    """GP/LP 분배 워터폴 (fragment: Series 선택 시 이 구간만 rerun)"""
+    selected_series = st.selectbox(
+        "Series 선택",
+        [r['series'] for r in results]
     )
     
-    result: Dict[str, Dict] = {}
-    if total_shares <= 0:
-        return {'total_shares': 0}
-    
-    # 창업자
-    result['창업자'] = {
-        'shares': founders_shares,
-        'ownership': founders_shares / total_shares * 100,
-    }
-    
-    # 각 시리즈
-    for r in rounds:
-        if r.active and r.shares > 0:
-            result[r.name] = {
-                'shares': r.shares,
-                'ownership': r.shares / total_shares * 100,
-                'investment': r.investment,
-            }
-    
-    result['total_shares'] = total_shares
-    return result
+    selected_data = next(r for r in results if r['series'] == selected_series)
+    fig_waterfall = create_waterfall_chart(selected_data, selected_series)
+    st.plotly_chart(fig_waterfall, width="stretch")
 
-
-def create_ownership_pie(ownership: Dict) -> go.Figure:
-    """지분 구조 파이 차트 (창업자 vs 시리즈별)"""
-    labels = []
-    values = []
-    colors = []
+@st.fragment
+def render_sensitivity_section(series_names):
+    """민감도 히트맵 (fragment: 축/지표 변경 시 이 구간만 rerun)"""
+    param_keys = list(SENSITIVITY_PARAMS)
+    scol1, scol2, scol3, scol4 = st.columns(4)
+    with scol1:
+        sens_series = st.selectbox("Series", series_names, key="sens_series")
+    with scol2:
+        sens_metric = st.selectbox(
+            "지표", ["partial_val", "lp_return_pct", "lp_valuation", "gp_carry"],
+            format_func=lambda m: {
+                "partial_val": "Partial Val", "lp_return_pct": "LP 수익률",
+                "lp_valuation": "LP Valuation", "gp_carry": "GP Carry",
+            }[m],
+            key="sens_metric",
+        )
+    with scol3:
+        x_param = st.selectbox(
+            "X축", param_keys, index=0,
+            format_func=SENSITIVITY_PARAMS.get, key="sens_x",
+        )
+    with scol4:
+        y_param = st.selectbox(
+            "Y축", [p for p in param_keys if p != x_param], index=0,
+            format_func=SENSITIVITY_PARAMS.get, key="sens_y",
+        )
     
-    color_map = {
-        '창업자': '#10b981',
-        'Series A': '#6366f1',
-        'Series B': '#8b5cf6',
-        'Series C': '#a855f7',
-        'Series D': '#d946ef',
-        'Series E': '#ec4899',
-        'Series F': '#f43f5e',
+    axes = {
+        y_param: default_axis(y_param, st.session_state.global_input),
+        x_param: default_axis(x_param, st.session_state.global_input),
     }
+    # 같은 딜·축을 보는 다른 세션과 그리드 공유
+    sens_grid = SHARED_CACHE.get_or_compute(
+        ('sensitivity_grid', rounds_snapshot(st.session_state.rounds),
+         snapshot(st.session_state.global_input), snapshot(st.session_state.fund_input),
+         tuple((name, tuple(values)) for name, values in axes.items())),
+        lambda: sensitivity_grid(
+            st.session_state.rounds,
+            st.session_state.global_input.founders_shares,
+            st.session_state.global_input,
+            st.session_state.fund_input,
+            axes,
+        ),
+    )
+    fig_sens = create_sensitivity_heatmap(sens_grid, sens_series, sens_metric, x_param, y_param)
+    st.plotly_chart(fig_sens, width="stretch")
+
+@st.fragment
+def render_breakeven_section():
+    """Breakeven 계산 (fragment: 버튼 클릭 시 이 구간만 rerun, 계산은 작업 풀에서 실행)"""
+    rounds = st.session_state.rounds
+    g = st.session_state.global_input
+    fund = st.session_state.fund_input
+    key = content_hash('breakeven', rounds, g, fund)
+    service = get_job_service()
+    
+    # 입력이 바뀌면 이전 입력으로 실행 중인 작업 취소
+    pending = st.session_state.get('breakeven_job')
+    if pending is not None and pending[0] != key:
+        service.cancel(pending[1])
+        del st.session_state['breakeven_job']
+        pending = None
+    
+    if st.button("🎯 Breakeven 계산", type="primary"):
+        stored = get_result_store().get(key)
+        if stored is not None:
+            st.session_state.breakeven_result = (key, stored)
+        elif pending is None:
+            job_id = service.submit(st.session_state.user_id, breakeven_job(rounds, g, fund), key=key)
+            st.session_state.breakeven_job = pending = (key, job_id)
+    
+    if pending is not None:
+        info = service.status(pending[1])
+        if info is None or info['status'] == 'cancelled':
+            del st.session_state['breakeven_job']
+        elif info['status'] == 'error':
+            del st.session_state['breakeven_job']
+            st.error(f"Breakeven 계산 실패: {info['error']}")
+        elif info['status'] == 'done':
+            breakevens = service.result(pending[1])
+            get_result_store().put(key, breakevens, 'breakeven')
+            st.session_state.breakeven_result = (key, breakevens)
+            del st.session_state['breakeven_job']
+        else:
+            render_job_progress(pending[1])
     
-    for key, data in ownership.items():
-        if key == 'total_shares':
-            continue
-        if not isinstance(data, dict):
-            continue
-        pct = data.get('ownership', 0)
-        if pct <= 0:
-            continue
+    result = st.session_state.get('breakeven_result')
+    if result is not None and result[0] == key:
+        breakevens = result[1]
+        end_span = start_span("Tab 3: Breakeven 테이블 HTML")
+        breakeven_html = """
+<table class="result-table">
+<tr><th>Series</th><th>Implied-post Valuation</th><th>LP Cost</th><th>반복 횟수</th></tr>
+"""
+        for name, be in breakevens.items():
+            value = f"{be['implied_post']:.2f}억" if be['converged'] else "수렴 실패"
+            breakeven_html += f"""
+<tr>
+    <td><span class="series-badge {name.lower().replace(' ','-')}">{name}</span></td>
+    <td><strong>{value}</strong></td>
+    <td>{be['lp_cost']:.2f}억</td>
+    <td>{be['iterations']}</td>
+</tr>
+"""
+        breakeven_html += "</table>"
+        end_span()
         
-        labels.append(key)
-        values.append(pct)
-        colors.append(color_map.get(key, '#64748b'))
-    
-    fig = go.Figure(
-        data=[
-            go.Pie(
-                labels=labels,
-                values=values,
-                hole=0.6,
-                marker=dict(colors=colors, line=dict(color='#0a0a0f', width=2)),
-                textinfo='label+percent',
-                textfont=dict(color='#f8fafc', size=12),
-                hovertemplate='<b>%{label}</b><br>지분율: %{percent}<br>%{value:.1f}%<extra></extra>',
+        st.markdown(breakeven_html, unsafe_allow_html=True)
+        st.caption("각 기업가치에서 LP Cost = LP Valuation")
+
+@st.fragment(run_every=JOB_POLL_INTERVAL)
+def render_job_progress(job_id: str):
+    """작업 진행률 (작업이 있는 동안만 표시되어 주기적으로 폴링, 끝나면 전체 rerun으로 결과 표시)"""
+    service = get_job_service()
+    info = service.status(job_id)
+    if info is None or info['status'] not in ('queued', 'running'):
+        st.rerun()
+    
+    label = "대기 중..." if info['status'] == 'queued' else f"계산 중... {info['elapsed_s']:.1f}초"
+    col_bar, col_cancel = st.columns([4, 1])
+    with col_bar:
+        st.progress(info['progress'], text=f"{label} ({info['completed']}/{info['total']})")
+    with col_cancel:
+        if st.button("취소", key=f"cancel_{job_id}"):
+            service.cancel(job_id)
+            st.rerun()
+
+def render_scenario_tab():
+    """시나리오 비교 탭"""
+    st.markdown('<div class="section-title">🧪 시나리오 비교</div>', unsafe_allow_html=True)
+    st.caption("협상안 변형(청산배수, 주식수 등)을 저장해 한 번에 평가하고 기준안과 비교")
+    render_scenario_workspace()
+
+@st.fragment
+def render_scenario_workspace():
+    """시나리오 저장 / 변형 / 비교 (fragment: 시나리오 조작 시 이 구간만 rerun)"""
+    scenarios = st.session_state.setdefault('scenarios', {})  # 이름 → Scenario
+    
+    col_save, col_variant = st.columns(2)
+    with col_save:
+        st.markdown("#### 현재 입력 저장")
+        name = st.text_input("시나리오 이름", value=f"시나리오 {len(scenarios) + 1}", key="scn_name")
+        if st.button("💾 현재 입력을 시나리오로 저장", key="scn_save"):
+            scenarios[name] = make_scenario(
+                name,
+                st.session_state.rounds,
+                st.session_state.global_input,
+                st.session_state.fund_input,
             )
-        ]
-    )
     
-    fig.update_layout(
-        title=dict(text='지분 구조', font=dict(size=16, color='#f8fafc')),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        margin=dict(l=20, r=20, t=40, b=20),
-        annotations=[
-            dict(
-                text='지분율',
-                x=0.5,
-                y=0.5,
-                font=dict(size=13, color='#64748b'),
-                showarrow=False,
-            )
-        ],
+    with col_variant:
+        st.markdown("#### 변형 추가")
+        if not scenarios:
+            st.info("먼저 현재 입력을 시나리오로 저장하세요.")
+        else:
+            base_name = st.selectbox("원본 시나리오", list(scenarios), key="scn_base")
+            base = scenarios[base_name]
+            series = [r.name for r in base.rounds if r.active]
+            round_name = st.selectbox("라운드", series, key="scn_round")
+            
+            if round_name:
+                r = {r.name: r for r in base.rounds}[round_name]
+                prefs = [1.0, 1.5, 2.0, 2.5, 3.0]
+                vcol1, vcol2, vcol3 = st.columns(3)
+                with vcol1:
+                    liq = st.selectbox(
+                        "청산우선권", prefs,
+                        index=prefs.index(r.liquidation_pref) if r.liquidation_pref in prefs else 0,
+                        key=f"scn_lp_{base_name}_{round_name}",
+                    )
+                with vcol2:
+                    shares = st.number_input(
+                        "주식수 (주)", min_value=0.0, value=float(r.shares), step=1.0,
+                        key=f"scn_shares_{base_name}_{round_name}",
+                    )
+                with vcol3:
+                    investment = st.number_input(
+                        "투자금액 (억원)", min_value=0.0, value=float(r.investment), step=1.0,
+                        key=f"scn_inv_{base_name}_{round_name}",
+                    )
+                variant_name = st.text_input(
+                    "변형 이름", value=f"{base_name} / {round_name} {liq}x",
+                    key=f"scn_variant_{base_name}_{round_name}_{liq}",
+                )
+                if st.button("➕ 변형 추가", key="scn_add"):
+                    scenarios[variant_name] = scenario_variant(base, variant_name, {
+                        round_name: {'liquidation_pref': liq, 'shares': shares, 'investment': investment},
+                    })
+    
+    if not scenarios:
+        return
+    
+    # 일괄 평가 (입력 내용 기준 캐시 → 이미 본 변형은 재계산 없음)
+    st.markdown("---")
+    st.markdown("#### 시나리오 비교")
+    
+    ccol1, ccol2, ccol3 = st.columns([2, 2, 1])
+    with ccol1:
+        baseline = st.selectbox("비교 기준 (Baseline)", list(scenarios), key="scn_baseline")
+    with ccol2:
+        metric = st.selectbox(
+            "지표", list(SCENARIO_METRICS), format_func=SCENARIO_METRICS.get, key="scn_metric"
+        )
+    with ccol3:
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.button("🗑️ 전체 삭제", key="scn_clear"):
+            scenarios.clear()
+            st.rerun(scope="fragment")
+    
+    with span("시나리오 일괄 평가"):
+        results = evaluate_scenarios(list(scenarios.values()), store=get_result_store())
+    
+    for name, result in results.items():
+        if 'error' in result:
+            st.warning(f"{name}: {result['error']}")
+    
+    rows = compare_scenarios(results, baseline)
+    if not rows:
+        return
+    
+    df = pd.DataFrame(rows)
+    order = [name for name in scenarios if 'error' not in results[name]]
+    values = df.pivot(index='scenario', columns='series', values=metric).reindex(order)
+    diffs = df.pivot(index='scenario', columns='series', values=f'{metric}_diff').reindex(order)
+    
+    st.markdown(f"**{SCENARIO_METRICS[metric]}**")
+    st.dataframe(values.style.format("{:.2f}", na_rep="-"), width="stretch")
+    st.markdown(f"**기준({baseline}) 대비 차이**")
+    st.dataframe(
+        diffs.style.format("{:+.2f}", na_rep="-"),
+        width="stretch",
     )
-    
-    return fig
-
-
-def format_currency(value: float) -> str:
-    """통화 포맷 (억원 기준)"""
-    # 1조 이상이면 조 단위로 표시
-    if abs(value) >= 10000:
-        return f"{value/10000:,.1f}조원"
-    return f"{value:,.1f}억원"
 
-# =============================================================================
-# 메인 앱
+def render_guide_tab():
+    """사용법 탭"""
+    st.markdown('<div class="section-title">📖 사용 가이드</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+        #### 🎯 도구 개요
+        
+        이 도구는 **VC 투자의 Term Sheet 조건**을 분석하고, **Exit 시나리오별 수익 분배**를 시뮬레이션합니다.
+        
+        ---
+        
+        #### 📊 주요 개념
+        """)
+    
+    st.markdown("""
+        <div class="glass-card">
+        <h4 style="color:#6366f1;">1. RVPS (Redemption Value Per Share)</h4>
+        <div class="formula-box">RVPS = 상환가치(RV) / 전환 시 받을 주식수</div>
+        <p style="color:#94a3b8;">• RVPS가 낮을수록 먼저 전환 (전환이 유리한 시점이 빨리 옴)<br>• Conversion Order 결정의 핵심 지표</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+        <div class="glass-card">
+        <h4 style="color:#8b5cf6;">2. 전환포인트 (Conversion Point)</h4>
+        <div class="formula-box">전환 조건: 지분율 × (기업가치 - 선순위 RV) > 나의 RV</div>
+        <p style="color:#94a3b8;">• 이 조건을 만족하는 최소 기업가치<br>• 이 가치 이상이면 상환보다 전환이 유리</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+        <div class="glass-card">
+        <h4 style="color:#a855f7;">3. Partial Valuation</h4>
+        <div class="formula-box">CP 가치 = V - C(K₁) + α×C(K₂) - β×C(K₃) ...</div>
+        <p style="color:#94a3b8;">• V: 기업가치, C(K): Strike K인 콜옵션 가치<br>• Random Expiration (RE) Option 모델로 계산<br>• 각 시리즈의 실제 경제적 가치</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+        <div class="glass-card">
+        <h4 style="color:#d946ef;">4. LP/GP 분배</h4>
+        <div class="formula-box">
+        LP Cost = (약정총액 / 투자가능액) × 투자금액<br>
+        GP Carry = (수익 - 허들) × 성과보수율<br>
+        LP Valuation = Partial Valuation - GP Carry
+        </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+        ---
+        
+        #### 🔧 옵션 파라미터 기본값
+        
+        | 파라미터 | 권장값 | 출처 |
+        |---------|--------|------|
+        | 변동성 | 80~90% | Cochrane (2005) |
+        | 무위험이자율 | 3~5% | 한국 국고채 기준 |
+        | 보유기간 | Series A: 5년, B: 4년, C+: 3년 | 교재 기본값 |
+        
+        ---
+        
+        #### 📚 참고 자료
+        
+        - **원본 도구**: [vcvtools.com](http://vcvtools.com/)
+        - **교재**: Metrick & Yasuda, *Venture Capital and the Finance of Innovation*
+        - **강의**: Ch9 & 14 Preferred Stock, Ch15 Late Round Investment
+        """)
+    
+    st.markdown("""
+        <div class="glass-card" style="text-align:center;">
+            <h4 style="color:#6366f1;">🏢 인프라프론티어자산운용(주)</h4>
+            <p style="color:#94a3b8;">VC Term Sheet Analyzer v2.1</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+# =============================================================================
+# 메인 앱
 # =============================================================================
 def main():
+    setup_page()
+    
+    # 계측 (사이드바 디버그 옵션, opt-in)
+    profiling = st.session_state.get('debug_profiling', False)
+    profiler = None
+    if profiling:
+        TRACER.enable()
+        cache_before = cache_stats()
+        if st.session_state.get('debug_cprofile', False):
+            # 다른 세션이 cProfile을 사용 중이면 이번 rerun은 건너뜀 (스팬 계측은 계속)
+            profiler = start_cprofile()
+            if profiler is None:
+                st.sidebar.caption("cProfile: 다른 세션이 사용 중이라 이번 rerun은 건너뜁니다")
+    else:
+        TRACER.disable()
+    
     # 세션 상태 초기화
     if 'rounds' not in st.session_state:
         st.session_state.rounds = [
@@ -785,6 +1146,10 @@ def main():
         st.session_state.global_input = GlobalInput()
     if 'fund_input' not in st.session_state:
         st.session_state.fund_input = FundInput()
+    if 'user_id' not in st.session_state:
+        st.session_state.user_id = uuid.uuid4().hex  # 작업 풀 사용자별 한도 단위 (세션)
+    if 'depgraph' not in st.session_state:
+        st.session_state.depgraph = build_termsheet_graph(store=get_result_store())
     
     # 메인 헤더
     st.markdown("""
@@ -857,529 +1222,68 @@ def main():
         st.session_state.fund_input.hurdle_rate = st.slider(
             "허들레이트 (%)", 0.0, 15.0, float(st.session_state.fund_input.hurdle_rate), 0.5
         )
+        
+        st.markdown("---")
+        with st.expander("🐞 디버그"):
+            st.checkbox(
+                "프로파일링 패널", key="debug_profiling",
+                help="이번 rerun의 구간별 호출 횟수/누적 시간/캐시 적중을 표시",
+            )
+            st.checkbox(
+                "cProfile 덤프 (.pstats)", key="debug_cprofile",
+                disabled=not profiling,
+            )
+        debug_panel = st.container()
     
     # ==========================================================================
     # 탭 구성
     # ==========================================================================
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📝 투자조건 입력", "📊 Exit Diagram", "💼 Valuation 분석", "📖 사용법"
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "📝 투자조건 입력", "📊 Exit Diagram", "💼 Valuation 분석", "🧪 시나리오 비교", "📖 사용법"
     ])
     
     # =========================================================================
     # TAB 1: 투자조건 입력
     # =========================================================================
-    with tab1:
-        st.markdown('<div class="section-title">📝 EXIT DIAGRAM INPUTS</div>', unsafe_allow_html=True)
-        st.caption("vcvtools.com 방식의 Term Sheet 입력")
-    
-        # 라운드 활성화 체크박스
-        cols = st.columns(6)
-        for idx, r in enumerate(st.session_state.rounds):
-            with cols[idx]:
-                badge_class = r.name.lower().replace(" ", "-")
-                st.markdown(
-                    f"<span class='series-badge {badge_class}'>{r.name}</span>",
-                    unsafe_allow_html=True,
-                )
-                r.active = st.checkbox(
-                    "활성", value=r.active, key=f"active_{r.name}", label_visibility="collapsed"
-                )
-    
-        st.markdown("---")
-    
-        # 활성 / 유효 라운드
-        active_rounds = [r for r in st.session_state.rounds if r.active]
-        valid_rounds = [r for r in active_rounds if r.shares > 0]
-    
-        if active_rounds:
-            st.markdown("#### 라운드별 상세 조건")
-    
-            input_cols = st.columns(len(active_rounds))
-            for idx, r in enumerate(active_rounds):
-                with input_cols[idx]:
-                    st.markdown(f"**{r.name}**")
-    
-                    r.security_type = st.selectbox(
-                        "증권유형", ["RCPS", "CPS", "BW", "CB"],
-                        key=f"type_{r.name}",
-                        help="RCPS: 상환전환우선주, CPS: 전환우선주",
-                    )
-    
-                    r.investment = st.number_input(
-                        "투자금액 (억원)",
-                        min_value=0.0, max_value=10000.0,
-                        value=float(r.investment), step=1.0,
-                        key=f"inv_{r.name}",
-                    )
-    
-                    r.shares = st.number_input(
-                        "주식수 (주)",
-                        min_value=0.0, max_value=1_000_000_000.0,
-                        value=float(r.shares), step=1.0,
-                        key=f"shares_{r.name}",
-                    )
-    
-                    r.liquidation_pref = st.selectbox(
-                        "청산우선권",
-                        [1.0, 1.5, 2.0, 2.5, 3.0],
-                        index=(
-                            [1.0, 1.5, 2.0, 2.5, 3.0].index(r.liquidation_pref)
-                            if r.liquidation_pref in [1.0, 1.5, 2.0, 2.5, 3.0] else 0
-                        ),
-                        key=f"lp_{r.name}",
-                        help="상환 시 투자금액의 배수",
-                    )
-    
-            st.markdown("---")
-    
-            # ------------------------------
-            # 1) RVPS 및 전환순서
-            # ------------------------------
-            if valid_rounds:
-                st.markdown(
-                    '<div class="section-title">📋 전환순서 (Conversion Order)</div>',
-                    unsafe_allow_html=True,
-                )
-                st.caption("📖 강의자료: Conversion-Order Shortcut - RVPS가 낮을수록 먼저 전환")
-    
-                order = get_conversion_order(st.session_state.rounds)
-    
-                rvps_html = """
-<table class="result-table">
-<tr><th>Series</th><th>투자금액</th><th>주식수 (주)</th><th>청산배수</th><th>상환가치 (RV)</th><th>RVPS</th></tr>
-"""
-                for name, rvps in order:
-                    r = next(r for r in st.session_state.rounds if r.name == name)
-                    rvps_html += f"""
-<tr>
-    <td><span class="series-badge {name.lower().replace(' ','-')}">{name}</span></td>
-    <td>{r.investment:.1f}억</td>
-    <td>{r.shares:,.0f}</td>
-    <td>{r.liquidation_pref}x</td>
-    <td>{r.redemption_value:.1f}억</td>
-    <td><strong>{rvps:.4f}</strong></td>
-</tr>
-"""
-                rvps_html += "</table>"
-                st.markdown(rvps_html, unsafe_allow_html=True)
-    
-                order_badges = " → ".join(
-                    f"<span class='series-badge {n.lower().replace(' ','-')}'>{n}</span>"
-                    for n, _ in order
-                )
-                st.markdown(
-                    f"""
-<div class="conversion-order-box">
-    <strong>전환순서:</strong> {order_badges}
-</div>
-""",
-                    unsafe_allow_html=True,
-                )
-    
-                st.markdown(
-                    """
-<div class="info-box">
-    💡 <strong>해석:</strong> RVPS가 낮다 = 주당 상환받을 금액이 적다 = 전환해서 지분을 받는 것이 더 빨리 유리해짐
-</div>
-""",
-                    unsafe_allow_html=True,
-                )
-    
-                # ------------------------------
-                # 2) 지분 구조 & 밸류에이션 요약 (한 번만!)
-                # ------------------------------
-                st.markdown(
-                    '<div class="section-title">📊 지분 구조 & 밸류에이션 요약</div>',
-                    unsafe_allow_html=True,
-                )
-    
-                ownership = calculate_ownership(
-                    st.session_state.rounds,
-                    st.session_state.global_input.founders_shares,
-                )
-    
-                col_left, col_right = st.columns([1.1, 1.3])
-    
-                # 파이 차트
-                with col_left:
-                    fig_pie = create_ownership_pie(ownership)
-                    st.plotly_chart(
-                        fig_pie,
-                        width="stretch",  # use_container_width 대체
-                        key="ownership_pie_chart",  # 중복 방지
-                    )
-    
-                # 메트릭 + 테이블
-                with col_right:
-                    st.markdown("#### 💰 밸류에이션")
-    
-                    total_investment = sum(r.investment for r in valid_rounds)
-                    total_investor_ownership = sum(
-                        ownership.get(r.name, {}).get("ownership", 0)
-                        for r in valid_rounds
-                    )
-    
-                    if total_investor_ownership > 0:
-                        implied_post = total_investment / (total_investor_ownership / 100)
-                    else:
-                        implied_post = 0.0
-                    implied_pre = implied_post - total_investment
-    
-                    mcol1, mcol2, mcol3 = st.columns(3)
-                    with mcol1:
-                        st.markdown(
-                            f"""
-                            <div class="metric-card">
-                                <div class="metric-label">총 투자금액</div>
-                                <div class="metric-value">{total_investment:,.1f}억</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True,
-                        )
-                    with mcol2:
-                        st.markdown(
-                            f"""
-                            <div class="metric-card">
-                                <div class="metric-label">POST MONEY</div>
-                                <div class="metric-value">{implied_post:,.1f}억</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True,
-                        )
-                    with mcol3:
-                        st.markdown(
-                            f"""
-                            <div class="metric-card">
-                                <div class="metric-label">PRE MONEY</div>
-                                <div class="metric-value">{implied_pre:,.1f}억</div>
-                            </div>
-                            """,
-                            unsafe_allow_html=True,
-                        )
-    
-                # ------------------------------
-                # 3) 지분 내역 테이블
-                # ------------------------------
-                st.markdown("#### 📋 지분 내역")
-    
-                founder_info = ownership.get("창업자")
-    
-                if founder_info is None:
-                    founders_shares = st.session_state.global_input.founders_shares
-                    investor_shares_sum = sum(
-                        ownership.get(r.name, {}).get("shares", r.shares)
-                        for r in valid_rounds
-                    )
-                    total_shares = founders_shares + investor_shares_sum
-                    founder_own = (
-                        0.0 if total_shares == 0 else founders_shares / total_shares * 100
-                    )
-                    founder_info = {
-                        "shares": founders_shares,
-                        "ownership": founder_own,
-                    }
-    
-                table_data = []
-                table_data.append(
-                    {
-                        "구분": "창업자",
-                        "주식수 (주)": f"{founder_info['shares']:,.0f}",
-                        "지분율": f"{founder_info['ownership']:.2f}%",
-                        "투자금액": "-",
-                    }
-                )
-    
-                for r in valid_rounds:
-                    if r.name in ownership:
-                        row = ownership[r.name]
-                        table_data.append(
-                            {
-                                "구분": r.name,
-                                "주식수 (주)": f"{row.get('shares', r.shares):,.0f}",
-                                "지분율": f"{row.get('ownership', 0):.2f}%",
-                                "투자금액": f"{r.investment:,.1f}억",
-                            }
-                        )
-    
-                st.dataframe(
-                    pd.DataFrame(table_data),
-                    width="stretch",
-                    hide_index=True,
-                )
-    
-            else:
-                st.info("각 Series의 주식수(주)를 0보다 크게 입력하면 RVPS와 지분 구조가 계산됩니다.")
-        else:
-            st.info("👆 위에서 분석할 Series를 선택하세요.")
+    with tab1, span("Tab 1: 투자조건 입력"):
+        render_input_tab()
     
     # =========================================================================
     # TAB 2: Exit Diagram
     # =========================================================================
-    with tab2:
-        st.markdown('<div class="section-title">📊 Exit Diagram</div>', unsafe_allow_html=True)
-        st.caption("📖 강의자료: 전환 또는 상환 결정 (p.5), Exit Valuation of CP (p.6)")
-        
-        valid_rounds = [r for r in st.session_state.rounds if r.active and r.shares > 0]
-        
-        if not valid_rounds:
-            st.warning("📝 투자조건 입력 탭에서 라운드 정보를 입력하세요.")
-        else:
-            cp_data = calculate_conversion_points(
-                st.session_state.rounds,
-                st.session_state.global_input.founders_shares
-            )
-            
-            # 전환포인트 메트릭
-            st.markdown("#### 전환포인트 (Conversion Points)")
-            
-            cp_cols = st.columns(len(cp_data))
-            for idx, (name, data) in enumerate(cp_data.items()):
-                with cp_cols[idx]:
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="metric-label">{name}</div>
-                        <div class="metric-value">{data['conversion_point']:.1f}억</div>
-                        <div class="metric-sub">지분율: {data['ownership_pct']:.1f}%</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # 개별 Exit Diagram
-            st.markdown("#### Series Diagrams")
-            fig_series = create_series_diagrams(
-                st.session_state.rounds,
-                st.session_state.global_input.founders_shares
-            )
-            st.plotly_chart(fig_series, width="stretch")
-            
-            # Composite Diagram
-            st.markdown("#### Composite Diagram")
-            fig_composite = create_exit_diagram(
-                st.session_state.rounds,
-                st.session_state.global_input.founders_shares
-            )
-            st.plotly_chart(fig_composite, width="stretch")
-            
-            # 특정 Exit Value 분석
-            st.markdown("---")
-            st.markdown("#### 특정 Exit 가치에서의 분배")
-            
-            max_cp = max(d['conversion_point'] for d in cp_data.values())
-            exit_val = st.slider(
-                "Exit 가치 (억원)",
-                min_value=0.0,
-                max_value=float(max_cp * 2),
-                value=float(st.session_state.global_input.exit_valuation)
-            )
-            
-            payoffs = calculate_exit_payoffs(
-                exit_val,
-                st.session_state.rounds,
-                st.session_state.global_input.founders_shares
-            )
-            
-            # 분배 결과 테이블
-            payoff_html = """
-<table class="result-table">
-<tr><th>이해관계자</th><th>상환액</th><th>전환액</th><th>합계</th><th>비율</th></tr>
-"""
-            for party, data in payoffs.items():
-                pct = (data["합계"] / exit_val * 100) if exit_val > 0 else 0
-                payoff_html += f"""
-<tr>
-    <td><strong>{party}</strong></td>
-    <td>{data['상환']:.2f}억</td>
-    <td>{data['전환']:.2f}억</td>
-    <td><strong>{data['합계']:.2f}억</strong></td>
-    <td>{pct:.1f}%</td>
-</tr>
-"""
-            payoff_html += "</table>"
-
-            st.markdown(payoff_html, unsafe_allow_html=True)
+    with tab2, span("Tab 2: Exit Diagram"):
+        render_exit_tab()
     
     # =========================================================================
     # TAB 3: Valuation 분석
     # =========================================================================
-    with tab3:
-        st.markdown('<div class="section-title">💼 AUTO OUTPUTS - Valuation 분석</div>', unsafe_allow_html=True)
-        st.caption("📖 강의자료: Option Pricing Model, GP/LP 분배")
-        
-        valid_rounds = [r for r in st.session_state.rounds if r.active and r.shares > 0]
-        
-        if not valid_rounds:
-            st.warning("📝 투자조건 입력 탭에서 라운드 정보를 입력하세요.")
-        else:
-            # Partial Valuation 결과
-            st.markdown("#### Partial Valuation & GP/LP 분배")
-            
-            results = []
-            for r in valid_rounds:
-                partial_val = calculate_partial_valuation(
-                    r, st.session_state.rounds,
-                    st.session_state.global_input.founders_shares,
-                    st.session_state.global_input,
-                    use_re=True
-                )
-                
-                gp_lp = calculate_gp_lp_split(
-                    partial_val,
-                    st.session_state.fund_input,
-                    r.investment
-                )
-                
-                results.append({
-                    'series': r.name,
-                    'investment': r.investment,
-                    **gp_lp
-                })
-            
-            # 결과 테이블
-            result_html = """
-<table class="result-table">
-<tr><th>Series</th><th>투자금액</th><th>LP Cost</th><th>Partial Val</th><th>GP Carry</th><th>LP Valuation</th><th>LP 수익률</th></tr>
-"""
-            for res in results:
-                return_color = "#10b981" if res["lp_return_pct"] >= 0 else "#ef4444"
-                result_html += f"""
-<tr>
-    <td><span class="series-badge {res['series'].lower().replace(' ','-')}">{res['series']}</span></td>
-    <td>{res['investment']:.1f}억</td>
-    <td>{res['lp_cost']:.2f}억</td>
-    <td><strong>{res['partial_val']:.2f}억</strong></td>
-    <td>{res['gp_carry']:.2f}억</td>
-    <td><strong>{res['lp_valuation']:.2f}억</strong></td>
-    <td style="color:{return_color}"><strong>{res['lp_return_pct']:.1f}%</strong></td>
-</tr>
-"""
-            result_html += "</table>"
-
-            st.markdown(result_html, unsafe_allow_html=True)
-
-            
-            # 워터폴 차트
-            st.markdown("---")
-            st.markdown("#### GP/LP 분배 워터폴")
-            
-            selected_series = st.selectbox(
-                "Series 선택",
-                [r['series'] for r in results]
-            )
-            
-            selected_data = next(r for r in results if r['series'] == selected_series)
-            fig_waterfall = create_waterfall_chart(selected_data, selected_series)
-            st.plotly_chart(fig_waterfall, width="stretch")
-            
-            # Breakeven 계산
-            st.markdown("---")
-            st.markdown("#### Implied-post Valuation (Breakeven)")
-            
-            if st.button("🎯 Breakeven 계산", type="primary"):
-                target = valid_rounds[-1]
-                lp_cost = calculate_lp_cost(st.session_state.fund_input, target.investment)
-                
-                # Binary search
-                low, high = 10, 10000
-                for _ in range(50):
-                    mid = (low + high) / 2
-                    test_g = GlobalInput(
-                        founders_shares=st.session_state.global_input.founders_shares,
-                        current_valuation=mid,
-                        exit_valuation=mid,
-                        volatility=st.session_state.global_input.volatility,
-                        risk_free_rate=st.session_state.global_input.risk_free_rate,
-                        holding_period=st.session_state.global_input.holding_period
-                    )
-                    pv = calculate_partial_valuation(target, st.session_state.rounds,
-                                                     test_g.founders_shares, test_g)
-                    gp_lp = calculate_gp_lp_split(pv, st.session_state.fund_input, target.investment)
-                    
-                    if gp_lp['lp_valuation'] < lp_cost:
-                        low = mid
-                    else:
-                        high = mid
-                
-                st.success(f"**{target.name} Implied-post Valuation:** {mid:.2f}억원")
-                st.caption(f"이 기업가치에서 LP Cost ({lp_cost:.2f}억) = LP Valuation")
+    with tab3, span("Tab 3: Valuation 분석"):
+        render_valuation_tab()
     
     # =========================================================================
-    # TAB 4: 사용법
+    # TAB 4: 시나리오 비교
     # =========================================================================
-    with tab4:
-        st.markdown('<div class="section-title">📖 사용 가이드</div>', unsafe_allow_html=True)
-        
-        st.markdown("""
-        #### 🎯 도구 개요
-        
-        이 도구는 **VC 투자의 Term Sheet 조건**을 분석하고, **Exit 시나리오별 수익 분배**를 시뮬레이션합니다.
-        
-        ---
-        
-        #### 📊 주요 개념
-        """)
-        
-        st.markdown("""
-        <div class="glass-card">
-        <h4 style="color:#6366f1;">1. RVPS (Redemption Value Per Share)</h4>
-        <div class="formula-box">RVPS = 상환가치(RV) / 전환 시 받을 주식수</div>
-        <p style="color:#94a3b8;">• RVPS가 낮을수록 먼저 전환 (전환이 유리한 시점이 빨리 옴)<br>• Conversion Order 결정의 핵심 지표</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="glass-card">
-        <h4 style="color:#8b5cf6;">2. 전환포인트 (Conversion Point)</h4>
-        <div class="formula-box">전환 조건: 지분율 × (기업가치 - 선순위 RV) > 나의 RV</div>
-        <p style="color:#94a3b8;">• 이 조건을 만족하는 최소 기업가치<br>• 이 가치 이상이면 상환보다 전환이 유리</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="glass-card">
-        <h4 style="color:#a855f7;">3. Partial Valuation</h4>
-        <div class="formula-box">CP 가치 = V - C(K₁) + α×C(K₂) - β×C(K₃) ...</div>
-        <p style="color:#94a3b8;">• V: 기업가치, C(K): Strike K인 콜옵션 가치<br>• Random Expiration (RE) Option 모델로 계산<br>• 각 시리즈의 실제 경제적 가치</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="glass-card">
-        <h4 style="color:#d946ef;">4. LP/GP 분배</h4>
-        <div class="formula-box">
-        LP Cost = (약정총액 / 투자가능액) × 투자금액<br>
-        GP Carry = (수익 - 허들) × 성과보수율<br>
-        LP Valuation = Partial Valuation - GP Carry
-        </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        ---
-        
-        #### 🔧 옵션 파라미터 기본값
-        
-        | 파라미터 | 권장값 | 출처 |
-        |---------|--------|------|
-        | 변동성 | 80~90% | Cochrane (2005) |
-        | 무위험이자율 | 3~5% | 한국 국고채 기준 |
-        | 보유기간 | Series A: 5년, B: 4년, C+: 3년 | 교재 기본값 |
-        
-        ---
-        
-        #### 📚 참고 자료
-        
-        - **원본 도구**: [vcvtools.com](http://vcvtools.com/)
-        - **교재**: Metrick & Yasuda, *Venture Capital and the Finance of Innovation*
-        - **강의**: Ch9 & 14 Preferred Stock, Ch15 Late Round Investment
-        """)
-        
-        st.markdown("""
-        <div class="glass-card" style="text-align:center;">
-            <h4 style="color:#6366f1;">🏢 인프라프론티어자산운용(주)</h4>
-            <p style="color:#94a3b8;">VC Term Sheet Analyzer v2.1</p>
-        </div>
-        """, unsafe_allow_html=True)
+    with tab4, span("Tab 4: 시나리오 비교"):
+        render_scenario_tab()
+    
+    # =========================================================================
+    # TAB 5: 사용법
+    # =========================================================================
+    with tab5, span("Tab 5: 사용법"):
+        render_guide_tab()
+    
+    # 입력 편집이 멈추면 다음에 볼 결과(Breakeven 등)를 백그라운드에서 미리 계산
+    get_prewarmer().schedule(
+        st.session_state.user_id,
+        st.session_state.rounds,
+        st.session_state.global_input,
+        st.session_state.fund_input,
+    )
+    
+    if profiling:
+        if profiler is not None:
+            profiler.disable()
+        render_profiling_panel(debug_panel, cache_before, profiler)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,238 @@
+"""
+계산 핫패스 벤치마크 (오프라인 실행, 기준선 저장/회귀 검사)
+
+합성 Cap Table(1개 ~ 수백 개 주식 클래스)에서 각 함수의 실행시간(중앙값)과
+메모리 할당 피크(tracemalloc)를 측정한다. 캐시는 매 반복 전에 비워 계산 비용 자체를 잰다.
+
+    # 기준선 저장
+    python benchmarks/bench_valuation.py --save benchmarks/baseline.json
+    # 기준선 대비 회귀 검사 (25% 이상 느려지면 종료코드 1)
+    python benchmarks/bench_valuation.py --compare benchmarks/baseline.json --threshold 0.25
+"""
+
+from typing import Callable, Dict, List, Tuple
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from termsheet import (
+    CAP_TABLE_CACHE,
+    OPTION_CACHE,
+    CapTableArrays,
+    FundInput,
+    GlobalInput,
+    RoundInput,
+    calculate_exit_payoffs,
+    calculate_partial_valuation,
+    calculate_partial_valuations,
+    compile_cap_table,
+    exit_diagram_data,
+    re_option_call,
+    solve_breakeven,
+)
+
+CAP_TABLE_SIZES = (1, 6, 50, 200)
+STRESS_SIZES = (1000, 2000)  # --stress: 차트 제외, 배열 기반 계산만
+FOUNDERS_SHARES = 1_000_000
+
+
+def synthetic_rounds(n_classes: int, seed: int = 0, participating: bool = False) -> List[RoundInput]:
+    """재현 가능한 합성 라운드 (투자금액/주식수/청산배수 무작위, participating=True면 절반이 (상한) 참가적)"""
+    rng = random.Random(seed)
+    rounds = [
+        RoundInput(
+            name=f"Class {i + 1:03d}",
+            active=True,
+            investment=rng.uniform(1, 100),
+            shares=rng.uniform(1e4, 3e6),
+            liquidation_pref=rng.choice([1.0, 1.5, 2.0]),
+        )
+        for i in range(n_classes)
+    ]
+    if participating:
+        for r in rounds[::2]:
+            r.participating = True
+            r.participation_cap = rng.choice([0.0, 2.0, 3.0])
+    return rounds
+
+def _clear_caches() -> None:
+    OPTION_CACHE.clear()
+    CAP_TABLE_CACHE.clear()
+
+def _breakeven_bisection(rounds: List[RoundInput], g: GlobalInput, fund: FundInput) -> None:
+    """기존 UI 방식 (50회 이분법, 마지막 라운드만)"""
+    from termsheet import calculate_gp_lp_split, calculate_lp_cost
+
+    target = rounds[-1]
+    lp_cost = calculate_lp_cost(fund, target.investment)
+    low, high = 10, 10000
+    for _ in range(50):
+        mid = (low + high) / 2
+        test_g = GlobalInput(FOUNDERS_SHARES, mid, mid, g.volatility, g.risk_free_rate, g.holding_period)
+        pv = calculate_partial_valuation(target, rounds, FOUNDERS_SHARES, test_g)
+        if calculate_gp_lp_split(pv, fund, target.investment)['lp_valuation'] < lp_cost:
+            low = mid
+        else:
+            high = mid
+
+def build_cases(stress: bool = False) -> Dict[str, Callable[[], None]]:
+    """벤치마크 케이스: 이름 → 인자 없는 실행 함수 (stress=True면 대형 Cap Table 케이스 추가)"""
+    from termsheet.charts import create_exit_diagram, create_series_diagrams
+
+    g = GlobalInput(founders_shares=FOUNDERS_SHARES, current_valuation=300)
+    fund = FundInput()
+    strikes = np.linspace(1, 1000, 1000)
+
+    cases = {
+        're_option_call[x1000]': lambda: [re_option_call(300, k, 5, 0.035, 0.8) for k in strikes],
+    }
+    for n in CAP_TABLE_SIZES:
+        rounds = synthetic_rounds(n, seed=n)
+        cases.update({
+            f'calculate_exit_payoffs[n={n}]':
+                lambda rounds=rounds: calculate_exit_payoffs(500, rounds, FOUNDERS_SHARES),
+            f'exit_diagram_data[n={n}]':
+                lambda rounds=rounds: exit_diagram_data(compile_cap_table(rounds, FOUNDERS_SHARES)),
+            f'create_exit_diagram[n={n}]':
+                lambda rounds=rounds: create_exit_diagram(rounds, FOUNDERS_SHARES),
+            f'create_series_diagrams[n={n}]':
+                lambda rounds=rounds: create_series_diagrams(rounds, FOUNDERS_SHARES),
+            f'calculate_partial_valuation[n={n}]':
+                lambda rounds=rounds: [calculate_partial_valuation(r, rounds, FOUNDERS_SHARES, g) for r in rounds],
+            f'calculate_partial_valuations[n={n}]':
+                lambda rounds=rounds: calculate_partial_valuations(rounds, FOUNDERS_SHARES, g),
+            f'breakeven_bisection[n={n}]':
+                lambda rounds=rounds: _breakeven_bisection(rounds, g, fund),
+            f'solve_breakeven[n={n}]':
+                lambda rounds=rounds: solve_breakeven(rounds, FOUNDERS_SHARES, g, fund),
+        })
+
+        # 참가적/상한 참가적 우선주 (payoff 곡선 옵션 분해 경로)
+        rounds = synthetic_rounds(n, seed=n, participating=True)
+        cases.update({
+            f'exit_diagram_data[n={n},participating]':
+                lambda rounds=rounds: exit_diagram_data(compile_cap_table(rounds, FOUNDERS_SHARES)),
+            f'calculate_partial_valuations[n={n},participating]':
+                lambda rounds=rounds: calculate_partial_valuations(rounds, FOUNDERS_SHARES, g),
+            f'solve_breakeven[n={n},participating]':
+                lambda rounds=rounds: solve_breakeven(rounds, FOUNDERS_SHARES, g, fund),
+        })
+
+    for n in STRESS_SIZES if stress else ():
+        rounds = synthetic_rounds(n, seed=n)
+        arrays = CapTableArrays.from_rounds(rounds, FOUNDERS_SHARES)
+        exits = np.linspace(0, float(arrays.conversion_point.max()) * 1.5, 1000)
+        cases.update({
+            f'CapTableArrays[n={n}]':
+                lambda rounds=rounds: CapTableArrays.from_rounds(rounds, FOUNDERS_SHARES),
+            f'CapTableArrays.waterfall[n={n},x1000]':
+                lambda arrays=arrays, exits=exits: arrays.waterfall(exits),
+            f'compile_cap_table[n={n}]':
+                lambda rounds=rounds: compile_cap_table(rounds, FOUNDERS_SHARES),
+            f'calculate_partial_valuations[n={n}]':
+                lambda rounds=rounds: calculate_partial_valuations(rounds, FOUNDERS_SHARES, g),
+            f'solve_breakeven[n={n}]':
+                lambda rounds=rounds: solve_breakeven(rounds, FOUNDERS_SHARES, g, fund),
+        })
+
+        rounds = synthetic_rounds(n, seed=n, participating=True)
+        arrays = CapTableArrays.from_rounds(rounds, FOUNDERS_SHARES)
+        cases.update({
+            f'CapTableArrays.breakpoints[n={n},participating]':
+                lambda arrays=arrays: arrays.breakpoints(),
+            f'exit_diagram_data[n={n},participating]':
+                lambda rounds=rounds: exit_diagram_data(compile_cap_table(rounds, FOUNDERS_SHARES)),
+        })
+    return cases
+
+def measure(func: Callable[[], None], repeat: int) -> Tuple[float, float]:
+    """(실행시간 중앙값 초, 할당 피크 KB) - 매 반복 전 캐시 초기화"""
+    times = []
+    for _ in range(repeat):
+        _clear_caches()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    _clear_caches()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak / 1024
+
+def run(pattern: str = None, repeat: int = 5, stress: bool = False) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, func in build_cases(stress).items():
+        if pattern and pattern not in name:
+            continue
+        seconds, peak_kb = measure(func, repeat)
+        results[name] = {'time_s': seconds, 'peak_kb': peak_kb}
+        print(f"{name:<42} {seconds * 1000:>10.2f} ms {peak_kb:>12.1f} KB", flush=True)
+    return results
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """기준선 대비 threshold 비율 이상 느려졌거나 할당이 늘어난 케이스 목록"""
+    regressions = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric, unit in (('time_s', 's'), ('peak_kb', 'KB')):
+            if base[metric] > 0 and cur[metric] > base[metric] * (1 + threshold):
+                change = (cur[metric] / base[metric] - 1) * 100
+                regressions.append(
+                    f"{name}: {metric} {base[metric]:.4g}{unit} → {cur[metric]:.4g}{unit} (+{change:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Term Sheet 계산 핫패스 벤치마크')
+    parser.add_argument('--save', metavar='PATH', help='결과를 기준선 JSON으로 저장')
+    parser.add_argument('--compare', metavar='PATH', help='기준선 JSON과 비교 (회귀 시 종료코드 1)')
+    parser.add_argument('--threshold', type=float, default=0.25, help='허용 증가 비율 (기본값: 0.25 = 25%%)')
+    parser.add_argument('--repeat', type=int, default=5, help='케이스당 반복 횟수 (기본값: 5)')
+    parser.add_argument('-k', '--filter', help='이름에 이 문자열이 포함된 케이스만 실행')
+    parser.add_argument('--stress', action='store_true',
+                        help=f"대형 Cap Table({', '.join(map(str, STRESS_SIZES))}개 클래스) 케이스 추가")
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<42} {'median':>13} {'alloc peak':>15}")
+    results = run(args.filter, args.repeat, args.stress)
+
+    if args.save:
+        meta = {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+        }
+        with open(args.save, 'w', encoding='utf-8') as fh:
+            json.dump({'meta': meta, 'results': results}, fh, indent=2)
+        print(f"\n기준선 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as fh:
+            baseline = json.load(fh)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n회귀 감지 ({len(regressions)}건, 허용 +{args.threshold * 100:.0f}%):")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\n회귀 없음 (허용 +{args.threshold * 100:.0f}%)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
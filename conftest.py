@@ -0,0 +1 @@
+"""pytest 설정: 저장소 루트를 import 경로에 추가 (termsheet 패키지를 설치 없이 테스트)"""
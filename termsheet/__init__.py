@@ -0,0 +1,120 @@
+"""
+VC Term Sheet Analyzer 계산 엔진 (headless)
+
+Streamlit UI 없이 스크립트/워커/테스트에서 사용할 수 있는 계산 계층.
+import 시에는 numpy/math만 로드하며, 시각화(plotly)는 charts 모듈, 의존성 그래프와
+영구 저장소(sqlite3)는 depgraph/store 모듈(또는 DependencyGraph 등) 접근 시 지연 로드.
+
+    from termsheet import RoundInput, GlobalInput, calculate_partial_valuations
+"""
+
+import importlib
+
+from .cache import (
+    CAP_TABLE_CACHE,
+    OPTION_CACHE,
+    SHARED_CACHE,
+    LRUCache,
+    SharedCache,
+    cache_stats,
+    configure_caches,
+    estimate_size,
+    memoize,
+    rounds_snapshot,
+    snapshot,
+)
+from .captable import (
+    CapTableArrays,
+    CompiledCapTable,
+    calculate_conversion_points,
+    calculate_exit_payoffs,
+    calculate_exit_payoffs_batch,
+    calculate_ownership,
+    cap_table_arrays,
+    compile_cap_table,
+    exit_diagram_data,
+    get_conversion_order,
+)
+from .models import FundInput, GlobalInput, RoundInput
+from .pricing import (
+    RE_METHODS,
+    black_scholes_call,
+    black_scholes_call_array,
+    black_scholes_delta_array,
+    norm_cdf,
+    norm_cdf_array,
+    re_option_call,
+    re_option_call_array,
+    re_option_delta_array,
+)
+from .solver import solve_breakeven
+from .valuation import (
+    calculate_gp_lp_split,
+    calculate_gp_lp_split_array,
+    calculate_lp_cost,
+    calculate_partial_valuation,
+    calculate_partial_valuations,
+    option_legs,
+    partial_valuation_legs,
+)
+
+__all__ = [
+    'CAP_TABLE_CACHE',
+    'OPTION_CACHE',
+    'SHARED_CACHE',
+    'LRUCache',
+    'SharedCache',
+    'cache_stats',
+    'configure_caches',
+    'estimate_size',
+    'memoize',
+    'rounds_snapshot',
+    'snapshot',
+    'CapTableArrays',
+    'CompiledCapTable',
+    'calculate_conversion_points',
+    'calculate_exit_payoffs',
+    'calculate_exit_payoffs_batch',
+    'calculate_ownership',
+    'cap_table_arrays',
+    'compile_cap_table',
+    'exit_diagram_data',
+    'get_conversion_order',
+    'DependencyGraph',
+    'build_termsheet_graph',
+    'RE_METHODS',
+    'black_scholes_call',
+    'black_scholes_call_array',
+    'black_scholes_delta_array',
+    'norm_cdf',
+    'norm_cdf_array',
+    're_option_call',
+    're_option_call_array',
+    're_option_delta_array',
+    'calculate_gp_lp_split',
+    'calculate_gp_lp_split_array',
+    'calculate_lp_cost',
+    'calculate_partial_valuation',
+    'calculate_partial_valuations',
+    'option_legs',
+    'partial_valuation_legs',
+    'FundInput',
+    'GlobalInput',
+    'RoundInput',
+    'solve_breakeven',
+    'charts',
+    'depgraph',
+    'store',
+]
+
+# 무거운 의존성(plotly, sqlite3)을 쓰는 모듈은 처음 접근할 때 로드
+_LAZY_MODULES = {'charts', 'depgraph', 'store'}
+_LAZY_ATTRS = {'DependencyGraph': 'depgraph', 'build_termsheet_graph': 'depgraph'}
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _LAZY_ATTRS:
+        return getattr(importlib.import_module(f'.{_LAZY_ATTRS[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,234 @@
+"""
+Term Sheet 일괄 분석 (CLI)
+
+딜 파이프라인 전체를 CSV/JSONL에서 스트리밍으로 읽어 프로세스 풀에서 분석하고,
+결과를 JSONL로 순서대로 스트리밍 출력한다. 동시에 메모리에 올라가는 딜 수는
+workers × chunk_size × 2 이하로 제한되어 입력 파일 크기와 무관하게 일정하다.
+
+    python -m termsheet.batch deals.jsonl -o results.jsonl --workers 8 --chunk-size 64
+    # 이전 실행 결과 재사용 (SQLite 결과 저장소)
+    python -m termsheet.batch deals.jsonl -o results.jsonl --store results.sqlite
+
+입력 형식
+- JSONL: 한 줄에 딜 하나
+  {"deal_id": "D-001",
+   "rounds": [{"name": "Series A", "investment": 20, "shares": 3000000, "liquidation_pref": 1.0,
+               "participating": true, "participation_cap": 3.0}],
+   "global": {"founders_shares": 1000000, "current_valuation": 100, "exit_valuation": 500},
+   "fund": {"committed_capital": 500, "carried_interest": 20}}
+- CSV: 한 행에 라운드 하나, 같은 deal_id 행은 연속으로 배치
+  deal_id, round_name, investment, shares, liquidation_pref, security_type
+  + (선택) participating, participation_cap (참가적 우선주, 상한 배수 0이면 무제한)
+  + (선택) GlobalInput/FundInput 필드명 컬럼 (딜의 첫 행 값 사용)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Tuple
+import argparse
+import collections
+import csv
+import dataclasses
+import itertools
+import json
+import math
+import sys
+
+from .captable import calculate_conversion_points, compile_cap_table, get_conversion_order
+from .models import FundInput, GlobalInput, RoundInput
+from .solver import solve_breakeven
+from .store import ResultStore
+from .valuation import calculate_gp_lp_split, calculate_partial_valuations
+
+GLOBAL_FIELDS = [f.name for f in dataclasses.fields(GlobalInput)]
+FUND_FIELDS = [f.name for f in dataclasses.fields(FundInput)]
+ROUND_FIELDS = [f.name for f in dataclasses.fields(RoundInput)]
+
+
+# =============================================================================
+# 입력 파싱
+# =============================================================================
+def _coerce(cls, values: Dict) -> Dict:
+    """데이터클래스 필드 타입에 맞게 변환 (빈 값은 기본값 사용)"""
+    out = {}
+    for f in dataclasses.fields(cls):
+        v = values.get(f.name)
+        if v is None or v == '':
+            continue
+        if f.type in (float, 'float'):
+            v = float(v)
+        elif f.type in (bool, 'bool') and isinstance(v, str):
+            v = v.strip().lower() in ('1', 'true', 'yes', 'y')
+        out[f.name] = v
+    return out
+
+def parse_deal(record: Dict) -> Tuple[str, List[RoundInput], float, GlobalInput, FundInput]:
+    """딜 레코드 → (deal_id, rounds, founders_shares, GlobalInput, FundInput)"""
+    g_values = dict(record.get('global') or {})
+    if 'founders_shares' in record:
+        g_values['founders_shares'] = record['founders_shares']
+    g = GlobalInput(**_coerce(GlobalInput, g_values))
+    fund = FundInput(**_coerce(FundInput, record.get('fund') or {}))
+
+    rounds = []
+    for idx, r in enumerate(record.get('rounds') or []):
+        values = {'name': f'Round {idx + 1}', 'active': True, **r}
+        rounds.append(RoundInput(**_coerce(RoundInput, values)))
+
+    return str(record.get('deal_id', '')), rounds, g.founders_shares, g, fund
+
+def read_jsonl(path: str) -> Iterator[Dict]:
+    """JSONL 딜 레코드 스트리밍"""
+    with open(path, encoding='utf-8') as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+def read_csv(path: str) -> Iterator[Dict]:
+    """CSV(라운드당 한 행) → 딜 레코드 스트리밍 (연속된 deal_id 행을 묶음)"""
+    with open(path, encoding='utf-8-sig', newline='') as fh:
+        for deal_id, rows in itertools.groupby(csv.DictReader(fh), key=lambda row: row['deal_id']):
+            rows = list(rows)
+            first = rows[0]
+            yield {
+                'deal_id': deal_id,
+                'global': {k: first[k] for k in GLOBAL_FIELDS if k in first},
+                'fund': {k: first[k] for k in FUND_FIELDS if k in first},
+                'rounds': [
+                    {
+                        'name': row.get('round_name') or row.get('name'),
+                        **{k: row[k] for k in ROUND_FIELDS if k in row and k != 'name'},
+                    }
+                    for row in rows
+                ],
+            }
+
+def read_deals(path: str) -> Iterator[Dict]:
+    """확장자로 형식 판별 (.csv → CSV, 그 외 → JSONL)"""
+    return read_csv(path) if path.lower().endswith('.csv') else read_jsonl(path)
+
+
+# =============================================================================
+# 분석
+# =============================================================================
+def _finite(value):
+    """JSON 출력용: NaN/inf → None"""
+    return value if math.isfinite(value) else None
+
+def analyze_deal(record: Dict, store: ResultStore = None) -> Dict:
+    """
+    딜 하나 분석: 전환순서, 전환포인트, 예상 Exit 수령액, Partial Valuation, GP/LP, Breakeven
+    - store: 지정 시 같은 입력의 이전 결과를 재사용 (딜 ID는 키에 포함하지 않음)
+    """
+    deal_id, rounds, founders_shares, g, fund = parse_deal(record)
+    if store is None:
+        result = analyze_inputs(rounds, founders_shares, g, fund)
+    else:
+        result = store.fetch('analysis', lambda: analyze_inputs(rounds, founders_shares, g, fund),
+                             rounds, g, fund)
+    return {'deal_id': deal_id, **result}
+
+def analyze_inputs(rounds: List[RoundInput], founders_shares: float, g: GlobalInput,
+                   fund: FundInput) -> Dict:
+    """입력 객체 기준 분석 (analyze_deal / 시나리오 비교 공용, 유효한 라운드가 없으면 'error')"""
+    cp_data = calculate_conversion_points(rounds, founders_shares)
+    if not cp_data:
+        return {'error': '유효한 라운드가 없습니다 (shares > 0)'}
+
+    payoffs = compile_cap_table(rounds, founders_shares).payoffs_at(g.exit_valuation)
+    partial_vals = calculate_partial_valuations(rounds, founders_shares, g)
+    breakevens = solve_breakeven(rounds, founders_shares, g, fund)
+    by_name = {r.name: r for r in rounds}
+
+    return {
+        'conversion_order': [name for name, _ in get_conversion_order(rounds)],
+        'conversion_points': {name: _finite(d['conversion_point']) for name, d in cp_data.items()},
+        'exit_valuation': g.exit_valuation,
+        'exit_payoffs': {party: d['합계'] for party, d in payoffs.items()},
+        'partial_valuations': partial_vals,
+        'gp_lp': {
+            name: calculate_gp_lp_split(pv, fund, by_name[name].investment)
+            for name, pv in partial_vals.items()
+        },
+        'breakeven': {name: _finite(be['implied_post']) for name, be in breakevens.items()},
+    }
+
+def _analyze_chunk(records: List[Dict], store_path: str = None) -> List[Dict]:
+    """워커 단위 작업: 딜 묶음 분석 (개별 딜 오류는 결과에 기록하고 계속 진행)"""
+    store = ResultStore(store_path) if store_path else None
+    results = []
+    for record in records:
+        try:
+            results.append(analyze_deal(record, store))
+        except Exception as exc:  # 잘못된 입력 한 건이 배치 전체를 멈추지 않도록
+            results.append({'deal_id': str(record.get('deal_id', '')), 'error': f'{type(exc).__name__}: {exc}'})
+    if store is not None:
+        store.close()
+    return results
+
+def _chunks(records: Iterable[Dict], chunk_size: int) -> Iterator[List[Dict]]:
+    it = iter(records)
+    while True:
+        chunk = list(itertools.islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def run_batch(records: Iterable[Dict], workers: int = 1, chunk_size: int = 64,
+              store_path: str = None) -> Iterator[Dict]:
+    """
+    딜 레코드 스트림을 분석해 입력 순서대로 결과를 스트리밍
+    - workers ≤ 1: 현재 프로세스에서 순차 처리
+    - workers > 1: 프로세스 풀, 진행 중인 묶음은 최대 workers × 2개
+    - store_path: SQLite 결과 저장소 (워커마다 같은 파일을 열어 공유)
+    """
+    chunks = _chunks(records, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _analyze_chunk(chunk, store_path)
+        return
+
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_analyze_chunk, chunk, store_path))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m termsheet.batch',
+        description='Term Sheet 일괄 분석 (CSV/JSONL → JSONL)',
+    )
+    parser.add_argument('input', help='입력 파일 (.csv 또는 .jsonl)')
+    parser.add_argument('-o', '--output', default='-', help='출력 JSONL 파일 (기본값: 표준출력)')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='워커 프로세스 수 (기본값: 1)')
+    parser.add_argument('-c', '--chunk-size', type=int, default=64, help='워커당 한 번에 처리할 딜 수 (기본값: 64)')
+    parser.add_argument('--store', metavar='PATH', help='SQLite 결과 저장소 (같은 입력은 재계산하지 않음)')
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    n_ok = n_err = 0
+    try:
+        for result in run_batch(read_deals(args.input), args.workers, args.chunk_size, args.store):
+            out.write(json.dumps(result, ensure_ascii=False) + '\n')
+            if 'error' in result:
+                n_err += 1
+            else:
+                n_ok += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f'완료: {n_ok}건 성공, {n_err}건 오류', file=sys.stderr)
+    return 1 if n_err and not n_ok else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
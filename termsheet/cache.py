@@ -0,0 +1,312 @@
+"""
+캐시 (LRU Memoization)
+- 옵션 가격, 전환포인트, Cap Table 등 동일 입력 재계산 방지
+- 캐시 키는 입력 데이터클래스의 불변 스냅샷
+- SHARED_CACHE: 세션 간 공유 캐시 (Cap Table/Figure 등 큰 객체, 바이트 상한 + TTL)
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+import dataclasses
+import functools
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+
+class LRUCache:
+    """
+    크기 제한 LRU 캐시 (적중/실패/축출 카운터 포함, 세션 스레드 간 공유 가능)
+    - max_bytes 지정 시 항목 수와 함께 estimate_size 합계로도 제한 (큰 Cap Table 등)
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 4096, max_bytes: int = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._sizes: Dict = {}  # max_bytes 지정 시: 키 → 크기
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, self._MISSING)
+            if value is self._MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        size = estimate_size(value) if self.max_bytes is not None else 0
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes is not None:
+                if size > self.max_bytes:
+                    return
+                self._sizes[key] = size
+                self.bytes += size
+            self._data[key] = value
+            self._evict()
+
+    def resize(self, maxsize: int = None, max_bytes: int = None) -> None:
+        """최대 크기/바이트 변경 (초과분은 오래된 순으로 축출, 바이트 상한은 새로 저장되는 항목부터 측정)"""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def _remove(self, key) -> None:
+        if self._data.pop(key, self._MISSING) is not self._MISSING:
+            self.bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self) -> None:
+        while self._data and (len(self._data) > self.maxsize
+                              or (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            key, _ = self._data.popitem(last=False)
+            self.bytes -= self._sizes.pop(key, 0)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+def estimate_size(obj) -> int:
+    """객체의 대략적인 메모리 크기 (바이트, numpy 배열/컨테이너/객체 속성을 재귀적으로 합산)"""
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        if isinstance(o, np.ndarray):
+            total += o.nbytes + 112
+            continue
+        total += sys.getsizeof(o)
+        if isinstance(o, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif hasattr(o, 'to_plotly_json'):
+            stack.append(o.to_plotly_json())  # Plotly Figure: 부모 참조 대신 데이터만
+        else:
+            stack.extend(getattr(o, '__dict__', {}).values())
+            stack.extend(getattr(o, name) for name in getattr(type(o), '__slots__', ())
+                         if hasattr(o, name))
+    return total
+
+
+class SharedCache:
+    """
+    프로세스 전체가 공유하는 바이트 상한 LRU 캐시 (항목별 TTL)
+    - 같은 키를 여러 세션이 동시에 요청하면 한 번만 계산하고 나머지는 결과를 기다림
+    - 저장된 값은 여러 세션이 함께 읽으므로 수정하지 말 것
+    """
+
+    _MISSING = LRUCache._MISSING
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, ttl: float = 3600.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data = OrderedDict()  # 키 → (값, 크기, 만료 시각)
+        self._pending: Dict = {}   # 계산 중인 키 → threading.Event
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._lookup(key)
+            if value is self._MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def put(self, key, value, ttl: float = None, size: int = None) -> None:
+        """저장 (size 생략 시 estimate_size, max_bytes보다 큰 값은 저장하지 않음)"""
+        size = estimate_size(value) if size is None else size
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._data[key] = (value, size, time.monotonic() + ttl)
+            self.bytes += size
+            self._evict()
+
+    def get_or_compute(self, key, compute: Callable[[], object], ttl: float = None):
+        """조회, 없으면 compute() 결과 저장 후 반환 (다른 세션이 계산 중이면 그 결과를 기다림)"""
+        while True:
+            with self._lock:
+                value = self._lookup(key)
+                if value is not self._MISSING:
+                    self.hits += 1
+                    return value
+                event = self._pending.get(key)
+                if event is None:
+                    self.misses += 1
+                    self._pending[key] = event = threading.Event()
+                    break
+            event.wait()  # 계산 실패 시 다음 루프에서 직접 계산
+
+        try:
+            value = compute()
+            self.put(key, value, ttl)
+            return value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            event.set()
+
+    def _lookup(self, key):
+        """lock 안에서 호출: 만료된 항목은 제거하고 _MISSING 반환"""
+        entry = self._data.get(key)
+        if entry is None:
+            return self._MISSING
+        if entry[2] <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            return self._MISSING
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def _remove(self, key) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def _evict(self) -> None:
+        if self.bytes <= self.max_bytes:
+            return
+        now = time.monotonic()
+        for key in [k for k, entry in self._data.items() if entry[2] <= now]:
+            self._remove(key)
+            self.expirations += 1
+        while self.bytes > self.max_bytes:
+            _, (_, size, _) = self._data.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def configure(self, max_bytes: int = None, ttl: float = None) -> None:
+        """상한/기본 TTL 변경 (새 상한을 넘는 항목은 오래된 순으로 축출)"""
+        with self._lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if ttl is not None:
+                self.ttl = ttl
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+def memoize(cache: LRUCache, key=None):
+    """
+    함수 결과를 LRUCache에 저장하는 데코레이터
+    - key: 인자 → 해시 가능한 키 (기본값: 위치/키워드 인자 튜플)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            value = cache.get(k, LRUCache._MISSING)
+            if value is LRUCache._MISSING:
+                value = func(*args, **kwargs)
+                cache.put(k, value)
+            return value
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+def snapshot(obj) -> Tuple:
+    """데이터클래스 입력(RoundInput/GlobalInput/FundInput)의 불변 스냅샷 (필드값 튜플)"""
+    return tuple(getattr(obj, f.name) for f in dataclasses.fields(obj))
+
+def rounds_snapshot(rounds) -> Tuple:
+    """라운드 리스트의 불변 스냅샷 (캐시 키)"""
+    return tuple(snapshot(r) for r in rounds)
+
+OPTION_CACHE = LRUCache(maxsize=20_000)  # (S, K, T/H, r, sigma) → 옵션가치
+CAP_TABLE_CACHE = LRUCache(  # 라운드 스냅샷 → 전환포인트/Cap Table/Partial Valuation
+    maxsize=256,
+    max_bytes=int(float(os.environ.get('TERMSHEET_CAP_TABLE_CACHE_MB', 256)) * 1024 * 1024),
+)
+SHARED_CACHE = SharedCache(  # (노드, 입력 필드값) → 그래프 노드 값 (세션 간 공유)
+    max_bytes=int(float(os.environ.get('TERMSHEET_SHARED_CACHE_MB', 512)) * 1024 * 1024),
+    ttl=float(os.environ.get('TERMSHEET_SHARED_CACHE_TTL', 3600)),
+)
+
+def cache_stats() -> Dict[str, Dict]:
+    """캐시별 적중률 등 통계"""
+    return {'option': OPTION_CACHE.stats(), 'cap_table': CAP_TABLE_CACHE.stats(),
+            'shared': SHARED_CACHE.stats()}
+
+def configure_caches(option_maxsize: int = None, cap_table_maxsize: int = None,
+                     shared_max_bytes: int = None, shared_ttl: float = None,
+                     cap_table_max_bytes: int = None) -> None:
+    """캐시 최대 크기 설정"""
+    if option_maxsize is not None:
+        OPTION_CACHE.resize(option_maxsize)
+    if cap_table_maxsize is not None or cap_table_max_bytes is not None:
+        CAP_TABLE_CACHE.resize(cap_table_maxsize, cap_table_max_bytes)
+    if shared_max_bytes is not None or shared_ttl is not None:
+        SHARED_CACHE.configure(shared_max_bytes, shared_ttl)
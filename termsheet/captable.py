@@ -0,0 +1,539 @@
+"""
+Cap Table 계산
+- 배열 기반 Cap Table (CapTableArrays): 클래스 수와 무관하게 정렬/누적합으로 계산
+- RVPS 기반 전환순서 / 전환포인트
+- Exit 가치별 수령액 (스칼라 / 배열 / 컴파일된 구간별 선형 표현)
+- 지분 구조
+"""
+
+from typing import Dict, Iterator, List, Tuple
+import math
+
+import numpy as np
+
+from .cache import CAP_TABLE_CACHE, memoize, rounds_snapshot
+from .models import RoundInput
+from .profiling import traced
+
+# CompiledCapTable이 구간표(이해관계자 × 구간)를 만드는 최대 클래스 수 (초과 시 waterfall 직접 계산)
+COMPILE_MAX_CLASSES = 200
+# waterfall 한 번에 평가하는 (클래스 × Exit 가치) 원소 수 상한 (큰 Cap Table의 임시 배열 메모리 제한)
+WATERFALL_BLOCK_ELEMENTS = 1 << 20
+
+def get_conversion_order(rounds: List[RoundInput]) -> List[Tuple[str, float]]:
+    """
+    전환 순서 계산: [(이름, RVPS)]
+    - 전환 시 포기하는 주당 가치 낮은 순 (비참가적은 RVPS, 상한 참가적은 상한/주식수)
+    - 상한 없는 참가적 우선주는 전환하지 않으므로 맨 뒤
+    """
+    active = [r for r in rounds if r.active and r.shares > 0]
+    ordered = sorted(active, key=lambda r: r.conversion_value / r.shares)
+    return [(r.name, r.rvps) for r in ordered]
+
+
+# =============================================================================
+# 배열 기반 Cap Table (struct-of-arrays)
+# =============================================================================
+class CapTableArrays:
+    """
+    배열 기반 Cap Table: 클래스 수 제한 없음, 이름 대신 인덱스로 접근
+    - 클래스별 ndarray: shares, investment, liquidation_pref, seniority, participation
+    - participation: 0 = 비참가, inf = 상한 없는 참가, c > 0 = 총수령액 투자금액 c배 상한 참가
+    - 전환순서/전환포인트: 전환 시 포기하는 주당 가치 정렬 + 누적합 O(n log n)
+      (참가분은 상한 도달 가격 정렬 누적합, 꺾이는 점도 같은 누적합으로 계산)
+    - 상환 워터폴: seniority 높은 순(동순위는 전환순서 역순)으로 누적합 일괄 계산
+    - 참가분: 잔여가치를 창업자 + 전환 클래스 + 미전환 참가 클래스가 주당 같은 가격으로 나누되,
+      상한 참가 클래스는 상한까지만 받음 (상한 도달 순서로 정렬한 누적합으로 주당 가격 계산)
+    """
+
+    def __init__(self, names: List[str], shares, investment, liquidation_pref=None,
+                 seniority=None, participation=None, founders_shares: float = 0.0):
+        n = len(names)
+        self.names = list(names)
+        self.founders_shares = float(founders_shares)
+        self.shares = np.asarray(shares, dtype=float).reshape(n)
+        self.investment = np.asarray(investment, dtype=float).reshape(n)
+        self.liquidation_pref = np.ones(n) if liquidation_pref is None else \
+            np.asarray(liquidation_pref, dtype=float).reshape(n)
+        self.seniority = np.zeros(n) if seniority is None else np.asarray(seniority, dtype=float).reshape(n)
+        self.participation = np.zeros(n) if participation is None else \
+            np.asarray(participation, dtype=float).reshape(n)
+
+        if np.any(self.shares <= 0):
+            raise ValueError("모든 클래스의 주식수는 0보다 커야 합니다")
+        if np.any(~(self.participation >= 0)):
+            raise ValueError("participation은 0(비참가), 상한 배수(> 0) 또는 inf(무제한)이어야 합니다")
+
+        self.redemption_value = self.investment * self.liquidation_pref
+        self.rvps = self.redemption_value / self.shares
+
+        # 참가 조건: 상한 총액(청산우선권 이상)과 참가분 한도(headroom)
+        self.participating = self.participation > 0
+        self.capped = self.participating & np.isfinite(self.participation)
+        cap_total = np.where(self.capped, np.maximum(self.participation * self.investment,
+                                                     self.redemption_value), np.inf)
+        self.headroom = np.where(self.participating, cap_total - self.redemption_value, 0.0)
+        self.conversion_value = np.where(self.participating, cap_total, self.redemption_value)
+
+        # 전환순서 (전환 시 포기하는 주당 가치 오름차순, 동률은 입력 순서)
+        threshold = self.conversion_value / self.shares
+        self.order = np.argsort(threshold, kind='stable')
+        self.rank = np.empty(n, dtype=int)
+        self.rank[self.order] = np.arange(n)
+
+        # 누적합: 전환순서 앞 k개 클래스의 주식/RV/참가 headroom, 참가 클래스의 상한 도달 가격 순 주식/headroom
+        s = self.shares[self.order]
+        rv = self.redemption_value[self.order]
+        self._thresholds = threshold[self.order]
+        self._cum_shares = np.concatenate(([0.0], np.cumsum(s)))
+        self._cum_rv = np.concatenate(([0.0], np.cumsum(rv)))
+        self._cum_part_headroom = np.concatenate(
+            ([0.0], np.cumsum(np.where(self.participating[self.order], self.headroom[self.order], 0.0))))
+        part = np.flatnonzero(self.participating)
+        knots = self.headroom[part] / self.shares[part]
+        by_knot = np.argsort(knots, kind='stable')
+        self._knots = knots[by_knot]
+        self._knot_cum_shares = np.concatenate(([0.0], np.cumsum(self.shares[part][by_knot])))
+        self._knot_cum_headroom = np.concatenate(([0.0], np.cumsum(self.headroom[part][by_knot])))
+
+        # 전환포인트: 자기까지 전환했을 때 지분율, 아직 상환받는 후순위 전환 클래스의 RV 합
+        cum_shares = self.founders_shares + self._cum_shares[1:]
+        ownership = s / cum_shares
+        prior_rv = rv.sum() - self._cum_rv[1:]
+        conversion_point = self.conversion_value[self.order] / ownership + prior_rv
+        if self.participating.any():
+            # 전환 시점 주당 가격 p에서 후순위 참가 클래스의 참가분 Σ min(s·p, headroom)과 한계 지분
+            price = self._thresholds
+            with np.errstate(invalid='ignore'):  # 전환하지 않는 클래스(p = inf)는 아래에서 덮어씀
+                participation, below_cap = self._participation_sums(price, np.arange(1, n + 1))
+            conversion_point += participation
+            ownership = s / (cum_shares + below_cap)
+            never = ~np.isfinite(price)
+            conversion_point[never] = np.inf
+            # 전환하지 않는 참가 클래스: 모든 클래스가 전환한 뒤의 지분율
+            ownership[never] = s[never] / (self.founders_shares + self.shares.sum())
+        self.ownership = np.empty(n)
+        self.ownership[self.order] = ownership
+        self.conversion_point = np.empty(n)
+        self.conversion_point[self.order] = conversion_point
+
+        # 상환 우선순위 (lexsort는 마지막 키가 1순위)
+        self.redemption_order = np.lexsort((-self.rank, -self.seniority))
+
+    def _participation_sums(self, price: np.ndarray, n_converted: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        주당 가격 p에서 전환순서 앞 n_converted개 클래스가 전환했을 때
+        미전환 참가 클래스의 참가분 합계 Σ min(s·p, headroom)과 상한 미도달 주식 수
+        - 전환한 클래스는 상한 도달 가격 ≤ 전환 가격 ≤ p이므로, 상한 도달 가격 ≤ p인 headroom 합에서
+          전환순서 누적 headroom을 빼면 미전환·상한 도달 클래스의 합
+        """
+        m = np.searchsorted(self._knots, price, side='right')
+        below_cap = self._knot_cum_shares[-1] - self._knot_cum_shares[m]
+        at_cap = self._knot_cum_headroom[m] - self._cum_part_headroom[n_converted]
+        return at_cap + price * below_cap, below_cap
+
+    def exit_value_at_price(self, price) -> np.ndarray:
+        """
+        잔여가치의 주당 가격이 p가 되는 Exit 가치 V(p) (p에 대해 증가하는 구간별 선형 함수)
+        V(p) = 미전환 RV 합 + p × (창업자 + 전환 주식) + 미전환 참가분, 전환 = 전환 가격 ≤ p
+        (전환 가격에서의 V(p)가 전환포인트)
+        """
+        price = np.asarray(price, dtype=float)
+        k = np.searchsorted(self._thresholds, price, side='right')
+        participation, _ = self._participation_sums(price, k)
+        unconverted_rv = self._cum_rv[-1] - self._cum_rv[k]
+        return unconverted_rv + price * (self.founders_shares + self._cum_shares[k]) + participation
+
+    @classmethod
+    def from_rounds(cls, rounds: List[RoundInput], founders_shares: float) -> 'CapTableArrays':
+        """
+        유효한 라운드(active, shares > 0)만 입력 순서대로 배열화
+        - 주식수 0인 라운드는 보유 증권이 없으므로 상환가치도 전환포인트/워터폴에 넣지 않음
+        """
+        valid = [r for r in rounds if r.active and r.shares > 0]
+        return cls(
+            names=[r.name for r in valid],
+            shares=[r.shares for r in valid],
+            investment=[r.investment for r in valid],
+            liquidation_pref=[r.liquidation_pref for r in valid],
+            participation=[r.participation for r in valid],
+            founders_shares=founders_shares,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def conversion_data(self) -> Dict:
+        """calculate_conversion_points 형식 ({이름: {...}}, 전환순서대로)"""
+        return {
+            self.names[i]: {
+                'rvps': float(self.rvps[i]),
+                'rv': float(self.redemption_value[i]),
+                'shares': float(self.shares[i]),
+                'conversion_point': float(self.conversion_point[i]),
+                'ownership_pct': float(self.ownership[i] * 100),
+                'order': k + 1,
+                'participation': float(self.participation[i]),
+            }
+            for k, i in enumerate(self.order)
+        }
+
+    def waterfall(self, exit_values) -> Dict[str, np.ndarray]:
+        """
+        Exit 가치 배열에 대한 분배 (클래스 × N, 창업자는 별도 행)
+        반환: {'exit_values', 'redeem', 'participate', 'convert', 'founders'}
+        """
+        V = np.atleast_1d(np.asarray(exit_values, dtype=float))
+        converted = V >= self.conversion_point[:, None]
+
+        # 상환: 우선순위대로 미전환 클래스의 청구액 누적합 → 앞선 청구 이후 남은 금액만큼 지급
+        ro = self.redemption_order
+        claim = np.where(converted[ro], 0.0, self.redemption_value[ro, None])
+        paid_before = np.cumsum(claim, axis=0) - claim
+        redeem = np.empty_like(claim)
+        redeem[ro] = np.clip(V - paid_before, 0.0, claim)
+
+        # 전환: 잔여 가치를 창업자 + 전환 클래스(+ 미전환 참가 클래스)가 주당 같은 가격으로 배분
+        remaining = np.maximum(V - redeem.sum(axis=0), 0.0)
+        converted_shares = np.where(converted, self.shares[:, None], 0.0)
+        if not self.participating.any():
+            total_shares = self.founders_shares + converted_shares.sum(axis=0)
+            per_share = np.divide(remaining, total_shares, out=np.zeros_like(remaining),
+                                  where=total_shares > 0)
+            participate = np.zeros_like(redeem)
+        else:
+            sharing = self.participating[:, None] & ~converted
+            per_share = self._participating_price(remaining, converted_shares, sharing)
+            participate = np.where(sharing, np.minimum(self.shares[:, None] * per_share,
+                                                       self.headroom[:, None]), 0.0)
+
+        return {
+            'exit_values': V,
+            'redeem': redeem,
+            'participate': participate,
+            'convert': converted_shares * per_share,
+            'founders': self.founders_shares * per_share,
+        }
+
+    def _participating_price(self, remaining: np.ndarray, converted_shares: np.ndarray,
+                             sharing: np.ndarray) -> np.ndarray:
+        """
+        잔여가치 R을 나누는 주당 가격 p: W·p - Σ max(0, s_j·p - headroom_j) = R
+        (W = 창업자 + 전환 + 미전환 참가 주식, 합은 상한 참가 클래스 j에 대해)
+        상한 도달 가격 headroom_j / s_j 순으로 정렬해 누적합 → 각 Exit 가치마다 구간 하나를 찾아 선형 풀이
+        """
+        W = self.founders_shares + converted_shares.sum(axis=0) + \
+            np.where(sharing, self.shares[:, None], 0.0).sum(axis=0)
+        capped = np.flatnonzero(self.capped)
+        if len(capped) == 0:
+            return np.divide(remaining, W, out=np.zeros_like(remaining), where=W > 0)
+
+        knots = self.headroom[capped] / self.shares[capped]
+        capped = capped[np.argsort(knots, kind='stable')]
+        knots = np.sort(knots)
+        active = sharing[capped]
+        S = np.cumsum(np.where(active, self.shares[capped, None], 0.0), axis=0)
+        H = np.cumsum(np.where(active, self.headroom[capped, None], 0.0), axis=0)
+        g = knots[:, None] * (W - S) + H              # 각 상한 도달 가격에서의 배분 총액
+
+        below = (g <= remaining).sum(axis=0)          # 해보다 낮은 상한 가격 수
+        zero = np.zeros((1, len(remaining)))
+        S_below = np.take_along_axis(np.vstack([zero, S]), below[None], axis=0)[0]
+        H_below = np.take_along_axis(np.vstack([zero, H]), below[None], axis=0)[0]
+        slope = W - S_below
+        # 모두 상한에 도달하고 나눌 주식이 없으면 마지막 상한 가격에서 멈춤
+        return np.divide(remaining - H_below, slope, out=np.full_like(remaining, knots[-1]),
+                         where=slope > 0)
+
+    def waterfall_blocks(self, exit_values) -> Iterator[Tuple[slice, Dict[str, np.ndarray]]]:
+        """waterfall을 Exit 가치 묶음별로 평가 (클래스 × 묶음 ≤ WATERFALL_BLOCK_ELEMENTS): (열 slice, 결과) 반복"""
+        V = np.atleast_1d(np.asarray(exit_values, dtype=float))
+        step = max(1, WATERFALL_BLOCK_ELEMENTS // max(len(self), 1))
+        for start in range(0, len(V), step):
+            cols = slice(start, start + step)
+            yield cols, self.waterfall(V[cols])
+
+    def breakpoints(self) -> np.ndarray:
+        """
+        수령액이 꺾이는 Exit 가치 (오름차순, 0 포함, 중복 병합), 정렬 + 누적합 O(n log n)
+        - 상환 소진 지점: 모든 전환포인트 ≥ 총 RV라 상환 중에는 전환이 없으므로 상환 우선순위 누적 RV
+        - 전환포인트, 상한 참가 클래스가 상한에 도달하는 V(headroom / shares)
+        """
+        cp = self.conversion_point
+        knots = self._knots[np.isfinite(self._knots) & (self._knots > 0)]
+        points = np.concatenate((
+            [0.0],
+            np.cumsum(self.redemption_value[self.redemption_order]),
+            cp[np.isfinite(cp)],
+            self.exit_value_at_price(knots),
+        ))
+
+        # 부동소수 오차로 사실상 같은 점(예: RVPS가 같은 시리즈들의 전환포인트)은 하나로 병합
+        points = np.unique(points)
+        distinct = np.diff(points) > 1e-9 * np.maximum(points[1:], 1.0)
+        return points[np.concatenate(([True], distinct))]
+
+@memoize(CAP_TABLE_CACHE, key=lambda rounds, founders_shares:
+         ('arrays', rounds_snapshot(rounds), founders_shares))
+def cap_table_arrays(rounds: List[RoundInput], founders_shares: float) -> CapTableArrays:
+    """CapTableArrays 생성 (입력 스냅샷 기준 캐시, 결과는 읽기 전용으로 사용)"""
+    return CapTableArrays.from_rounds(rounds, founders_shares)
+
+def _parties(rounds: List[RoundInput]) -> List[str]:
+    """수령액 표의 행: 창업자 + 활성 라운드 (주식수 0인 라운드는 0으로 표시)"""
+    return ['창업자'] + [r.name for r in rounds if r.active]
+
+def _jumps(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """열(Exit 가치)별 불연속 여부: 왼쪽 극한과 오른쪽 값의 차이가 수령액 규모 대비 1e-9 초과"""
+    scale = np.maximum(np.abs(right).max(axis=0), 1.0)
+    return np.abs(left - right).max(axis=0) > 1e-9 * scale
+
+def _waterfall_by_party(arrays: CapTableArrays, parties: List[str], exit_values) -> Dict:
+    """CapTableArrays.waterfall 결과를 이해관계자 행(parties × N)으로 재배열 (묶음별 평가)"""
+    V = np.atleast_1d(np.asarray(exit_values, dtype=float))
+    index = {p: i for i, p in enumerate(parties)}
+    rows = [index[name] for name in arrays.names]
+
+    redeem = np.zeros((len(parties), len(V)))
+    participate = np.zeros((len(parties), len(V)))
+    convert = np.zeros((len(parties), len(V)))
+    for cols, w in arrays.waterfall_blocks(V):
+        redeem[rows, cols] = w['redeem']
+        participate[rows, cols] = w['participate']
+        convert[rows, cols] = w['convert']
+        convert[0, cols] = w['founders']
+
+    return {
+        'parties': parties,
+        'exit_values': V,
+        '상환': redeem,
+        '참가': participate,
+        '전환': convert,
+        '합계': redeem + participate + convert,
+    }
+
+
+# =============================================================================
+# 라운드 입력 API
+# =============================================================================
+@traced
+def calculate_conversion_points(rounds: List[RoundInput], founders_shares: float) -> Dict:
+    """각 시리즈의 전환포인트 계산 (캐시된 결과의 사본 반환)"""
+    return {name: dict(data) for name, data in _conversion_points(rounds, founders_shares).items()}
+
+@memoize(CAP_TABLE_CACHE, key=lambda rounds, founders_shares:
+         ('conversion_points', rounds_snapshot(rounds), founders_shares))
+def _conversion_points(rounds: List[RoundInput], founders_shares: float) -> Dict:
+    return cap_table_arrays(rounds, founders_shares).conversion_data()
+
+@traced
+def calculate_exit_payoffs(exit_value: float, rounds: List[RoundInput], founders_shares: float) -> Dict:
+    """특정 Exit 가치에서의 수령액 계산 (Cap Table 조회, 클래스가 많으면 waterfall 직접 계산)"""
+    return compile_cap_table(rounds, founders_shares).payoffs_at(exit_value)
+
+@traced
+def calculate_exit_payoffs_batch(exit_values, rounds: List[RoundInput], founders_shares: float) -> Dict:
+    """
+    Exit 가치 배열 전체에 대한 수령액 일괄 계산 (벡터화)
+    반환 예:
+    {
+        'parties': ['창업자', 'Series A', ...],
+        'exit_values': ndarray (N,),
+        '상환': ndarray (parties × N), '참가': ndarray, '전환': ndarray, '합계': ndarray
+    }
+    """
+    return _waterfall_by_party(cap_table_arrays(rounds, founders_shares), _parties(rounds), exit_values)
+
+class CompiledCapTable:
+    """
+    컴파일된 Cap Table: Exit 가치에 대한 구간별 선형 Payoff 표현
+    - 꺾이는 점(breakpoints): 전환포인트 + 누적 상환가치 소진 지점 + 참가 상한 도달 지점
+    - 구간 k에서 수령액 = intercept[k] + slope[k] × Exit 가치
+    - 조회는 이진탐색 O(log k), 라운드 재탐색 없음
+    - 구간표는 이해관계자 × 꺾이는 점(클래스 수의 제곱) 크기이므로, 클래스 수가 COMPILE_MAX_CLASSES를
+      넘으면(또는 compiled=False) 만들지 않고 같은 API로 waterfall을 직접 계산
+    """
+
+    COMPONENTS = ('상환', '참가', '전환', '합계')
+
+    def __init__(self, arrays: CapTableArrays, parties: List[str] = None, compiled: bool = None):
+        self.arrays = arrays
+        self.founders_shares = arrays.founders_shares
+        self.cp_data = arrays.conversion_data()
+        self.order = [(name, d['rvps']) for name, d in self.cp_data.items()]
+        self.breakpoints = arrays.breakpoints()
+        self.parties = parties or ['창업자'] + arrays.names
+        self.valid_parties = ['창업자'] + [name for name, _ in self.order]
+        self.compiled = len(arrays) <= COMPILE_MAX_CLASSES if compiled is None else compiled
+        if not self.compiled:
+            return
+
+        # 구간마다 왼쪽 끝과 중간점 두 곳에서 평가 → 기울기/절편
+        left = self.breakpoints
+        right = np.append(left[1:], left[-1] + max(left[-1], 1.0))
+        mid = (left + right) / 2
+        at_left = _waterfall_by_party(arrays, self.parties, left)
+        at_mid = _waterfall_by_party(arrays, self.parties, mid)
+
+        self.slopes = {}
+        self.intercepts = {}
+        for k in self.COMPONENTS:
+            slope = (at_mid[k] - at_left[k]) / (mid - left)
+            self.slopes[k] = slope
+            self.intercepts[k] = at_left[k] - slope * left
+
+    @traced(name='CompiledCapTable.evaluate')
+    def evaluate(self, exit_values) -> Dict:
+        """Exit 가치 배열에 대한 수령액 (calculate_exit_payoffs_batch와 같은 형식)"""
+        exit_values = np.atleast_1d(np.asarray(exit_values, dtype=float))
+        if not self.compiled:
+            return _waterfall_by_party(self.arrays, self.parties, exit_values)
+        seg = np.clip(np.searchsorted(self.breakpoints, exit_values, side='right') - 1, 0, None)
+
+        result = {'parties': self.parties, 'exit_values': exit_values}
+        for k in self.COMPONENTS:
+            result[k] = self.intercepts[k][:, seg] + self.slopes[k][:, seg] * exit_values
+        return result
+
+    def exact_curve(self, max_exit: float, component: str = '합계') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        [0, max_exit] 구간의 정확한 꺾은선 (x, 이해관계자 × 점)
+        - 점: 0, 범위 안의 breakpoint, max_exit → 시리즈당 O(클래스 수)개
+        - 불연속 지점은 x를 두 번 넣어 왼쪽 극한값과 오른쪽 값을 모두 표시
+        """
+        bp = self.breakpoints
+        inner = bp[(bp > 0) & (bp < max_exit)]
+        x = np.concatenate(([0.0], inner, [max_exit])) if max_exit > 0 else np.zeros(1)
+        is_inner = np.zeros(len(x), dtype=bool)
+        is_inner[1:1 + len(inner)] = True
+        if self.compiled:
+            intercept = self.intercepts[component]
+            slope = self.slopes[component]
+            seg = np.clip(np.searchsorted(bp, x, side='right') - 1, 0, None)
+            right = intercept[:, seg] + slope[:, seg] * x
+            # 내부 breakpoint에서 직전 구간의 왼쪽 극한과 비교
+            left = intercept[:, seg - 1] + slope[:, seg - 1] * x
+            jump = is_inner & _jumps(left, right)
+            left = left[:, jump]
+        else:
+            right, left, jump = self._direct_curve(x, is_inner, component)
+        if not jump.any():
+            return x, right
+
+        # 불연속 지점은 왼쪽 극한, 오른쪽 값 순으로 두 번
+        idx = np.repeat(np.arange(len(x)), np.where(jump, 2, 1))
+        first = np.concatenate(([True], idx[1:] != idx[:-1]))
+        values = right[:, idx]
+        values[:, first & jump[idx]] = left
+        return x[idx], values
+
+    def _direct_curve(self, x: np.ndarray, is_inner: np.ndarray,
+                      component: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        구간표 없이 exact_curve 값 계산: (오른쪽 값, 불연속 지점의 왼쪽 극한, 불연속 여부)
+        - 묶음별 waterfall, 왼쪽 극한은 한 ulp 왼쪽 값 (연속이면 차이가 반올림 오차 수준)
+        """
+        right = np.empty((len(self.parties), len(x)))
+        jump = np.zeros(len(x), dtype=bool)
+        lefts = [np.empty((len(self.parties), 0))]
+        step = max(1, WATERFALL_BLOCK_ELEMENTS // len(self.parties))
+        for start in range(0, len(x), step):
+            cols = slice(start, start + step)
+            r = _waterfall_by_party(self.arrays, self.parties, x[cols])[component]
+            l = _waterfall_by_party(self.arrays, self.parties, np.nextafter(x[cols], 0))[component]
+            right[:, cols] = r
+            jump[cols] = is_inner[cols] & _jumps(l, r)
+            lefts.append(l[:, jump[cols]])
+        return right, np.hstack(lefts), jump
+
+    def payoffs_at(self, exit_value: float) -> Dict:
+        """단일 Exit 가치의 수령액 ({이해관계자: {'상환', '참가', '전환', '합계'}})"""
+        if self.compiled:
+            seg = max(int(np.searchsorted(self.breakpoints, exit_value, side='right')) - 1, 0)
+            values = {k: self.intercepts[k][:, seg] + self.slopes[k][:, seg] * exit_value
+                      for k in self.COMPONENTS}
+        else:
+            w = self.evaluate([exit_value])
+            values = {k: w[k][:, 0] for k in self.COMPONENTS}
+        index = {p: i for i, p in enumerate(self.parties)}
+        return {
+            party: {k: float(values[k][index[party]]) for k in self.COMPONENTS}
+            for party in self.valid_parties
+        }
+
+@traced
+@memoize(CAP_TABLE_CACHE, key=lambda rounds, founders_shares:
+         ('cap_table', rounds_snapshot(rounds), founders_shares))
+def compile_cap_table(rounds: List[RoundInput], founders_shares: float) -> CompiledCapTable:
+    """CompiledCapTable 생성 (입력 스냅샷 기준 캐시, 결과는 읽기 전용으로 사용)"""
+    return CompiledCapTable(cap_table_arrays(rounds, founders_shares), _parties(rounds))
+
+@traced
+def exit_diagram_data(cap_table: CompiledCapTable, max_exit: float = None) -> Dict:
+    """
+    Series/Composite Exit Diagram 공용 데이터 (payoff 행렬을 한 번만 계산)
+    - x 범위: 유한한 최대 전환포인트 × 1.5 (없으면 1000)
+    - 균등 샘플 대신 Cap Table의 꺾이는 점 + 양 끝점만 사용 (꺾임이 정확함)
+    반환 예:
+    {
+        'parties': ['창업자', 'Series A', ...],   # 유효한 이해관계자
+        'exit_values': ndarray (N,),              # 꺾이는 점 (불연속 지점은 중복)
+        'payoffs': ndarray (parties × N),         # 합계 수령액
+        'max_exit': 750.0,
+        'conversion_points': {'Series A': 500.0, ...}   # 유한한 전환포인트만
+    }
+    """
+    cps = {
+        name: d['conversion_point'] for name, d in cap_table.cp_data.items()
+        if math.isfinite(d['conversion_point'])
+    }
+    if max_exit is None:
+        max_exit = max(cps.values(), default=0.0) * 1.5 or 1000.0
+
+    exit_values, payoffs = cap_table.exact_curve(max_exit)
+    rows = [cap_table.parties.index(p) for p in cap_table.valid_parties]
+
+    return {
+        'parties': list(cap_table.valid_parties),
+        'exit_values': exit_values,
+        'payoffs': payoffs[rows],
+        'max_exit': max_exit,
+        'conversion_points': cps,
+    }
+
+@traced
+def calculate_ownership(rounds: List[RoundInput], founders_shares: float) -> Dict:
+    """
+    투자 후 지분 구조 계산 (founders_shares와 각 라운드 shares 단위 동일: 주 기준)
+    반환 예:
+    {
+        '창업자': {'shares': 1000000, 'ownership': 25.0},
+        'Series A': {'shares': 3000000, 'ownership': 75.0, 'investment': 20},
+        'total_shares': 4000000
+    }
+    """
+    total_shares = founders_shares + sum(
+        r.shares for r in rounds if r.active and r.shares > 0
+    )
+    
+    result: Dict[str, Dict] = {}
+    if total_shares <= 0:
+        return {'total_shares': 0}
+    
+    # 창업자
+    result['창업자'] = {
+        'shares': founders_shares,
+        'ownership': founders_shares / total_shares * 100,
+    }
+    
+    # 각 시리즈
+    for r in rounds:
+        if r.active and r.shares > 0:
+            result[r.name] = {
+                'shares': r.shares,
+                'ownership': r.shares / total_shares * 100,
+                'investment': r.investment,
+            }
+    
+    result['total_shares'] = total_shares
+    return result
@@ -0,0 +1,302 @@
+"""
+시각화 함수 (Plotly)
+- termsheet 패키지 import 시에는 로드되지 않음 (필요할 때 지연 로드)
+"""
+
+from typing import Dict, List
+import math
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from .captable import CompiledCapTable, compile_cap_table, exit_diagram_data
+from .models import RoundInput
+from .profiling import traced
+
+
+# Exit Diagram 이해관계자 색상 (Composite/Series 공용)
+PARTY_COLORS = {
+    "창업자": "#10b981",
+    "Series A": "#6366f1",
+    "Series B": "#f97316",
+    "Series C": "#22c55e",
+    "Series D": "#d946ef",
+    "Series E": "#ec4899",
+    "Series F": "#6b7280",
+}
+DEFAULT_COLOR = "#64748b"
+
+# 그림 전체 점 개수가 이 값을 넘으면 WebGL(Scattergl) 트레이스 사용
+WEBGL_MIN_POINTS = 20_000
+SERIES_DIAGRAM_COLS = 4
+
+
+def _scatter_type(data: Dict):
+    """점 개수에 따라 go.Scatter / go.Scattergl 선택"""
+    return go.Scattergl if data['payoffs'].size > WEBGL_MIN_POINTS else go.Scatter
+
+def _diagram_data(rounds: List[RoundInput], founders_shares: float, max_exit: float,
+                  cap_table: CompiledCapTable, data: Dict) -> Dict:
+    if data is not None:
+        return data
+    if cap_table is None:
+        cap_table = compile_cap_table(rounds, founders_shares)
+    return exit_diagram_data(cap_table, max_exit)
+
+@traced
+def create_exit_diagram(rounds: List[RoundInput],
+                        founders_shares: float,
+                        max_exit: float = None,
+                        cap_table: CompiledCapTable = None,
+                        data: Dict = None) -> go.Figure:
+    """Exit Diagram (Composite) - data: exit_diagram_data 결과 (Series Diagram과 공유)"""
+    data = _diagram_data(rounds, founders_shares, max_exit, cap_table, data)
+
+    # 유효한 시리즈가 없으면 빈 Figure 반환
+    if len(data["parties"]) <= 1:
+        return go.Figure()
+
+    scatter = _scatter_type(data)
+    exit_vals = data["exit_values"]
+
+    # 각 이해관계자 라인 (트레이스를 한 번에 추가)
+    fig = go.Figure([
+        scatter(
+            x=exit_vals,
+            y=payoff,
+            name=p,
+            mode="lines",
+            line=dict(width=3, color=PARTY_COLORS.get(p, DEFAULT_COLOR)),
+            hovertemplate=(
+                f"<b>{p}</b><br>"
+                "Exit: %{x:.1f}억<br>"
+                "수령액: %{y:.2f}억<extra></extra>"
+            ),
+        )
+        for p, payoff in zip(data["parties"], data["payoffs"])
+    ])
+
+    # 전환포인트 수직선 및 라벨 (레이아웃에 한 번에 추가)
+    shapes = []
+    annotations = []
+    for name, cp in data["conversion_points"].items():
+        color = PARTY_COLORS.get(name, DEFAULT_COLOR)
+        shapes.append(dict(
+            type="line", x0=cp, x1=cp, y0=0, y1=1, xref="x", yref="paper",
+            line=dict(dash="dash", color=color),
+        ))
+        annotations.append(dict(
+            x=cp,
+            y=0,
+            yref="paper",
+            yanchor="bottom",
+            showarrow=False,
+            text=f"{name} CP",
+            font=dict(size=10, color=color),
+        ))
+
+    fig.update_layout(
+        title=dict(
+            text="Exit Diagram (Composite)",
+            font=dict(size=16, color="#f8fafc"),
+        ),
+        xaxis=dict(
+            title=dict(text="Exit 가치 (억원)", font=dict(color="#94a3b8")),
+            tickfont=dict(color="#64748b"),
+            gridcolor="rgba(255,255,255,0.05)",
+        ),
+        yaxis=dict(
+            title=dict(text="수령액 (억원)", font=dict(color="#94a3b8")),
+            tickfont=dict(color="#64748b"),
+            gridcolor="rgba(255,255,255,0.05)",
+        ),
+        shapes=shapes,
+        annotations=annotations,
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        legend=dict(
+            bgcolor="rgba(20,20,30,0.8)",
+            font=dict(color="#f8fafc"),
+        ),
+        hovermode="x unified",
+        height=450,
+    )
+
+    return fig
+
+
+@traced
+def create_series_diagrams(rounds: List[RoundInput], founders_shares: float, max_exit: float = None,
+                           cap_table: CompiledCapTable = None, data: Dict = None) -> go.Figure:
+    """개별 Series Exit Diagram (창업자 + 유효한 시리즈 전체, 한 줄에 4개씩)"""
+    data = _diagram_data(rounds, founders_shares, max_exit, cap_table, data)
+    parties = data['parties']
+    if len(parties) <= 1:
+        return go.Figure()
+    
+    n_cols = min(len(parties), SERIES_DIAGRAM_COLS)
+    n_rows = math.ceil(len(parties) / n_cols)
+    fig = make_subplots(rows=n_rows, cols=n_cols, subplot_titles=parties,
+                        horizontal_spacing=0.08, vertical_spacing=min(0.12, 0.6 / n_rows))
+    
+    scatter = _scatter_type(data)
+    fig.add_traces(
+        [
+            scatter(x=data['exit_values'], y=payoff, line=dict(width=2, color=PARTY_COLORS.get(party, DEFAULT_COLOR)),
+                    name=party, showlegend=False)
+            for party, payoff in zip(parties, data['payoffs'])
+        ],
+        rows=[idx // n_cols + 1 for idx in range(len(parties))],
+        cols=[idx % n_cols + 1 for idx in range(len(parties))],
+    )
+    
+    fig.update_layout(
+        height=280 * n_rows,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#f8fafc')
+    )
+    fig.update_xaxes(gridcolor='rgba(255,255,255,0.05)', title_text='Exit (억원)')
+    fig.update_yaxes(gridcolor='rgba(255,255,255,0.05)', title_text='수령액')
+    
+    return fig
+
+@traced
+def create_waterfall_chart(gp_lp_data: Dict, series_name: str) -> go.Figure:
+    """GP/LP 분배 워터폴 차트"""
+    fig = go.Figure(go.Waterfall(
+        name="분배 흐름",
+        orientation="v",
+        measure=["relative", "relative", "relative", "relative", "total"],
+        x=["투자원금", "수익", "허들 공제", "GP Carry", "LP 수령액"],
+        y=[
+            gp_lp_data['lp_cost'],
+            gp_lp_data['profit'],
+            -gp_lp_data['hurdle'] if gp_lp_data['hurdle'] > 0 else 0,
+            -gp_lp_data['gp_carry'],
+            0
+        ],
+        connector={"line": {"color": "rgba(99,102,241,0.5)"}},
+        increasing={"marker": {"color": "#10b981"}},
+        decreasing={"marker": {"color": "#ef4444"}},
+        totals={"marker": {"color": "#6366f1"}}
+    ))
+    
+    fig.update_layout(
+        title=f"{series_name} GP/LP 분배 워터폴",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#f8fafc'),
+        height=350
+    )
+    
+    return fig
+
+
+@traced
+def create_sensitivity_heatmap(grid: Dict, series_name: str, metric: str,
+                               x_param: str, y_param: str) -> go.Figure:
+    """
+    민감도 히트맵 (sensitivity_grid 결과, 축 순서는 {y_param, x_param})
+    - metric: 'partial_val', 'lp_valuation', 'lp_return_pct', 'gp_carry'
+    """
+    from .sensitivity import SENSITIVITY_PARAMS
+
+    metric_labels = {
+        'partial_val': 'Partial Val (억원)',
+        'lp_valuation': 'LP Valuation (억원)',
+        'lp_return_pct': 'LP 수익률 (%)',
+        'gp_carry': 'GP Carry (억원)',
+    }
+    z = grid[metric][grid['series'].index(series_name)]
+    
+    fig = go.Figure(go.Heatmap(
+        x=grid['axes'][x_param],
+        y=grid['axes'][y_param],
+        z=z,
+        colorscale='Viridis',
+        colorbar=dict(title=dict(text=metric_labels.get(metric, metric), font=dict(color='#94a3b8')),
+                      tickfont=dict(color='#64748b')),
+        hovertemplate=(
+            f"{SENSITIVITY_PARAMS[x_param]}: %{{x:.2f}}<br>"
+            f"{SENSITIVITY_PARAMS[y_param]}: %{{y:.2f}}<br>"
+            f"{metric_labels.get(metric, metric)}: %{{z:.2f}}<extra></extra>"
+        ),
+    ))
+    
+    fig.update_layout(
+        title=dict(text=f"{series_name} 민감도: {metric_labels.get(metric, metric)}",
+                   font=dict(size=16, color='#f8fafc')),
+        xaxis=dict(title=dict(text=SENSITIVITY_PARAMS[x_param], font=dict(color='#94a3b8')),
+                   tickfont=dict(color='#64748b')),
+        yaxis=dict(title=dict(text=SENSITIVITY_PARAMS[y_param], font=dict(color='#94a3b8')),
+                   tickfont=dict(color='#64748b')),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#f8fafc'),
+        height=420
+    )
+    
+    return fig
+
+@traced
+def create_ownership_pie(ownership: Dict) -> go.Figure:
+    """지분 구조 파이 차트 (창업자 vs 시리즈별)"""
+    labels = []
+    values = []
+    colors = []
+    
+    color_map = {
+        '창업자': '#10b981',
+        'Series A': '#6366f1',
+        'Series B': '#8b5cf6',
+        'Series C': '#a855f7',
+        'Series D': '#d946ef',
+        'Series E': '#ec4899',
+        'Series F': '#f43f5e',
+    }
+    
+    for key, data in ownership.items():
+        if key == 'total_shares':
+            continue
+        if not isinstance(data, dict):
+            continue
+        pct = data.get('ownership', 0)
+        if pct <= 0:
+            continue
+        
+        labels.append(key)
+        values.append(pct)
+        colors.append(color_map.get(key, '#64748b'))
+    
+    fig = go.Figure(
+        data=[
+            go.Pie(
+                labels=labels,
+                values=values,
+                hole=0.6,
+                marker=dict(colors=colors, line=dict(color='#0a0a0f', width=2)),
+                textinfo='label+percent',
+                textfont=dict(color='#f8fafc', size=12),
+                hovertemplate='<b>%{label}</b><br>지분율: %{percent}<br>%{value:.1f}%<extra></extra>',
+            )
+        ]
+    )
+    
+    fig.update_layout(
+        title=dict(text='지분 구조', font=dict(size=16, color='#f8fafc')),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=20, r=20, t=40, b=20),
+        annotations=[
+            dict(
+                text='지분율',
+                x=0.5,
+                y=0.5,
+                font=dict(size=13, color='#64748b'),
+                showarrow=False,
+            )
+        ],
+    )
+    
+    return fig
@@ -0,0 +1,273 @@
+"""
+입력 의존성 그래프 (증분 재계산)
+
+파생값(전환순서, Cap Table, Partial Valuation, GP/LP, Figure 등)을 노드로 등록하고,
+각 노드가 읽는 입력 필드('rounds.shares', 'global.volatility', 'fund.*' 등)와
+상위 노드를 선언한다. update()는 입력 스냅샷을 필드 단위로 비교해 바뀐 필드에
+의존하는 노드와 그 하위 노드만 무효화하고, 값은 다음 조회 시 다시 계산한다.
+shared 캐시를 주면 노드 값을 (노드, 영향 입력 필드값) 키로 세션 간에 공유한다.
+
+    graph = build_termsheet_graph()
+    graph.update(rounds, g, fund)      # 예: 관리보수만 바뀌면 'gp_lp'만 무효화
+    cap_table = graph['cap_table']
+"""
+
+from typing import Callable, Dict, Iterable, List, NamedTuple, Set, Tuple
+import dataclasses
+
+from .cache import SHARED_CACHE, SharedCache
+from .captable import (
+    calculate_ownership,
+    compile_cap_table,
+    exit_diagram_data,
+    get_conversion_order,
+)
+from .models import FundInput, GlobalInput, RoundInput
+from .store import ResultStore
+from .valuation import calculate_gp_lp_split, calculate_partial_valuations
+
+_INPUT_CLASSES = {'rounds': RoundInput, 'global': GlobalInput, 'fund': FundInput}
+
+
+class GraphInputs(NamedTuple):
+    """노드 함수에 전달되는 현재 입력"""
+    rounds: List[RoundInput]
+    global_input: GlobalInput
+    fund_input: FundInput
+
+
+def input_fields(*patterns: str) -> Tuple[str, ...]:
+    """'global.*' 같은 패턴을 필드 키 목록으로 확장 (알 수 없는 필드는 ValueError)"""
+    keys = []
+    for pattern in patterns:
+        group, _, field_name = pattern.partition('.')
+        if group not in _INPUT_CLASSES:
+            raise ValueError(f"알 수 없는 입력 그룹: {pattern}")
+        names = [f.name for f in dataclasses.fields(_INPUT_CLASSES[group])]
+        if field_name == '*':
+            keys.extend(f'{group}.{name}' for name in names)
+        elif field_name in names:
+            keys.append(pattern)
+        else:
+            raise ValueError(f"알 수 없는 입력 필드: {pattern}")
+    return tuple(keys)
+
+def _field_values(rounds: List[RoundInput], g: GlobalInput, fund: FundInput) -> Dict[str, Tuple]:
+    """입력 필드 키 → 현재 값 (라운드 필드는 전체 라운드의 값 튜플)"""
+    values = {}
+    for f in dataclasses.fields(RoundInput):
+        values[f'rounds.{f.name}'] = tuple(getattr(r, f.name) for r in rounds)
+    for group, obj in (('global', g), ('fund', fund)):
+        for f in dataclasses.fields(obj):
+            values[f'{group}.{f.name}'] = getattr(obj, f.name)
+    return values
+
+
+class DependencyGraph:
+    """입력 필드 → 파생 노드 의존성 그래프 (지연 계산 + 필드 단위 무효화)"""
+
+    _MISSING = object()
+
+    def __init__(self, shared: SharedCache = None, namespace: Tuple = ()):
+        """
+        - shared: 세션 간 공유 캐시 (같은 입력의 노드 값을 다른 그래프와 공유)
+        - namespace: 공유 키 접두어 (노드 함수 결과를 바꾸는 그래프 옵션)
+        """
+        self.shared = shared
+        self.namespace = tuple(namespace)
+        self._funcs: Dict[str, Callable] = {}
+        self._deps: Dict[str, Tuple[str, ...]] = {}
+        self._key_fields: Dict[str, Tuple[str, ...]] = {}
+        self._field_dependents: Dict[str, Set[str]] = {}
+        self._node_dependents: Dict[str, Set[str]] = {}
+        self._values: Dict[str, object] = {}
+        self._snapshot: Dict[str, Tuple] = None
+        self._inputs: GraphInputs = None
+        self.recomputes: Dict[str, int] = {}
+
+    def node(self, name: str, fields: Iterable[str] = (), deps: Iterable[str] = ()):
+        """
+        노드 등록 데코레이터: func(inputs, *상위 노드 값)
+        - fields: 직접 읽는 입력 필드 패턴
+        - deps: 상위 노드 (먼저 등록되어 있어야 하므로 순환이 생기지 않음)
+        """
+        deps = tuple(deps)
+        for dep in deps:
+            if dep not in self._funcs:
+                raise ValueError(f"'{name}'의 상위 노드 '{dep}'가 등록되어 있지 않습니다")
+
+        def decorator(func):
+            keys = input_fields(*fields)
+            self._funcs[name] = func
+            self._deps[name] = deps
+            self.recomputes[name] = 0
+            # 공유 키: 이 노드와 상위 노드 전체가 읽는 입력 필드
+            closure = set(keys).union(*(self._key_fields[dep] for dep in deps))
+            self._key_fields[name] = tuple(sorted(closure))
+            for key in keys:
+                self._field_dependents.setdefault(key, set()).add(name)
+            for dep in deps:
+                self._node_dependents.setdefault(dep, set()).add(name)
+            return func
+        return decorator
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._funcs)
+
+    def update(self, rounds: List[RoundInput], global_input: GlobalInput,
+               fund_input: FundInput) -> Set[str]:
+        """새 입력 반영: 바뀐 필드에 의존하는 노드와 하위 노드를 무효화하고 그 목록을 반환"""
+        values = _field_values(rounds, global_input, fund_input)
+        self._inputs = GraphInputs(rounds, global_input, fund_input)
+
+        if self._snapshot is None:
+            changed = set(values)
+        else:
+            changed = {key for key, v in values.items() if self._snapshot.get(key) != v}
+        self._snapshot = values
+
+        stale = set()
+        for key in changed:
+            stale |= self._field_dependents.get(key, set())
+        stale = self._downstream(stale)
+        for name in stale:
+            self._values.pop(name, None)
+        return stale
+
+    def invalidate(self, *names: str) -> None:
+        """지정 노드와 하위 노드 강제 무효화"""
+        for name in self._downstream(set(names)):
+            self._values.pop(name, None)
+
+    def _downstream(self, names: Set[str]) -> Set[str]:
+        result = set()
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name not in result:
+                result.add(name)
+                stack.extend(self._node_dependents.get(name, ()))
+        return result
+
+    def get(self, name: str):
+        """노드 값 조회 (무효화된 경우에만 상위 노드부터 다시 계산)"""
+        if self._inputs is None:
+            raise RuntimeError("update()로 입력을 먼저 설정해야 합니다")
+        value = self._values.get(name, self._MISSING)
+        if value is self._MISSING:
+            if self.shared is None:
+                value = self._compute(name)
+            else:
+                value = self.shared.get_or_compute(self.shared_key(name), lambda: self._compute(name))
+            self._values[name] = value
+        return value
+
+    def _compute(self, name: str):
+        dep_values = [self.get(dep) for dep in self._deps[name]]
+        self.recomputes[name] += 1
+        return self._funcs[name](self._inputs, *dep_values)
+
+    def shared_key(self, name: str) -> Tuple:
+        """공유 캐시 키: (namespace, 노드, 영향 입력 필드값)"""
+        return (self.namespace, name,
+                tuple(self._snapshot[key] for key in self._key_fields[name]))
+
+    __getitem__ = get
+
+    def is_valid(self, name: str) -> bool:
+        return name in self._values
+
+    def stats(self) -> Dict[str, Dict]:
+        """노드별 재계산 횟수와 현재 유효 여부"""
+        return {
+            name: {'recomputes': self.recomputes[name], 'valid': name in self._values}
+            for name in self._funcs
+        }
+
+
+# =============================================================================
+# 기본 그래프 (UI 파생값)
+# =============================================================================
+# 계산에 쓰이는 라운드 필드 (security_type은 표시용이라 제외)
+ROUND_VALUE_FIELDS = ('rounds.name', 'rounds.active', 'rounds.investment',
+                      'rounds.shares', 'rounds.liquidation_pref',
+                      'rounds.participating', 'rounds.participation_cap')
+PRICING_FIELDS = ('global.current_valuation', 'global.volatility',
+                  'global.risk_free_rate', 'global.holding_period')
+
+def build_termsheet_graph(use_re: bool = True, store: ResultStore = None,
+                          shared: SharedCache = SHARED_CACHE) -> DependencyGraph:
+    """
+    UI 파생값 그래프
+    - conversion_order / ownership / cap_table: 라운드 값 필드(+ 창업자 주식)
+    - partial_valuations: cap_table + 가격결정 필드 (변동성/금리/보유기간/현재가치)
+    - gp_lp: partial_valuations + 펀드 필드
+    - diagram_data: Series/Composite Diagram이 공유하는 payoff 행렬
+    - *_figure: 해당 상위 노드만 (변동성·펀드 변경은 Exit Diagram을 다시 만들지 않음)
+    - store: 지정 시 Partial Valuation을 영구 저장소에서 먼저 조회
+    - shared: 세션 간 공유 캐시 (None이면 그래프별로만 보관)
+    """
+    graph = DependencyGraph(shared=shared, namespace=('termsheet', use_re))
+
+    @graph.node('conversion_order', fields=ROUND_VALUE_FIELDS)
+    def _conversion_order(inputs):
+        return get_conversion_order(inputs.rounds)
+
+    @graph.node('ownership', fields=ROUND_VALUE_FIELDS + ('global.founders_shares',))
+    def _ownership(inputs):
+        return calculate_ownership(inputs.rounds, inputs.global_input.founders_shares)
+
+    @graph.node('cap_table', fields=ROUND_VALUE_FIELDS + ('global.founders_shares',))
+    def _cap_table(inputs):
+        return compile_cap_table(inputs.rounds, inputs.global_input.founders_shares)
+
+    @graph.node('conversion_points', deps=('cap_table',))
+    def _conversion_points(inputs, cap_table):
+        return cap_table.cp_data
+
+    @graph.node('partial_valuations', fields=PRICING_FIELDS, deps=('cap_table',))
+    def _partial_valuations(inputs, cap_table):
+        g = inputs.global_input
+
+        def compute():
+            return calculate_partial_valuations(inputs.rounds, g.founders_shares, g, use_re=use_re)
+
+        if store is None:
+            return compute()
+        # 저장소 키는 노드가 의존하는 필드만 (exit_valuation 등이 바뀌어도 같은 키)
+        pricing = {field.split('.', 1)[1]: getattr(g, field.split('.', 1)[1])
+                   for field in PRICING_FIELDS + ('global.founders_shares',)}
+        return store.fetch('partial_valuations', compute, inputs.rounds, pricing, use_re)
+
+    @graph.node('gp_lp', fields=('fund.*',), deps=('partial_valuations',))
+    def _gp_lp(inputs, partial_vals):
+        return [
+            {
+                'series': r.name,
+                'investment': r.investment,
+                **calculate_gp_lp_split(partial_vals.get(r.name, 0), inputs.fund_input, r.investment),
+            }
+            for r in inputs.rounds if r.active and r.shares > 0
+        ]
+
+    @graph.node('ownership_figure', deps=('ownership',))
+    def _ownership_figure(inputs, ownership):
+        from .charts import create_ownership_pie
+        return create_ownership_pie(ownership)
+
+    @graph.node('diagram_data', deps=('cap_table',))
+    def _diagram_data(inputs, cap_table):
+        return exit_diagram_data(cap_table)
+
+    @graph.node('series_figure', deps=('diagram_data',))
+    def _series_figure(inputs, data):
+        from .charts import create_series_diagrams
+        return create_series_diagrams(inputs.rounds, inputs.global_input.founders_shares, data=data)
+
+    @graph.node('exit_figure', deps=('diagram_data',))
+    def _exit_figure(inputs, data):
+        from .charts import create_exit_diagram
+        return create_exit_diagram(inputs.rounds, inputs.global_input.founders_shares, data=data)
+
+    return graph
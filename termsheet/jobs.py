@@ -0,0 +1,269 @@
+"""
+작업 서비스 (무거운 계산을 공유 프로세스 풀에서 실행)
+
+Breakeven 탐색·Monte Carlo처럼 오래 걸리는 계산을 Streamlit 스크립트 스레드 밖에서 돌린다.
+작업 하나는 독립 태스크(예: Monte Carlo 블록) 목록으로 나뉘어 풀에 제출되고, 진행률은
+완료된 태스크 비율이다. 사용자별로 동시에 풀에서 실행되는 태스크 수를 제한하므로
+한 사용자의 큰 작업이 다른 세션이 쓸 워커를 모두 차지하지 않는다.
+
+    service = JobService(max_workers=4, per_user_limit=2)
+    job_id = service.submit('session-1', breakeven_job(rounds, g, fund))
+    service.status(job_id)   # {'status': 'running', 'progress': 0.0, ...}
+    service.wait(job_id)     # 완료 후 결과 (입력이 바뀌면 service.cancel(job_id))
+"""
+
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import functools
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+
+from .models import FundInput, GlobalInput, RoundInput
+from .montecarlo import _parties, _simulate_block, simulation_blocks, summarize_blocks
+from .solver import solve_breakeven
+
+DEFAULT_WORKERS = int(os.environ.get('TERMSHEET_JOB_WORKERS', max(1, (os.cpu_count() or 2) - 1)))
+DEFAULT_USER_LIMIT = int(os.environ.get('TERMSHEET_JOB_USER_LIMIT', 2))
+
+ACTIVE_STATES = ('queued', 'running')
+
+
+class JobSpec(NamedTuple):
+    """제출할 작업: 종류, 태스크 [(함수, 인자 튜플)], 결과 결합 함수 (태스크 결과 리스트 → 결과)"""
+    kind: str
+    tasks: List[Tuple[Callable, Tuple]]
+    combine: Callable[[List], object] = None
+
+
+@dataclass
+class Job:
+    """작업 상태 (서비스 lock 안에서만 변경)"""
+    id: str
+    user: str
+    kind: str
+    key: str
+    total: int
+    combine: Callable = None
+    status: str = 'queued'
+    completed: int = 0
+    results: List = None
+    result: object = None
+    error: str = None
+    created: float = field(default_factory=time.time)
+    finished: float = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def progress(self) -> float:
+        return self.completed / self.total if self.total else 1.0
+
+    def info(self) -> Dict:
+        end = self.finished or time.time()
+        return {
+            'id': self.id,
+            'user': self.user,
+            'kind': self.kind,
+            'status': self.status,
+            'progress': self.progress,
+            'completed': self.completed,
+            'total': self.total,
+            'error': self.error,
+            'elapsed_s': end - self.created,
+        }
+
+
+class JobService:
+    """
+    공유 프로세스 풀 작업 서비스 (스레드 안전, 여러 세션이 하나의 인스턴스 공유)
+    - per_user_limit: 사용자별 동시 실행 태스크 수 (초과분은 사용자별 대기열에서 순서대로 실행)
+    - keep_finished: 결과를 보관하는 완료 작업 수 (오래된 순으로 정리)
+    - 워커는 spawn으로 시작 (Streamlit 서버의 스레드 상태를 fork로 복제하지 않음)
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, per_user_limit: int = DEFAULT_USER_LIMIT,
+                 keep_finished: int = 256, mp_context: str = 'spawn'):
+        self.max_workers = max_workers
+        self.per_user_limit = per_user_limit
+        self.keep_finished = keep_finished
+        self._mp_context = multiprocessing.get_context(mp_context)
+        self._pool = self._new_pool()
+        self._lock = threading.RLock()
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._queues: Dict[str, deque] = {}      # 사용자 → 대기 태스크 (job_id, index, fn, args)
+        self._in_flight: Dict[str, int] = {}     # 사용자 → 풀에서 실행 중인 태스크 수
+        self._futures: Dict[str, set] = {}       # job_id → 실행 중인 Future
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._mp_context)
+
+    def submit(self, user: str, spec: JobSpec, key: str = None) -> str:
+        """
+        작업 제출 → job_id
+        - key: 같은 사용자의 같은 key 작업이 진행 중이면 새로 만들지 않고 그 job_id 반환
+        """
+        with self._lock:
+            if key is not None:
+                for job in self._jobs.values():
+                    if job.user == user and job.key == key and job.status in ACTIVE_STATES:
+                        return job.id
+
+            job = Job(id=uuid.uuid4().hex, user=user, kind=spec.kind, key=key,
+                      total=len(spec.tasks), combine=spec.combine, results=[None] * len(spec.tasks))
+            self._jobs[job.id] = job
+            if not spec.tasks:
+                self._complete(job)
+            queue = self._queues.setdefault(user, deque())
+            queue.extend((job.id, index, fn, args) for index, (fn, args) in enumerate(spec.tasks))
+            self._prune()
+            self._dispatch(user)
+            return job.id
+
+    def _dispatch(self, user: str) -> None:
+        """lock 안에서 호출: 사용자 한도 안에서 대기 태스크를 풀에 제출"""
+        queue = self._queues.get(user)
+        while queue and self._in_flight.get(user, 0) < self.per_user_limit:
+            job_id, index, fn, args = queue.popleft()
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in ACTIVE_STATES:
+                continue
+            try:
+                future = self._pool.submit(fn, *args)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료된 풀은 다시 만들고 재시도
+                self._pool = self._new_pool()
+                future = self._pool.submit(fn, *args)
+            job.status = 'running'
+            self._in_flight[user] = self._in_flight.get(user, 0) + 1
+            self._futures.setdefault(job_id, set()).add(future)
+            future.add_done_callback(functools.partial(self._on_done, job_id, index, user))
+
+    def _on_done(self, job_id: str, index: int, user: str, future) -> None:
+        with self._lock:
+            self._in_flight[user] -= 1
+            self._futures.get(job_id, set()).discard(future)
+            job = self._jobs.get(job_id)
+            if job is not None and job.status == 'running' and not future.cancelled():
+                exc = future.exception()
+                if exc is not None:
+                    self._finish(job, 'error', error=f"{type(exc).__name__}: {exc}")
+                else:
+                    job.results[index] = future.result()
+                    job.completed += 1
+                    if job.completed == job.total:
+                        self._complete(job)
+            self._dispatch(user)
+
+    def _complete(self, job: Job) -> None:
+        try:
+            if job.combine is not None:
+                job.result = job.combine(job.results)
+            else:
+                job.result = job.results[0] if job.total == 1 else job.results
+        except Exception as exc:
+            self._finish(job, 'error', error=f"{type(exc).__name__}: {exc}")
+            return
+        self._finish(job, 'done')
+
+    def _finish(self, job: Job, status: str, error: str = None) -> None:
+        """lock 안에서 호출: 종료 상태 기록, 남은 태스크 정리"""
+        job.status = status
+        job.error = error
+        job.results = None
+        job.finished = time.time()
+        for future in self._futures.pop(job.id, set()):
+            future.cancel()  # 실행 중인 태스크는 끝까지 돌지만 결과는 버려짐
+        queue = self._queues.get(job.user)
+        if queue:
+            self._queues[job.user] = deque(t for t in queue if t[0] != job.id)
+        job.done.set()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.status not in ACTIVE_STATES]
+        for job_id in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[job_id]
+
+    def cancel(self, job_id: str) -> bool:
+        """작업 취소 (대기 태스크 제거, 실행 중 태스크 결과 폐기) → 취소했으면 True"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in ACTIVE_STATES:
+                return False
+            self._finish(job, 'cancelled')
+            return True
+
+    def cancel_user(self, user: str, kind: str = None) -> int:
+        """사용자의 진행 중 작업 일괄 취소 (kind 지정 시 해당 종류만) → 취소한 작업 수"""
+        with self._lock:
+            ids = [job.id for job in self._jobs.values()
+                   if job.user == user and job.status in ACTIVE_STATES
+                   and (kind is None or job.kind == kind)]
+            return sum(self.cancel(job_id) for job_id in ids)
+
+    def status(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.info() if job is not None else None
+
+    def result(self, job_id: str):
+        """완료된 작업의 결과 (미완료/실패/취소/정리된 작업은 None)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.result if job is not None and job.status == 'done' else None
+
+    def wait(self, job_id: str, timeout: float = None):
+        """작업이 끝날 때까지 대기 후 result() (스크립트/배치용, UI에서는 status()로 폴링)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        job.done.wait(timeout)
+        return self.result(job_id)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            states = {}
+            for job in self._jobs.values():
+                states[job.status] = states.get(job.status, 0) + 1
+            return {
+                'workers': self.max_workers,
+                'per_user_limit': self.per_user_limit,
+                'running_tasks': sum(self._in_flight.values()),
+                'queued_tasks': sum(len(q) for q in self._queues.values()),
+                'active_users': sum(1 for n in self._in_flight.values() if n > 0),
+                'jobs': states,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            for job_id in [j.id for j in self._jobs.values() if j.status in ACTIVE_STATES]:
+                self.cancel(job_id)
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# =============================================================================
+# 작업 정의
+# =============================================================================
+def breakeven_job(rounds: List[RoundInput], g: GlobalInput, fund: FundInput,
+                  use_re: bool = True) -> JobSpec:
+    """전체 시리즈 Breakeven 탐색 (solve_breakeven 한 번)"""
+    return JobSpec('breakeven', [(solve_breakeven, (rounds, g.founders_shares, g, fund, use_re))])
+
+def montecarlo_job(rounds: List[RoundInput], g: GlobalInput, n_paths: int = 1_000_000,
+                   block_size: int = 250_000, seed: int = None, payoff: str = 'waterfall',
+                   confidence: float = 0.95) -> JobSpec:
+    """Monte Carlo Exit 시뮬레이션 (블록 하나 = 태스크 하나, 결과는 simulate_exit_payoffs와 동일)"""
+    parties = _parties(rounds, g.founders_shares, payoff)
+    if not parties:
+        return JobSpec('montecarlo', [], lambda _: {'n_paths': 0, 'confidence': confidence, 'payoffs': {}})
+    blocks = simulation_blocks(rounds, g.founders_shares, g, n_paths, block_size, seed, payoff)
+    return JobSpec(
+        'montecarlo',
+        [(_simulate_block, args) for args in blocks],
+        functools.partial(summarize_blocks, parties, n_paths=n_paths, confidence=confidence),
+    )
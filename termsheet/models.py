@@ -0,0 +1,64 @@
+"""
+입력 데이터 클래스
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class RoundInput:
+    """투자 라운드 입력"""
+    name: str
+    active: bool = False
+    security_type: str = "RCPS"  # RCPS, CPS, BW 등
+    investment: float = 0  # 투자금액 (억원)
+    shares: float = 0  # 주식 수 (주)
+    liquidation_pref: float = 1.0  # 청산우선권 배수
+    participating: bool = False  # 참가적 우선주 (청산우선권 수령 후 잔여가치에도 참가)
+    participation_cap: float = 0.0  # 참가 상한 (투자금액 배수, 청산우선권 포함 총수령액 기준, 0 = 무제한)
+    
+    @property
+    def redemption_value(self) -> float:
+        """상환가치 = 투자금액 × 청산우선권"""
+        return self.investment * self.liquidation_pref
+    
+    @property
+    def participation(self) -> float:
+        """CapTableArrays 참가 조건 (0 = 비참가, inf = 상한 없는 참가, c = 투자금액 c배 상한)"""
+        if not self.participating:
+            return 0.0
+        return self.participation_cap if self.participation_cap > 0 else float('inf')
+    
+    @property
+    def conversion_value(self) -> float:
+        """전환 시 포기하는 가치: 비참가 = RV, 상한 참가 = 상한 총액(RV 이상), 무제한 참가 = inf (전환 안 함)"""
+        if not self.participating:
+            return self.redemption_value
+        if self.participation_cap > 0:
+            return max(self.investment * self.participation_cap, self.redemption_value)
+        return float('inf')
+    
+    @property
+    def rvps(self) -> float:
+        """주당상환가치 (RVPS) = RV / 주식수"""
+        if self.shares > 0:
+            return self.redemption_value / self.shares
+        return float('inf')
+
+@dataclass
+class FundInput:
+    """펀드 정보"""
+    committed_capital: float = 500  # 약정총액 (억원)
+    management_fee_rate: float = 2.0  # 관리보수율 (%)
+    carried_interest: float = 20  # 성과보수율 (%)
+    hurdle_rate: float = 8.0  # 허들레이트 (%)
+
+@dataclass
+class GlobalInput:
+    """글로벌 설정"""
+    founders_shares: float = 1_000_000  # 창업자 주식 (주)
+    current_valuation: float = 100  # 현재 기업가치 (억원)
+    exit_valuation: float = 500  # 예상 Exit 가치 (억원)
+    volatility: float = 80  # 변동성 (%)
+    risk_free_rate: float = 3.5  # 무위험이자율 (%)
+    holding_period: float = 5  # 예상 보유기간 (년)
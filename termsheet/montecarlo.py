@@ -0,0 +1,142 @@
+"""
+Monte Carlo Exit 시뮬레이터 (RE 옵션 모델 교차검증용)
+
+기업가치는 위험중립 GBM, Exit 시점은 지수분포(평균 = 보유기간 H)를 따른다.
+    T ~ Exp(H),  V_T = V · exp((r - σ²/2)T + σ√T·Z),  현재가치 = E[e^(-rT) · payoff(V_T)]
+경로는 블록 단위로 생성/집계하므로 1,000만 경로에서도 메모리는 block_size에 비례한다.
+블록마다 SeedSequence에서 파생한 독립 시드를 쓰므로 워커 수와 무관하게 결과가 재현된다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .captable import calculate_conversion_points, compile_cap_table
+from .models import GlobalInput, RoundInput
+from .valuation import calculate_partial_valuations, option_legs
+
+PAYOFF_MODES = ('waterfall', 'options')
+
+
+def _option_leg_payoffs(V_T: np.ndarray, legs: Dict) -> np.ndarray:
+    """Partial Valuation 옵션 분해(option_legs)의 만기 payoff (시리즈 × 경로)"""
+    total = np.zeros((len(legs['names']), len(V_T)))
+    for strike, weight in zip(legs['strikes'].T, legs['weights'].T):
+        total = total + weight[:, None] * np.maximum(V_T - strike[:, None], 0)
+    return total
+
+def _simulate_block(rounds: List[RoundInput], founders_shares: float, g: GlobalInput,
+                    payoff: str, n_paths: int,
+                    seed: np.random.SeedSequence) -> Tuple[np.ndarray, np.ndarray]:
+    """경로 블록 하나: 할인 payoff의 이해관계자별 합계와 제곱합"""
+    rng = np.random.default_rng(seed)
+    V = g.current_valuation
+    r = g.risk_free_rate / 100
+    sigma = g.volatility / 100
+
+    T = rng.exponential(g.holding_period, n_paths) if g.holding_period > 0 else np.zeros(n_paths)
+    Z = rng.standard_normal(n_paths)
+    V_T = V * np.exp((r - sigma**2 / 2) * T + sigma * np.sqrt(T) * Z)
+    discount = np.exp(-r * T)
+
+    if payoff == 'options':
+        legs = option_legs(rounds, founders_shares)
+        values = _option_leg_payoffs(V_T, legs) * discount
+    else:
+        values = compile_cap_table(rounds, founders_shares).evaluate(V_T)['합계'] * discount
+
+    return values.sum(axis=1), (values**2).sum(axis=1)
+
+def _parties(rounds: List[RoundInput], founders_shares: float, payoff: str) -> List[str]:
+    if payoff not in PAYOFF_MODES:
+        raise ValueError(f"지원하지 않는 payoff 방식: {payoff} (가능: {', '.join(PAYOFF_MODES)})")
+    if payoff == 'options':
+        return list(calculate_conversion_points(rounds, founders_shares))
+    return compile_cap_table(rounds, founders_shares).parties
+
+def simulation_blocks(rounds: List[RoundInput], founders_shares: float, g: GlobalInput,
+                      n_paths: int, block_size: int, seed: int, payoff: str) -> List[Tuple]:
+    """_simulate_block 인자 목록 (블록별 독립 시드, 프로세스 풀/작업 서비스에 그대로 제출)"""
+    sizes = [block_size] * (n_paths // block_size)
+    if n_paths % block_size:
+        sizes.append(n_paths % block_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    return [(rounds, founders_shares, g, payoff, size, s) for size, s in zip(sizes, seeds)]
+
+def summarize_blocks(parties: List[str], blocks, n_paths: int, confidence: float) -> Dict:
+    """블록별 (합계, 제곱합) → 이해관계자별 평균·표준오차·신뢰구간"""
+    total = np.zeros(len(parties))
+    total_sq = np.zeros(len(parties))
+    for s, sq in blocks:
+        total += s
+        total_sq += sq
+
+    mean = total / n_paths
+    var = np.maximum(total_sq / n_paths - mean**2, 0) * n_paths / max(n_paths - 1, 1)
+    stderr = np.sqrt(var / n_paths)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    return {
+        'n_paths': n_paths,
+        'confidence': confidence,
+        'payoffs': {
+            party: {
+                'mean': float(mean[i]),
+                'stderr': float(stderr[i]),
+                'ci_low': float(mean[i] - z * stderr[i]),
+                'ci_high': float(mean[i] + z * stderr[i]),
+            }
+            for i, party in enumerate(parties)
+        },
+    }
+
+def simulate_exit_payoffs(rounds: List[RoundInput], founders_shares: float, g: GlobalInput,
+                          n_paths: int = 1_000_000, block_size: int = 250_000,
+                          seed: int = None, workers: int = 1, payoff: str = 'waterfall',
+                          confidence: float = 0.95) -> Dict:
+    """
+    이해관계자별 할인 기대 수령액과 신뢰구간
+    - payoff='waterfall': Cap Table 분배 (창업자 + 각 시리즈)
+    - payoff='options': Partial Valuation 옵션 분해 (해석해와 직접 비교 가능)
+    - workers > 1이면 블록을 프로세스 풀에 분산
+    반환 예: {'n_paths': 1000000, 'confidence': 0.95,
+             'payoffs': {'Series A': {'mean', 'stderr', 'ci_low', 'ci_high'}}}
+    """
+    parties = _parties(rounds, founders_shares, payoff)
+    if not parties:
+        return {'n_paths': 0, 'confidence': confidence, 'payoffs': {}}
+
+    jobs = simulation_blocks(rounds, founders_shares, g, n_paths, block_size, seed, payoff)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return summarize_blocks(parties, pool.map(_simulate_block, *zip(*jobs)), n_paths, confidence)
+    return summarize_blocks(parties, (_simulate_block(*job) for job in jobs), n_paths, confidence)
+
+def cross_validate(rounds: List[RoundInput], founders_shares: float, g: GlobalInput,
+                   n_paths: int = 1_000_000, seed: int = None, workers: int = 1,
+                   confidence: float = 0.99) -> Dict[str, Dict]:
+    """
+    해석적 Partial Valuation(RE 옵션)과 Monte Carlo 비교
+    - mc_options: 같은 옵션 분해를 시뮬레이션 → 해석해가 신뢰구간 안에 있어야 정상
+    - mc_waterfall: 실제 Cap Table 분배의 기대값 (옵션 분해 근사와의 차이 참고용)
+    """
+    analytic = calculate_partial_valuations(rounds, founders_shares, g, use_re=True)
+    options = simulate_exit_payoffs(rounds, founders_shares, g, n_paths, seed=seed, workers=workers,
+                                    payoff='options', confidence=confidence)['payoffs']
+    waterfall = simulate_exit_payoffs(rounds, founders_shares, g, n_paths, seed=seed, workers=workers,
+                                      payoff='waterfall', confidence=confidence)['payoffs']
+
+    report = {}
+    for name, value in analytic.items():
+        mc = options[name]
+        report[name] = {
+            'analytic': value,
+            'mc_options': mc['mean'],
+            'stderr': mc['stderr'],
+            'z_score': (value - mc['mean']) / mc['stderr'] if mc['stderr'] > 0 else 0.0,
+            'within_ci': mc['ci_low'] <= value <= mc['ci_high'],
+            'mc_waterfall': waterfall[name]['mean'],
+        }
+    return report
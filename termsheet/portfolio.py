@@ -0,0 +1,141 @@
+"""
+포트폴리오(펀드) 단위 모델
+
+펀드는 여러 회사의 포지션을 보유하며, 회사마다 자체 라운드 구성·창업자 주식·GlobalInput을 가진다.
+포지션별 Partial Valuation은 병렬로 계산하고, LP Cost·허들·Carry·LP 수익률은 딜 단위가 아니라
+펀드 전체(투자 합계, 가치 합계) 기준으로 적용한다.
+
+    python -m termsheet.portfolio positions.jsonl --committed-capital 500 --workers 4
+
+입력 형식은 termsheet.batch와 동일하며, 레코드에 "held_series"(펀드 보유 시리즈 목록)를
+지정할 수 있다 (생략 시 유효한 시리즈 전체, 비활성/주식수 0인 시리즈는 제외).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List
+import argparse
+import json
+import sys
+
+from .batch import parse_deal, read_deals
+from .models import FundInput, GlobalInput, RoundInput
+from .valuation import calculate_gp_lp_split, calculate_lp_cost, calculate_partial_valuations
+
+
+@dataclass
+class Position:
+    """펀드 보유 포지션 (회사 하나)"""
+    company: str
+    rounds: List[RoundInput]
+    founders_shares: float
+    global_input: GlobalInput
+    held_series: List[str] = field(default_factory=list)  # 비어있으면 유효한 시리즈 전체
+
+@dataclass
+class Portfolio:
+    """펀드 포트폴리오"""
+    fund: FundInput
+    positions: List[Position] = field(default_factory=list)
+
+
+def position_from_record(record: Dict) -> Position:
+    """batch 입력 레코드 → Position"""
+    deal_id, rounds, founders_shares, g, _ = parse_deal(record)
+    return Position(
+        company=deal_id,
+        rounds=rounds,
+        founders_shares=founders_shares,
+        global_input=g,
+        held_series=list(record.get('held_series') or []),
+    )
+
+def load_portfolio(path: str, fund: FundInput) -> Portfolio:
+    """CSV/JSONL에서 포트폴리오 로드"""
+    return Portfolio(fund=fund, positions=[position_from_record(rec) for rec in read_deals(path)])
+
+def value_position(position: Position) -> Dict:
+    """포지션 하나의 보유 시리즈별 투자금액 / Partial Valuation"""
+    partial_vals = calculate_partial_valuations(
+        position.rounds, position.founders_shares, position.global_input
+    )
+    held = position.held_series or list(partial_vals)
+    by_name = {r.name: r for r in position.rounds}
+
+    # 비활성/주식수 0인 라운드는 가치가 없으므로 투자금액도 포함하지 않음 (없는 이름과 동일)
+    series = {
+        name: {'investment': by_name[name].investment, 'partial_val': partial_vals[name]}
+        for name in held if name in partial_vals
+    }
+    return {
+        'company': position.company,
+        'series': series,
+        'investment': sum(s['investment'] for s in series.values()),
+        'partial_val': sum(s['partial_val'] for s in series.values()),
+    }
+
+def value_portfolio(portfolio: Portfolio, workers: int = 1) -> Dict:
+    """
+    포지션별 가치를 병렬 계산 후 펀드 단위로 집계
+    - LP Cost: 펀드 투자 합계 기준 (관리보수 반영)
+    - 허들/Carry: 펀드 전체 수익에 한 번 적용 (딜별 Carry 합산 아님)
+    """
+    if workers > 1 and len(portfolio.positions) > 1:
+        chunksize = max(1, len(portfolio.positions) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            positions = list(pool.map(value_position, portfolio.positions, chunksize=chunksize))
+    else:
+        positions = [value_position(p) for p in portfolio.positions]
+
+    fund = portfolio.fund
+    total_investment = sum(p['investment'] for p in positions)
+    total_partial_val = sum(p['partial_val'] for p in positions)
+    fund_split = calculate_gp_lp_split(total_partial_val, fund, total_investment)
+
+    lifetime_fees = fund.committed_capital * (fund.management_fee_rate / 100) * 10
+    investable = fund.committed_capital - lifetime_fees
+
+    for p in positions:
+        p['lp_cost'] = calculate_lp_cost(fund, p['investment'])
+        p['weight_pct'] = p['partial_val'] / total_partial_val * 100 if total_partial_val > 0 else 0.0
+
+    return {
+        'positions': positions,
+        'fund': {
+            'n_positions': len(positions),
+            'total_investment': total_investment,
+            'investable_capital': investable,
+            'utilization_pct': total_investment / investable * 100 if investable > 0 else 0.0,
+            **fund_split,
+        },
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    defaults = FundInput()
+    parser = argparse.ArgumentParser(
+        prog='python -m termsheet.portfolio',
+        description='포트폴리오(펀드) 단위 가치평가 및 GP/LP 분배',
+    )
+    parser.add_argument('input', help='포지션 입력 파일 (.csv 또는 .jsonl)')
+    parser.add_argument('--committed-capital', type=float, default=defaults.committed_capital, help='약정총액 (억원)')
+    parser.add_argument('--management-fee-rate', type=float, default=defaults.management_fee_rate, help='관리보수율 (%%)')
+    parser.add_argument('--carried-interest', type=float, default=defaults.carried_interest, help='성과보수율 (%%)')
+    parser.add_argument('--hurdle-rate', type=float, default=defaults.hurdle_rate, help='허들레이트 (%%)')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='워커 프로세스 수 (기본값: 1)')
+    args = parser.parse_args(argv)
+
+    fund = FundInput(
+        committed_capital=args.committed_capital,
+        management_fee_rate=args.management_fee_rate,
+        carried_interest=args.carried_interest,
+        hurdle_rate=args.hurdle_rate,
+    )
+    result = value_portfolio(load_portfolio(args.input, fund), workers=args.workers)
+    json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
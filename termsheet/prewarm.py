@@ -0,0 +1,153 @@
+"""
+백그라운드 사전 계산 (입력 편집 후 예측 계산)
+
+입력 편집이 멈추면(delay 초 동안 새 입력 없음) 다음에 필요할 결과를 미리 계산한다.
+- Breakeven: 작업 풀에 제출, 완료되면 결과 저장소에 기록 → 버튼을 누르면 저장소에서 바로 조회
+- 그래프 노드(payoff 곡선, Figure, Partial Valuation, GP/LP): 백그라운드 스레드에서 계산해 공유 캐시에 기록
+다시 입력이 바뀌면 예약/진행 중인 예측 계산은 취소된다.
+
+    prewarmer = Prewarmer(service, store)
+    prewarmer.schedule(user_id, rounds, g, fund)   # 매 rerun 끝에 호출 (같은 입력이면 무시)
+"""
+
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Dict, List, Tuple
+import threading
+
+from .cache import SHARED_CACHE, SharedCache
+from .depgraph import build_termsheet_graph
+from .jobs import JobService, breakeven_job
+from .models import FundInput, GlobalInput, RoundInput
+from .store import ResultStore, content_hash
+
+# 미리 계산할 그래프 노드 (상위 노드는 자동으로 함께 계산)
+PREWARM_NODES = ('diagram_data', 'series_figure', 'exit_figure', 'ownership_figure', 'gp_lp')
+
+
+class _Pending:
+    """사용자 한 명의 예약/진행 중인 예측 계산"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.cancelled = threading.Event()
+        self.timer: threading.Timer = None
+        self.job_id: str = None
+        self.finished = False
+
+
+class Prewarmer:
+    """입력이 안정되면 예측 계산을 시작하고, 입력이 다시 바뀌면 취소"""
+
+    def __init__(self, service: JobService, store: ResultStore = None,
+                 shared: SharedCache = SHARED_CACHE, delay: float = 1.0,
+                 nodes: Tuple[str, ...] = PREWARM_NODES, use_re: bool = True,
+                 keep_completed: int = 1024):
+        self.service = service
+        self.store = store
+        self.shared = shared
+        self.delay = delay
+        self.nodes = tuple(nodes)
+        self.use_re = use_re
+        self.keep_completed = keep_completed
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _Pending] = {}          # 사용자 → 예약/진행 중인 계산 (끝나면 제거)
+        self._completed: 'OrderedDict[str, str]' = OrderedDict()  # 사용자 → 마지막 완료 입력 키
+        self.scheduled = 0
+        self.completed = 0
+        self.cancelled = 0
+
+    def schedule(self, user: str, rounds: List[RoundInput], g: GlobalInput, fund: FundInput) -> None:
+        """입력 스냅샷으로 예측 계산 예약 (같은 입력이 이미 예약/완료됐으면 무시)"""
+        key = content_hash('prewarm', rounds, g, fund)
+        with self._lock:
+            current = self._pending.get(user)
+            if (current.key if current is not None else self._completed.get(user)) == key:
+                return
+            if current is not None:
+                self._cancel(current)
+
+            # UI가 입력 객체를 직접 수정하므로 사본으로 계산
+            inputs = ([replace(r) for r in rounds], replace(g), replace(fund))
+            pending = _Pending(key)
+            pending.timer = threading.Timer(self.delay, self._run, args=(user, pending, *inputs))
+            pending.timer.daemon = True
+            self._pending[user] = pending
+            self.scheduled += 1
+            pending.timer.start()
+
+    def cancel(self, user: str) -> None:
+        with self._lock:
+            pending = self._pending.pop(user, None)
+            if pending is not None:
+                self._cancel(pending)
+
+    def _cancel(self, pending: _Pending) -> None:
+        """lock 안에서 호출 (호출한 쪽에서 _pending 항목 교체/제거)"""
+        if pending.cancelled.is_set() or pending.finished:
+            return
+        pending.cancelled.set()
+        pending.timer.cancel()
+        if pending.job_id is not None:
+            self.service.cancel(pending.job_id)
+        self.cancelled += 1
+
+    def _run(self, user: str, pending: _Pending, rounds: List[RoundInput],
+             g: GlobalInput, fund: FundInput) -> None:
+        completed = False
+        try:
+            completed = self._prewarm(user, pending, rounds, g, fund)
+        finally:
+            with self._lock:
+                pending.finished = True
+                if self._pending.get(user) is pending:
+                    del self._pending[user]
+                if completed:
+                    self.completed += 1
+                    self._completed[user] = pending.key
+                    self._completed.move_to_end(user)
+                    while len(self._completed) > self.keep_completed:
+                        self._completed.popitem(last=False)
+
+    def _prewarm(self, user: str, pending: _Pending, rounds: List[RoundInput],
+                 g: GlobalInput, fund: FundInput) -> bool:
+        """예측 계산 실행 → 끝까지 완료했으면 True (취소/종료 중이면 False)"""
+        if not any(r.active and r.shares > 0 for r in rounds):
+            return True  # 계산할 라운드 없음
+
+        # 1) Breakeven은 작업 풀에서 (그래프 노드 계산과 병렬)
+        be_key = content_hash('breakeven', rounds, g, fund)
+        with self._lock:
+            if pending.cancelled.is_set():
+                return False
+            if self.store is not None and self.store.get(be_key) is None:
+                try:
+                    pending.job_id = self.service.submit(
+                        user, breakeven_job(rounds, g, fund, self.use_re), key=be_key)
+                except RuntimeError:
+                    return False  # 서버 종료 중 (작업 풀 shutdown)
+
+        # 2) 그래프 노드는 이 스레드에서 → 세션 그래프와 같은 키로 공유 캐시에 기록
+        graph = build_termsheet_graph(use_re=self.use_re, store=self.store, shared=self.shared)
+        graph.update(rounds, g, fund)
+        for name in self.nodes:
+            if pending.cancelled.is_set():
+                return False
+            graph.get(name)
+
+        # 3) Breakeven 결과 저장 (취소되면 wait는 None 반환)
+        if pending.job_id is not None:
+            result = self.service.wait(pending.job_id)
+            if result is None or pending.cancelled.is_set():
+                return False
+            self.store.put(be_key, result, 'breakeven')
+        return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'scheduled': self.scheduled,
+                'completed': self.completed,
+                'cancelled': self.cancelled,
+                'pending': len(self._pending),
+            }
@@ -0,0 +1,208 @@
+"""
+옵션 가격 모델 (scipy 없이 직접 구현)
+- Black-Scholes 콜옵션 (스칼라 / 배열)
+- Random Expiration (RE) 콜옵션: 해석해 + Gauss-Laguerre 수치적분
+"""
+
+from typing import Tuple
+import functools
+import math
+
+import numpy as np
+
+from .cache import OPTION_CACHE, memoize
+from .profiling import traced
+
+
+def norm_cdf(x):
+    """표준정규분포 누적분포함수"""
+    a1, a2, a3, a4, a5 = 0.254829592, -0.284496736, 1.421413741, -1.453152027, 1.061405429
+    p = 0.3275911
+    sign = 1 if x >= 0 else -1
+    x = abs(x) / math.sqrt(2)
+    t = 1.0 / (1.0 + p * x)
+    y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * math.exp(-x * x)
+    return 0.5 * (1.0 + sign * y)
+
+@traced
+@memoize(OPTION_CACHE, key=lambda S, K, T, r, sigma: ('bs', S, K, T, r, sigma))
+def black_scholes_call(S: float, K: float, T: float, r: float, sigma: float) -> float:
+    """Black-Scholes 콜옵션 가치"""
+    if T <= 0 or sigma <= 0 or S <= 0:
+        return max(0, S - K)
+    if K <= 0:
+        return S
+    d1 = (math.log(S / K) + (r + sigma**2 / 2) * T) / (sigma * math.sqrt(T))
+    d2 = d1 - sigma * math.sqrt(T)
+    return max(0, S * norm_cdf(d1) - K * math.exp(-r * T) * norm_cdf(d2))
+
+def norm_cdf_array(x) -> np.ndarray:
+    """표준정규분포 누적분포함수 (배열 버전, norm_cdf와 동일한 근사식)"""
+    a1, a2, a3, a4, a5 = 0.254829592, -0.284496736, 1.421413741, -1.453152027, 1.061405429
+    p = 0.3275911
+    x = np.asarray(x, dtype=float)
+    sign = np.where(x >= 0, 1.0, -1.0)
+    x = np.abs(x) / math.sqrt(2)
+    t = 1.0 / (1.0 + p * x)
+    y = 1.0 - (((((a5 * t + a4) * t) + a3) * t + a2) * t + a1) * t * np.exp(-x * x)
+    return 0.5 * (1.0 + sign * y)
+
+@traced
+def black_scholes_call_array(S, K, T, r, sigma) -> np.ndarray:
+    """
+    Black-Scholes 콜옵션 가치 (배열 버전)
+    - S, K, T, r, sigma는 브로드캐스트 가능한 배열
+    - 예외 처리는 black_scholes_call과 동일 (T/sigma/S ≤ 0 → 내재가치, K ≤ 0 → S)
+    """
+    S, K, T, r, sigma = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (S, K, T, r, sigma))
+    )
+    degenerate = (T <= 0) | (sigma <= 0) | (S <= 0)
+    no_strike = ~degenerate & (K <= 0)
+    regular = ~degenerate & ~no_strike
+
+    # 예외 구간은 안전한 값으로 대체 후 계산 (경고 방지)
+    S_ = np.where(regular, S, 1.0)
+    K_ = np.where(regular, K, 1.0)
+    T_ = np.where(regular, T, 1.0)
+    sigma_ = np.where(regular, sigma, 1.0)
+
+    sqrt_T = np.sqrt(T_)
+    d1 = (np.log(S_ / K_) + (r + sigma_**2 / 2) * T_) / (sigma_ * sqrt_T)
+    d2 = d1 - sigma_ * sqrt_T
+    value = np.maximum(0, S_ * norm_cdf_array(d1) - K_ * np.exp(-r * T_) * norm_cdf_array(d2))
+
+    return np.where(degenerate, np.maximum(0, S - K), np.where(no_strike, S, value))
+
+def _re_exponents(r, sigma, H):
+    """RE 옵션 ODE의 특성근 (p > 1, q < 0) 및 청산률 λ = 1/H"""
+    lam = 1 / H
+    a = sigma**2 / 2
+    b = r - a
+    disc = np.sqrt(b**2 + 4 * a * (r + lam))
+    return (-b + disc) / (2 * a), (-b - disc) / (2 * a), lam
+
+def _re_closed_form(S, K, H, r, sigma):
+    """
+    만기 T ~ Exp(평균 H)인 콜옵션의 해석해 (정상 영역: S, K, H, sigma > 0)
+    C = E[e^(-rT)(S_T - K)+] 는 (r+λ)C = rSC' + ½σ²S²C'' + λ(S-K)+ 를 만족
+    - S <  K: C = X (S/K)^p
+    - S >= K: C = S - λK/(r+λ) + Y (S/K)^q
+    (X, Y는 S = K에서 값/기울기 연속 조건으로 결정)
+    """
+    p, q, lam = _re_exponents(r, sigma, H)
+    c = K * r / (r + lam)
+    X = (K - q * c) / (p - q)
+    Y = X - c
+    m = S / K
+    below = X * np.where(m < 1, m, 1.0) ** p
+    above = S - lam * K / (r + lam) + Y * np.where(m >= 1, m, 1.0) ** q
+    return np.where(m < 1, below, above)
+
+# Gauss-Laguerre 노드 수 상한 (약 180개부터 laggauss 가중치가 NaN)
+LAGUERRE_MAX_NODES = 150
+
+@functools.lru_cache(maxsize=None)
+def _laguerre_nodes(n_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Gauss-Laguerre 노드/가중치 (∫₀^∞ e^(-x) f(x) dx ≈ Σ wᵢ f(xᵢ))"""
+    return np.polynomial.laguerre.laggauss(n_nodes)
+
+RE_METHODS = ('closed_form', 'laguerre')
+
+def _check_re_method(method: str, n_nodes: int) -> None:
+    """RE 옵션 계산 방식과 Gauss-Laguerre 노드 수 검증"""
+    if method not in RE_METHODS:
+        raise ValueError(f"지원하지 않는 RE 옵션 계산 방식: {method} (가능: {', '.join(RE_METHODS)})")
+    if method == 'laguerre' and not 1 <= n_nodes <= LAGUERRE_MAX_NODES:
+        raise ValueError(f"n_nodes는 1 이상 {LAGUERRE_MAX_NODES} 이하여야 합니다: {n_nodes}")
+
+@traced
+def re_option_call_array(S, K, H, r, sigma, method: str = 'closed_form', n_nodes: int = 64) -> np.ndarray:
+    """
+    Random Expiration Option (배열 버전)
+    - method='closed_form': 해석해 (기본값, 행사가격당 1회 평가)
+    - method='laguerre': Gauss-Laguerre 수치적분 (n_nodes개 노드, 1 ≤ n_nodes ≤ LAGUERRE_MAX_NODES, 교차검증용)
+    - 예외 처리: H ≤ 0 → 내재가치, 그 외는 black_scholes_call과 동일
+    """
+    _check_re_method(method, n_nodes)
+
+    S, K, H, r, sigma = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (S, K, H, r, sigma))
+    )
+
+    if method == 'laguerre':
+        x, w = _laguerre_nodes(n_nodes)
+        T = H[..., None] * x
+        bs = black_scholes_call_array(S[..., None], K[..., None], T, r[..., None], sigma[..., None])
+        value = (bs * w).sum(axis=-1)
+        return np.where(H <= 0, np.maximum(0, S - K), value)
+
+    degenerate = (H <= 0) | (sigma <= 0) | (S <= 0)
+    no_strike = ~degenerate & (K <= 0)
+    regular = ~degenerate & ~no_strike
+
+    value = _re_closed_form(
+        np.where(regular, S, 1.0), np.where(regular, K, 1.0),
+        np.where(regular, H, 1.0), r, np.where(regular, sigma, 1.0),
+    )
+    return np.where(degenerate, np.maximum(0, S - K), np.where(no_strike, S, value))
+
+@traced
+@memoize(OPTION_CACHE, key=lambda S, K, H, r, sigma, method='closed_form', n_nodes=64:
+         ('re', S, K, H, r, sigma, method, n_nodes))
+def re_option_call(S: float, K: float, H: float, r: float, sigma: float,
+                   method: str = 'closed_form', n_nodes: int = 64) -> float:
+    """Random Expiration Option (VC 투자에 적합한 옵션 모델, 만기 ~ 지수분포(평균 H))"""
+    _check_re_method(method, n_nodes)
+    if H <= 0:
+        return max(0, S - K)
+    if method == 'laguerre':
+        # 배열 버전으로 한 번에 평가 (노드별 black_scholes_call 호출은 일회성 항목으로 OPTION_CACHE를 채움)
+        x, w = _laguerre_nodes(n_nodes)
+        return float((black_scholes_call_array(S, K, H * x, r, sigma) * w).sum())
+    if sigma <= 0 or S <= 0:
+        return max(0, S - K)
+    if K <= 0:
+        return S
+    return float(_re_closed_form(S, K, H, r, sigma))
+
+def black_scholes_delta_array(S, K, T, r, sigma) -> np.ndarray:
+    """Black-Scholes 콜옵션 델타 ∂C/∂S (배열 버전, 예외 처리는 black_scholes_call_array와 동일)"""
+    S, K, T, r, sigma = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (S, K, T, r, sigma))
+    )
+    degenerate = (T <= 0) | (sigma <= 0) | (S <= 0)
+    no_strike = ~degenerate & (K <= 0)
+    regular = ~degenerate & ~no_strike
+
+    S_ = np.where(regular, S, 1.0)
+    K_ = np.where(regular, K, 1.0)
+    T_ = np.where(regular, T, 1.0)
+    sigma_ = np.where(regular, sigma, 1.0)
+
+    d1 = (np.log(S_ / K_) + (r + sigma_**2 / 2) * T_) / (sigma_ * np.sqrt(T_))
+    value = norm_cdf_array(d1)
+
+    return np.where(degenerate, (S > K).astype(float), np.where(no_strike, 1.0, value))
+
+def re_option_delta_array(S, K, H, r, sigma) -> np.ndarray:
+    """Random Expiration Option 델타 ∂C/∂S (해석해 미분, 배열 버전)"""
+    S, K, H, r, sigma = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (S, K, H, r, sigma))
+    )
+    degenerate = (H <= 0) | (sigma <= 0) | (S <= 0)
+    no_strike = ~degenerate & (K <= 0)
+    regular = ~degenerate & ~no_strike
+
+    S_ = np.where(regular, S, 1.0)
+    K_ = np.where(regular, K, 1.0)
+    p, q, lam = _re_exponents(r, np.where(regular, sigma, 1.0), np.where(regular, H, 1.0))
+    c = K_ * r / (r + lam)
+    X = (K_ - q * c) / (p - q)
+    Y = X - c
+    m = S_ / K_
+    below = X * p * np.where(m < 1, m, 1.0) ** p / S_
+    above = 1 + Y * q * np.where(m >= 1, m, 1.0) ** q / S_
+    value = np.where(m < 1, below, above)
+
+    return np.where(degenerate, (S > K).astype(float), np.where(no_strike, 1.0, value))
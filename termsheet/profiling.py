@@ -0,0 +1,115 @@
+"""
+계측 (opt-in 타이밍 스팬)
+
+핵심 함수는 @traced, UI 구간은 `with span(...)`으로 감싸 호출 횟수와 누적 시간을 모은다.
+기록은 스레드별로 분리되어 Streamlit 세션(스크립트 스레드)끼리 섞이지 않으며,
+비활성 상태에서는 플래그 확인 한 번만 하고 원래 함수를 호출한다.
+cProfile은 start_cprofile()로 시작한다 (다른 세션이 이미 사용 중이면 건너뜀).
+"""
+
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+import cProfile
+import functools
+import threading
+import time
+
+
+class Tracer:
+    """스레드별 스팬 집계기"""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(self._local, 'enabled', False)
+
+    def enable(self) -> None:
+        self._local.enabled = True
+        self.reset()
+
+    def disable(self) -> None:
+        self._local.enabled = False
+
+    def reset(self) -> None:
+        self._local.stats = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        stats = getattr(self._local, 'stats', None)
+        if stats is None:
+            self._local.stats = stats = {}
+        entry = stats.get(name)
+        if entry is None:
+            stats[name] = entry = {'calls': 0, 'total_s': 0.0}
+        entry['calls'] += 1
+        entry['total_s'] += seconds
+
+    def report(self) -> List[Dict]:
+        """누적 시간 내림차순 [{'name', 'calls', 'total_ms', 'mean_ms'}]"""
+        stats = getattr(self._local, 'stats', {})
+        rows = [
+            {
+                'name': name,
+                'calls': s['calls'],
+                'total_ms': s['total_s'] * 1000,
+                'mean_ms': s['total_s'] * 1000 / s['calls'],
+            }
+            for name, s in stats.items()
+        ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+TRACER = Tracer()
+
+
+@contextmanager
+def span(name: str):
+    """코드 구간 타이밍 (계측 비활성 시 아무것도 하지 않음)"""
+    if not TRACER.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        TRACER.record(name, time.perf_counter() - start)
+
+def start_span(name: str):
+    """
+    들여쓰기 블록으로 감쌀 수 없는 구간용 스팬 시작
+    반환된 함수를 호출하면 스팬이 끝나고 기록됨 (계측 비활성 시 no-op)
+    """
+    if not TRACER.enabled:
+        return lambda: None
+    start = time.perf_counter()
+    return lambda: TRACER.record(name, time.perf_counter() - start)
+
+def traced(func=None, *, name: str = None):
+    """함수 호출 타이밍 데코레이터 (@traced 또는 @traced(name=...))"""
+    def decorator(f):
+        label = name or f.__qualname__
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return f(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                TRACER.record(label, time.perf_counter() - start)
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+def start_cprofile() -> Optional[cProfile.Profile]:
+    """
+    cProfile 시작 → Profile (이미 다른 프로파일러가 활성화되어 있으면 None)
+    - Python 3.12+는 프로파일러가 프로세스 전역이라, 다른 세션이 사용 중이면 enable()이 ValueError
+    """
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return None
+    return profiler
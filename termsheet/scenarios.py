@@ -0,0 +1,155 @@
+"""
+시나리오 비교 (협상안 변형 일괄 평가)
+
+같은 딜의 여러 변형(예: 청산배수 1x / 1.5x / 2x, 라운드 주식수 변경)을 이름 붙여 저장하고
+한 번에 평가한 뒤 기준 시나리오 대비 차이를 표로 만든다. 평가 결과는 입력 내용 스냅샷을
+키로 캐시되므로 같은 변형을 다시 보거나 기준을 바꿔도 재계산하지 않는다.
+
+    base = make_scenario('기준안', rounds, g, fund)
+    alt = scenario_variant(base, '2x 청산', {'Series A': {'liquidation_pref': 2.0}})
+    rows = compare_scenarios(evaluate_scenarios([base, alt]), baseline='기준안')
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List
+
+from .batch import analyze_inputs
+from .cache import CAP_TABLE_CACHE, LRUCache, rounds_snapshot, snapshot
+from .models import FundInput, GlobalInput, RoundInput
+from .store import ResultStore, content_hash
+
+# 비교 지표: 키 → 표시 이름
+SCENARIO_METRICS = {
+    'exit_payoff': 'Exit 수령액 (억원)',
+    'partial_val': 'Partial Val (억원)',
+    'lp_valuation': 'LP Valuation (억원)',
+    'lp_return_pct': 'LP 수익률 (%)',
+    'implied_post': 'Breakeven (억원)',
+}
+
+
+@dataclass
+class Scenario:
+    """이름 붙은 입력 변형 (라운드 / 글로벌 / 펀드 입력의 사본)"""
+    name: str
+    rounds: List[RoundInput]
+    global_input: GlobalInput
+    fund_input: FundInput
+
+
+def make_scenario(name: str, rounds: List[RoundInput], g: GlobalInput, fund: FundInput) -> Scenario:
+    """현재 입력의 사본으로 시나리오 생성 (이후 UI에서 입력을 바꿔도 영향 없음)"""
+    return Scenario(name=name, rounds=[replace(r) for r in rounds],
+                    global_input=replace(g), fund_input=replace(fund))
+
+def scenario_variant(base: Scenario, name: str, round_changes: Dict[str, Dict] = None,
+                     global_changes: Dict = None, fund_changes: Dict = None) -> Scenario:
+    """
+    기존 시나리오에서 일부 필드만 바꾼 변형
+    - round_changes: {라운드 이름: {필드: 값}}  예) {'Series A': {'liquidation_pref': 1.5}}
+    """
+    round_changes = round_changes or {}
+    unknown = set(round_changes) - {r.name for r in base.rounds}
+    if unknown:
+        raise ValueError(f"시나리오 '{base.name}'에 없는 라운드: {', '.join(sorted(unknown))}")
+
+    return Scenario(
+        name=name,
+        rounds=[replace(r, **round_changes.get(r.name, {})) for r in base.rounds],
+        global_input=replace(base.global_input, **(global_changes or {})),
+        fund_input=replace(base.fund_input, **(fund_changes or {})),
+    )
+
+def _scenario_key(s: Scenario):
+    """캐시 키: 시나리오 이름이 아니라 입력 내용 (이름만 다른 같은 변형은 결과 공유)"""
+    return ('scenario', rounds_snapshot(s.rounds), snapshot(s.global_input), snapshot(s.fund_input))
+
+def _store_key(s: Scenario) -> str:
+    return content_hash('analysis', s.rounds, s.global_input, s.fund_input)
+
+def _analyze(s: Scenario) -> Dict:
+    return analyze_inputs(s.rounds, s.global_input.founders_shares, s.global_input, s.fund_input)
+
+def evaluate_scenario(s: Scenario, store: ResultStore = None) -> Dict:
+    """
+    시나리오 하나 평가 (termsheet.batch.analyze_inputs 결과, 캐시 - 읽기 전용으로 사용)
+    - store: 메모리 캐시에 없으면 영구 저장소에서 조회 후 계산
+    """
+    key = _scenario_key(s)
+    result = CAP_TABLE_CACHE.get(key, LRUCache._MISSING)
+    if result is LRUCache._MISSING:
+        result = store.get(_store_key(s)) if store is not None else None
+        if result is None:
+            result = _analyze(s)
+            if store is not None:
+                store.put(_store_key(s), result, 'analysis')
+        CAP_TABLE_CACHE.put(key, result)
+    return result
+
+def evaluate_scenarios(scenarios: List[Scenario], workers: int = 1,
+                       store: ResultStore = None) -> Dict[str, Dict]:
+    """
+    시나리오 전체 일괄 평가 {이름: 결과}
+    - 캐시(및 store)에 없는 변형만 계산하며, workers > 1이면 프로세스 풀에서 병렬 계산
+    """
+    results, pending = {}, {}
+    for s in scenarios:
+        key = _scenario_key(s)
+        result = CAP_TABLE_CACHE.get(key, LRUCache._MISSING)
+        if result is LRUCache._MISSING:
+            result = store.get(_store_key(s)) if store is not None else None
+            if result is None:
+                pending.setdefault(key, s)  # 입력이 같은 변형은 한 번만 계산
+                continue
+            CAP_TABLE_CACHE.put(key, result)
+        results[key] = result
+
+    todo = list(pending.values())
+    if workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            computed = list(pool.map(_analyze, todo))
+    else:
+        computed = [_analyze(s) for s in todo]
+    for key, s, result in zip(pending, todo, computed):
+        CAP_TABLE_CACHE.put(key, result)
+        if store is not None:
+            store.put(_store_key(s), result, 'analysis')
+        results[key] = result
+
+    return {s.name: results[_scenario_key(s)] for s in scenarios}
+
+def _series_metrics(result: Dict) -> Dict[str, Dict[str, float]]:
+    """결과 → {시리즈: {지표: 값}}"""
+    return {
+        name: {
+            'exit_payoff': result['exit_payoffs'].get(name),
+            'partial_val': pv,
+            'lp_valuation': result['gp_lp'][name]['lp_valuation'],
+            'lp_return_pct': result['gp_lp'][name]['lp_return_pct'],
+            'implied_post': result['breakeven'].get(name),
+        }
+        for name, pv in result['partial_valuations'].items()
+    }
+
+def compare_scenarios(results: Dict[str, Dict], baseline: str) -> List[Dict]:
+    """
+    시나리오 × 시리즈별 지표와 기준 시나리오 대비 차이 (표 한 행 = 시나리오 하나의 시리즈 하나)
+    반환 예: [{'scenario': '2x 청산', 'series': 'Series A', 'partial_val': 31.2,
+              'partial_val_diff': 4.1, ...}]  (기준 시나리오에 없는 시리즈는 diff None)
+    """
+    if baseline not in results:
+        raise ValueError(f"기준 시나리오가 없습니다: {baseline}")
+    base = _series_metrics(results[baseline]) if 'error' not in results[baseline] else {}
+
+    rows = []
+    for name, result in results.items():
+        if 'error' in result:
+            continue
+        for series, metrics in _series_metrics(result).items():
+            row = {'scenario': name, 'series': series, **metrics}
+            for metric, value in metrics.items():
+                ref = base.get(series, {}).get(metric)
+                row[f'{metric}_diff'] = value - ref if value is not None and ref is not None else None
+            rows.append(row)
+    return rows
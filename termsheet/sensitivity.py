@@ -0,0 +1,96 @@
+"""
+민감도 분석: 파라미터 그리드 전체에 대한 Partial Valuation / GP/LP 일괄 계산
+
+Cap Table(행사가격, 지분율)은 옵션 파라미터와 무관하므로 한 번만 계산하고,
+변동성 × 보유기간 × 기업가치 × 무위험이자율 그리드는 브로드캐스트로 한 번에 평가한다.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from .captable import calculate_conversion_points
+from .models import FundInput, GlobalInput, RoundInput
+from .pricing import black_scholes_call_array, re_option_call_array
+from .profiling import traced
+from .valuation import calculate_gp_lp_split_array, option_legs
+
+# 그리드 축으로 쓸 수 있는 GlobalInput 필드 → 표시 이름
+SENSITIVITY_PARAMS = {
+    'volatility': '변동성 (%)',
+    'holding_period': '보유기간 (년)',
+    'current_valuation': '기업가치 (억원)',
+    'risk_free_rate': '무위험이자율 (%)',
+}
+
+
+def default_axis(param: str, g: GlobalInput, n: int = 100) -> np.ndarray:
+    """사이드바 입력 범위에 맞춘 기본 그리드 축"""
+    if param == 'volatility':
+        return np.linspace(20, 150, n)
+    if param == 'holding_period':
+        return np.linspace(1, 15, n)
+    if param == 'risk_free_rate':
+        return np.linspace(0, 10, n)
+    if param == 'current_valuation':
+        return np.linspace(g.current_valuation * 0.25, g.current_valuation * 4, n)
+    raise ValueError(f"지원하지 않는 민감도 파라미터: {param} (가능: {', '.join(SENSITIVITY_PARAMS)})")
+
+@traced
+def sensitivity_grid(rounds: List[RoundInput], founders_shares: float, g: GlobalInput,
+                     fund: FundInput, axes: Dict[str, np.ndarray], use_re: bool = True) -> Dict:
+    """
+    파라미터 그리드 전체의 시리즈별 Partial Valuation 및 GP/LP 분배
+    - axes: {GlobalInput 필드명: 1차원 값 배열} (지정하지 않은 파라미터는 g의 값 사용)
+    - 결과 배열 shape: (시리즈 수, *각 축 길이)
+    반환 예: {'series': [...], 'axes': {...}, 'partial_val': ndarray, 'lp_valuation': ndarray, ...}
+    """
+    for param in axes:
+        if param not in SENSITIVITY_PARAMS:
+            raise ValueError(f"지원하지 않는 민감도 파라미터: {param} (가능: {', '.join(SENSITIVITY_PARAMS)})")
+
+    cp_data = calculate_conversion_points(rounds, founders_shares)
+    names = list(cp_data)
+    axes = {param: np.asarray(values, dtype=float) for param, values in axes.items()}
+    grid_shape = tuple(len(v) for v in axes.values())
+    if not names:
+        return {'series': [], 'axes': axes, 'partial_val': np.zeros((0, *grid_shape))}
+
+    # 각 파라미터를 자기 축에 놓고 나머지 축은 길이 1 → 브로드캐스트
+    ndim = len(axes)
+    params = {}
+    for param in SENSITIVITY_PARAMS:
+        if param in axes:
+            shape = [1] * ndim
+            shape[list(axes).index(param)] = -1
+            params[param] = axes[param].reshape(shape)
+        else:
+            params[param] = np.asarray(float(getattr(g, param))).reshape([1] * ndim)
+
+    V = params['current_valuation']
+    rf = params['risk_free_rate'] / 100
+    sigma = params['volatility'] / 100
+    H = params['holding_period']
+
+    # (레그, 시리즈, *그리드), strike ≤ 0이면 C = V
+    legs = option_legs(rounds, founders_shares)
+    expand = (slice(None),) + (None,) * ndim
+    strikes = legs['strikes'].T[(slice(None),) + expand]
+    weights = legs['weights'].T[(slice(None),) + expand]
+    opt_func = re_option_call_array if use_re else black_scholes_call_array
+    prices = opt_func(V, strikes, H, rf, sigma)
+    prices = np.where(strikes > 0, prices, np.broadcast_to(V, prices.shape))
+    partial_val = np.maximum(0, (weights * prices).sum(axis=0))
+
+    by_name = {r.name: r for r in rounds}
+    investment = np.array([by_name[n].investment for n in names], dtype=float)[expand]
+    split = calculate_gp_lp_split_array(partial_val, fund, investment)
+
+    return {
+        'series': names,
+        'axes': axes,
+        'partial_val': partial_val,
+        'gp_carry': split['gp_carry'],
+        'lp_valuation': split['lp_valuation'],
+        'lp_return_pct': split['lp_return_pct'],
+    }
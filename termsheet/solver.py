@@ -0,0 +1,124 @@
+"""
+Breakeven (Implied-post Valuation) 솔버
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .captable import calculate_conversion_points
+from .models import FundInput, GlobalInput, RoundInput
+from .pricing import (
+    black_scholes_call_array,
+    black_scholes_delta_array,
+    re_option_call_array,
+    re_option_delta_array,
+)
+from .profiling import traced
+from .valuation import calculate_lp_cost, option_legs
+
+
+def _lp_valuation_and_slope(V: np.ndarray, legs: Dict, g: GlobalInput, fund: FundInput,
+                            investment: np.ndarray, use_re: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """시리즈별 기업가치 V에서의 LP Valuation과 ∂(LP Valuation)/∂V"""
+    rf = g.risk_free_rate / 100
+    sigma = g.volatility / 100
+    H = g.holding_period
+    price = re_option_call_array if use_re else black_scholes_call_array
+    delta = re_option_delta_array if use_re else black_scholes_delta_array
+
+    # 시리즈 × 레그 (option_legs, strike ≤ 0이면 C = V, 델타 1)
+    strikes, weights = legs['strikes'], legs['weights']
+    prices = price(V[:, None], strikes, H, rf, sigma)
+    deltas = delta(V[:, None], strikes, H, rf, sigma)
+
+    in_strike = strikes > 0
+    prices = np.where(in_strike, prices, V[:, None])
+    deltas = np.where(in_strike, deltas, 1.0)
+    raw = (weights * prices).sum(axis=1)
+    raw_slope = (weights * deltas).sum(axis=1)
+
+    pv = np.maximum(0, raw)
+    pv_slope = np.where(raw > 0, raw_slope, 0.0)
+
+    # calculate_gp_lp_split과 동일한 허들/Carry 규칙
+    carry_rate = fund.carried_interest / 100
+    hurdle = investment * (fund.hurdle_rate / 100) * 5
+    profit = np.maximum(0, pv - investment)
+    in_carry = profit > hurdle
+    # pv - (pv - investment - hurdle)·carry를 재배열 (큰 V에서 상쇄 오차로 가짜 해가 생기지 않도록)
+    lp_val = np.where(in_carry, pv * (1 - carry_rate) + (investment + hurdle) * carry_rate, pv)
+    lp_slope = pv_slope * np.where(in_carry, 1 - carry_rate, 1.0)
+    return lp_val, lp_slope
+
+@traced
+def solve_breakeven(rounds: List[RoundInput], founders_shares: float, g: GlobalInput,
+                    fund: FundInput, use_re: bool = True, tol: float = 1e-8,
+                    max_iter: int = 100) -> Dict[str, Dict]:
+    """
+    전체 시리즈의 Implied-post Valuation (LP Valuation = LP Cost가 되는 기업가치) 일괄 계산
+    - 현재 기업가치에서 시작해 구간을 자동 확장(bracketing)
+    - 옵션 포트폴리오의 해석적 델타로 Newton 스텝, 구간을 벗어나면 이분법으로 대체
+    반환 예: {'Series A': {'implied_post': 123.4, 'lp_cost': 25.0, 'iterations': 6, 'converged': True}}
+    """
+    cp_data = calculate_conversion_points(rounds, founders_shares)
+    if not cp_data:
+        return {}
+
+    legs = option_legs(rounds, founders_shares)
+    by_name = {r.name: r for r in rounds}
+    investment = np.array([by_name[n].investment for n in legs['names']], dtype=float)
+    lp_cost = np.array([calculate_lp_cost(fund, inv) for inv in investment])
+
+    def f(V):
+        lp_val, slope = _lp_valuation_and_slope(V, legs, g, fund, investment, use_re)
+        return lp_val - lp_cost, slope
+
+    n = len(legs['names'])
+    x0 = np.full(n, max(float(g.current_valuation), 1.0))
+    f0, _ = f(x0)
+
+    # 1) 구간 확장: f(lo) < 0 ≤ f(hi)
+    lo = np.where(f0 < 0, x0, 0.0)
+    hi = np.where(f0 < 0, np.inf, x0)
+    probe = np.where(f0 < 0, x0 * 2, x0 / 2)
+    for _ in range(200):
+        open_lo, open_hi = lo == 0, np.isinf(hi)
+        pending = (open_lo & (hi > 1e-9)) | open_hi
+        if not pending.any():
+            break
+        fp, _ = f(probe)
+        lo = np.where(pending & (fp < 0), np.maximum(lo, probe), lo)
+        hi = np.where(pending & (fp >= 0), np.minimum(hi, probe), hi)
+        probe = np.where(np.isinf(hi), probe * 2, probe / 2)
+    bracketed = np.isfinite(hi)
+
+    # 2) Newton + 이분법 (safeguarded)
+    x = np.where(bracketed, np.where(lo > 0, (lo + hi) / 2, hi), x0)
+    iterations = np.zeros(n, dtype=int)
+    converged = np.zeros(n, dtype=bool)
+    for _ in range(max_iter):
+        active = bracketed & ~converged
+        if not active.any():
+            break
+        fx, slope = f(x)
+        iterations += active
+        scale = np.maximum(1.0, lp_cost)
+        converged |= active & ((np.abs(fx) <= tol * scale) | (hi - lo <= tol * np.maximum(1.0, x)))
+
+        lo = np.where(active & (fx < 0), x, lo)
+        hi = np.where(active & (fx >= 0), x, hi)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = x - fx / slope
+        use_newton = (slope > 0) & (newton > lo) & (newton < hi)
+        x = np.where(active & ~converged, np.where(use_newton, newton, (lo + hi) / 2), x)
+
+    return {
+        name: {
+            'implied_post': float(x[i]) if bracketed[i] else float('nan'),
+            'lp_cost': float(lp_cost[i]),
+            'iterations': int(iterations[i]),
+            'converged': bool(converged[i]),
+        }
+        for i, name in enumerate(legs['names'])
+    }
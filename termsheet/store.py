@@ -0,0 +1,144 @@
+"""
+영구 결과 저장소 (SQLite)
+
+세션·서버 재시작·배치 실행 간에 계산 결과(전환포인트, Partial Valuation, GP/LP, Breakeven)를
+공유한다. 키는 입력 데이터클래스의 정규화된 내용 해시 + 엔진 버전이며,
+ENGINE_VERSION이 바뀌면 이전 버전 결과는 저장소를 열 때 자동 삭제된다.
+전체 크기가 max_bytes를 넘으면 최근에 조회되지 않은 결과부터 축출한다.
+
+    store = ResultStore('results.sqlite')
+    pv = store.fetch('partial_valuations', lambda: calculate_partial_valuations(rounds, fs, g), rounds, g)
+"""
+
+from typing import Callable, Dict, Optional
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+# 계산 결과가 달라지는 변경(모델/수치 방법)마다 올릴 것 → 이전 결과 자동 무효화
+ENGINE_VERSION = '2.3.0'
+
+DEFAULT_STORE_PATH = os.environ.get(
+    'TERMSHEET_STORE_PATH', os.path.join(tempfile.gettempdir(), 'termsheet_results.sqlite')
+)
+
+
+def _canonical(obj):
+    """해시용 정규 표현 (데이터클래스 → 필드 dict, 리스트/튜플 → 리스트, dict 값도 재귀 정규화)"""
+    if dataclasses.is_dataclass(obj):
+        return {'__type__': type(obj).__name__, **{
+            f.name: _canonical(getattr(obj, f.name)) for f in dataclasses.fields(obj)
+        }}
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, float) and obj.is_integer():
+        return int(obj)  # 20 과 20.0 은 같은 입력
+    return obj
+
+def content_hash(kind: str, *inputs) -> str:
+    """결과 종류 + 입력 내용 + 엔진 버전의 SHA-256 (필드 순서/정수·실수 표기와 무관)"""
+    payload = json.dumps([ENGINE_VERSION, kind, _canonical(list(inputs))],
+                         sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultStore:
+    """SQLite 결과 저장소 (스레드/프로세스 간 공유 가능, 크기 제한 LRU 축출)"""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, max_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                ' key TEXT PRIMARY KEY, kind TEXT, engine_version TEXT,'
+                ' payload TEXT, size INTEGER, created REAL, accessed REAL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+            # 엔진 버전이 바뀐 결과는 재사용 불가 → 삭제
+            self._conn.execute('DELETE FROM results WHERE engine_version != ?', (ENGINE_VERSION,))
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock, self._conn:
+            row = self._conn.execute('SELECT payload FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute('UPDATE results SET accessed = ? WHERE key = ?', (time.time(), key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value, kind: str = '') -> None:
+        payload = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, kind, ENGINE_VERSION, payload, len(payload), now, now),
+            )
+            self._evict()
+
+    def fetch(self, kind: str, compute: Callable[[], object], *inputs):
+        """저장된 결과 조회, 없으면 compute() 결과를 저장 후 반환 (결과는 JSON 직렬화 가능해야 함)"""
+        key = content_hash(kind, *inputs)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value, kind)
+        return value
+
+    def _evict(self) -> None:
+        """총 크기가 max_bytes를 넘으면 최근 조회 순으로 누적해 넘치는 결과 삭제"""
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        cur = self._conn.execute(
+            'DELETE FROM results WHERE key IN ('
+            ' SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed DESC) AS cum FROM results)'
+            ' WHERE cum > ?)',
+            (self.max_bytes,),
+        )
+        self.evictions += cur.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM results')
+            self.hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries, size = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results'
+            ).fetchone()
+        total = self.hits + self.misses
+        return {
+            'path': self.path,
+            'engine_version': ENGINE_VERSION,
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
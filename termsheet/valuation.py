@@ -0,0 +1,239 @@
+"""
+Partial Valuation (옵션 모델) 및 GP/LP 분배
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from .cache import CAP_TABLE_CACHE, memoize, rounds_snapshot, snapshot
+from .captable import (
+    CapTableArrays,
+    calculate_conversion_points,
+    cap_table_arrays,
+    get_conversion_order,
+)
+from .models import FundInput, GlobalInput, RoundInput
+from .pricing import (
+    black_scholes_call,
+    black_scholes_call_array,
+    re_option_call,
+    re_option_call_array,
+)
+from .profiling import traced
+
+
+@traced
+def calculate_partial_valuation(r: RoundInput, rounds: List[RoundInput], 
+                                founders_shares: float, g: GlobalInput, use_re: bool = True) -> float:
+    """Partial Valuation 계산 (옵션 모델)"""
+    cp_data = calculate_conversion_points(rounds, founders_shares)
+    
+    if r.name not in cp_data:
+        return 0
+    if r.participating:
+        # 참가분 레그가 추가됨 (option_legs)
+        return calculate_partial_valuations(rounds, founders_shares, g, use_re).get(r.name, 0)
+    
+    V = g.current_valuation
+    rf = g.risk_free_rate / 100
+    sigma = g.volatility / 100
+    H = g.holding_period
+    
+    opt_func = re_option_call if use_re else black_scholes_call
+    
+    data = cp_data[r.name]
+    order = get_conversion_order(rounds)
+    
+    # 선순위 RV 합계
+    prior_rv = 0
+    for name, _ in order:
+        if name == r.name:
+            break
+        prior_rv += cp_data[name]['rv']
+    
+    rv = data['rv']
+    cp = data['conversion_point']
+    ownership = data['ownership_pct'] / 100
+    
+    # Partial Valuation = C(prior_rv) - C(prior_rv + rv) + ownership × C(cp)
+    p1 = opt_func(V, prior_rv, H, rf, sigma) if prior_rv > 0 else V
+    p2 = opt_func(V, prior_rv + rv, H, rf, sigma)
+    p3 = ownership * opt_func(V, cp, H, rf, sigma)
+    
+    return max(0, p1 - p2 + p3)
+
+@traced
+def calculate_partial_valuations(rounds: List[RoundInput], founders_shares: float,
+                                 g: GlobalInput, use_re: bool = True) -> Dict[str, float]:
+    """
+    전체 시리즈 Partial Valuation 일괄 계산
+    - 시리즈 간 공유되는 행사가격(한 시리즈의 prior_rv + rv = 다음 시리즈의 prior_rv)을
+      한 번씩만 벡터화 평가 후 조합
+    - 참가적/상한 참가적 우선주는 option_legs의 추가 레그 포함
+    """
+    return dict(_partial_valuations(rounds, founders_shares, g, use_re))
+
+def partial_valuation_legs(cp_data: Dict) -> Dict[str, np.ndarray]:
+    """
+    Partial Valuation 옵션 포지션 (전환순서대로 시리즈별 배열)
+    PV = C(prior_rv) - C(prior_rv + rv) + ownership × C(cp),  prior_rv = 0이면 C(0) = V
+    """
+    names = list(cp_data)
+    rv = np.array([cp_data[n]['rv'] for n in names], dtype=float)
+    return {
+        'names': names,
+        'prior_rv': np.concatenate([[0.0], np.cumsum(rv)[:-1]]),
+        'rv': rv,
+        'cp': np.array([cp_data[n]['conversion_point'] for n in names], dtype=float),
+        'ownership': np.array([cp_data[n]['ownership_pct'] for n in names], dtype=float) / 100,
+    }
+
+@memoize(CAP_TABLE_CACHE, key=lambda rounds, founders_shares:
+         ('option_legs', rounds_snapshot(rounds), founders_shares))
+def option_legs(rounds: List[RoundInput], founders_shares: float) -> Dict[str, np.ndarray]:
+    """
+    시리즈별 옵션 포지션 (전환순서대로, 결과는 읽기 전용으로 사용)
+    PV = Σ weights × C(strikes),  strike ≤ 0이면 C = V  (행은 남는 칸을 weight 0으로 채움)
+    - 모든 시리즈: partial_valuation_legs의 3개 레그 (전환하지 않는 시리즈는 전환 레그 없음)
+    - 참가적 시리즈: 참가분 레그 추가 (_participation_legs, 상한 ≤ 청산우선권이면 없음)
+    """
+    cp_data = calculate_conversion_points(rounds, founders_shares)
+    legs = partial_valuation_legs(cp_data)
+    names = legs['names']
+
+    rows = [
+        [(prior, 1.0), (prior + rv, -1.0), (cp, own) if np.isfinite(cp) else (0.0, 0.0)]
+        for prior, rv, cp, own in zip(legs['prior_rv'], legs['rv'], legs['cp'], legs['ownership'])
+    ]
+    extra = _participation_legs(cap_table_arrays(rounds, founders_shares))
+    for k, name in enumerate(names):
+        rows[k].extend(extra.get(name, ()))
+
+    width = max((len(row) for row in rows), default=0)
+    strikes = np.zeros((len(names), width))
+    weights = np.zeros((len(names), width))
+    for k, row in enumerate(rows):
+        for j, (strike, weight) in enumerate(row):
+            strikes[k, j], weights[k, j] = strike, weight
+    return {**legs, 'strikes': strikes, 'weights': weights}
+
+def _participation_legs(arrays: CapTableArrays) -> Dict[str, List]:
+    """
+    참가적 시리즈별 참가분 레그 [(행사가격, weight)]
+    - waterfall의 참가 수령액을 자기 전환포인트까지만 사용 (전환 후에는 그 값으로 고정 → 전환 레그가 이어받음)
+    - 구간별 기울기 변화만큼의 콜: 잔여가치 참가 시작, 다른 클래스 전환, 상한 도달, 자기 전환
+    """
+    rows = np.flatnonzero(arrays.participating)
+    if not len(rows):
+        return {}
+
+    left = arrays.breakpoints()
+    right = np.append(left[1:], left[-1] + max(left[-1], 1.0))
+    mid = (left + right) / 2
+    # 참가 클래스 행만 보관 (waterfall은 묶음별 평가 → 클래스 × breakpoint 임시 배열을 만들지 않음)
+    at_left = np.zeros((len(rows), len(left)))
+    at_mid = np.zeros((len(rows), len(left)))
+    for out, points in ((at_left, left), (at_mid, mid)):
+        for cols, w in arrays.waterfall_blocks(points):
+            out[:, cols] = w['participate'][rows]
+    slopes = (at_mid - at_left) / (mid - left)
+
+    legs = {}
+    for slope, i in zip(slopes, rows):
+        slope = np.where(left < arrays.conversion_point[i], slope, 0.0)
+        kink = np.diff(slope, prepend=0.0)
+        keep = np.abs(kink) > 1e-12 * np.abs(slope).max()
+        legs[arrays.names[i]] = list(zip(left[keep], kink[keep]))
+    return legs
+
+@memoize(CAP_TABLE_CACHE, key=lambda rounds, founders_shares, g, use_re:
+         ('partial_valuations', rounds_snapshot(rounds), founders_shares, snapshot(g), use_re))
+def _partial_valuations(rounds: List[RoundInput], founders_shares: float,
+                        g: GlobalInput, use_re: bool) -> Dict[str, float]:
+    cp_data = calculate_conversion_points(rounds, founders_shares)
+    if not cp_data:
+        return {}
+
+    V = g.current_valuation
+    rf = g.risk_free_rate / 100
+    sigma = g.volatility / 100
+    H = g.holding_period
+
+    opt_func = re_option_call_array if use_re else black_scholes_call_array
+
+    # 전환순서대로 시리즈별 레그 (비참가적: 선순위 RV, 선순위 RV + RV, 전환포인트)
+    legs = option_legs(rounds, founders_shares)
+    names, strikes, weights = legs['names'], legs['strikes'], legs['weights']
+
+    unique, inverse = np.unique(strikes, return_inverse=True)
+    prices = opt_func(V, unique, H, rf, sigma)[inverse].reshape(strikes.shape)
+    prices = np.where(strikes > 0, prices, V)
+
+    values = np.maximum(0, (weights * prices).sum(axis=1))
+    return {name: float(v) for name, v in zip(names, values)}
+
+def calculate_lp_cost(fund: FundInput, investment: float) -> float:
+    """LP Cost 계산"""
+    # 총 관리보수 = 약정총액 × 관리보수율 × 10년 (가정)
+    lifetime_fees = fund.committed_capital * (fund.management_fee_rate / 100) * 10
+    investable = fund.committed_capital - lifetime_fees
+    if investable > 0:
+        return (fund.committed_capital / investable) * investment
+    return investment
+
+@traced
+def calculate_gp_lp_split(partial_val: float, fund: FundInput, investment: float) -> Dict:
+    """GP/LP 분배 계산"""
+    lp_cost = calculate_lp_cost(fund, investment)
+    
+    # 수익 계산
+    profit = max(0, partial_val - investment)
+    
+    # 허들 적용
+    hurdle_amount = investment * (fund.hurdle_rate / 100) * 5  # 5년 가정
+    
+    if profit <= hurdle_amount:
+        gp_carry = 0
+    else:
+        excess = profit - hurdle_amount
+        gp_carry = excess * (fund.carried_interest / 100)
+    
+    lp_val = partial_val - gp_carry
+    
+    return {
+        'lp_cost': lp_cost,
+        'partial_val': partial_val,
+        'profit': profit,
+        'hurdle': hurdle_amount,
+        'gp_carry': gp_carry,
+        'lp_valuation': lp_val,
+        'lp_return_pct': ((lp_val - lp_cost) / lp_cost * 100) if lp_cost > 0 else 0
+    }
+
+def calculate_gp_lp_split_array(partial_val, fund: FundInput, investment) -> Dict[str, np.ndarray]:
+    """GP/LP 분배 계산 (배열 버전, partial_val/investment 브로드캐스트, 규칙은 calculate_gp_lp_split과 동일)"""
+    partial_val, investment = np.broadcast_arrays(
+        np.asarray(partial_val, dtype=float), np.asarray(investment, dtype=float)
+    )
+    lifetime_fees = fund.committed_capital * (fund.management_fee_rate / 100) * 10
+    investable = fund.committed_capital - lifetime_fees
+    lp_cost = (fund.committed_capital / investable) * investment if investable > 0 else investment
+
+    profit = np.maximum(0, partial_val - investment)
+    hurdle_amount = investment * (fund.hurdle_rate / 100) * 5  # 5년 가정
+    gp_carry = np.where(profit <= hurdle_amount, 0.0, (profit - hurdle_amount) * (fund.carried_interest / 100))
+    lp_val = partial_val - gp_carry
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lp_return_pct = np.where(lp_cost > 0, (lp_val - lp_cost) / lp_cost * 100, 0.0)
+
+    return {
+        'lp_cost': lp_cost,
+        'partial_val': partial_val,
+        'profit': profit,
+        'hurdle': hurdle_amount,
+        'gp_carry': gp_carry,
+        'lp_valuation': lp_val,
+        'lp_return_pct': lp_return_pct,
+    }
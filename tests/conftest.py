@@ -0,0 +1,48 @@
+"""
+테스트 공용 입력 (창업자 주식수, 라운드 구성)
+
+테스트 모듈에서 `from conftest import FOUNDERS_SHARES, plain_rounds` 처럼 가져와 쓴다.
+라운드 생성 함수는 호출할 때마다 새 RoundInput 리스트를 반환하므로 테스트에서 수정해도 된다.
+"""
+
+import random
+from typing import List
+
+from termsheet.models import RoundInput
+
+FOUNDERS_SHARES = 1_000_000
+
+
+def plain_rounds(n: int = 3) -> List[RoundInput]:
+    """비참가적 1x Series A/B/C (투자금액 20/50/30, 주식수 3M/2M/1M) 중 앞의 n개"""
+    return [
+        RoundInput(name='Series A', active=True, investment=20, shares=3_000_000),
+        RoundInput(name='Series B', active=True, investment=50, shares=2_000_000),
+        RoundInput(name='Series C', active=True, investment=30, shares=1_000_000),
+    ][:n]
+
+
+def mixed_rounds() -> List[RoundInput]:
+    """plain_rounds + Series B 1.5x 청산우선권, Series C 3배 상한 참가적"""
+    rounds = plain_rounds()
+    rounds[1].liquidation_pref = 1.5
+    rounds[2].participating = True
+    rounds[2].participation_cap = 3.0
+    return rounds
+
+
+def random_rounds(n_classes: int, seed: int, participating: float = 0.0,
+                  name: str = 'Series {}') -> List[RoundInput]:
+    """
+    재현 가능한 무작위 라운드 (투자금액 1~100, 주식수 1e5~3e6, 청산배수 1/1.5/2)
+    - participating: 라운드별 참가적일 확률 (상한 없음/2배/3배 중 무작위)
+    - name: 라운드 이름 형식 ('{}'에 1부터 시작하는 번호)
+    """
+    rng = random.Random(seed)
+    return [
+        RoundInput(name=name.format(i + 1), active=True, investment=rng.uniform(1, 100),
+                   shares=rng.uniform(1e5, 3e6), liquidation_pref=rng.choice([1.0, 1.5, 2.0]),
+                   participating=rng.random() < participating,
+                   participation_cap=rng.choice([0.0, 2.0, 3.0]))
+        for i in range(n_classes)
+    ]
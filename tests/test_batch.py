@@ -0,0 +1,87 @@
+"""
+일괄 분석 CLI: 딜별 오류 기록, 워커 수/결과 저장소와 무관한 결과
+"""
+
+import json
+
+from termsheet import batch
+from termsheet.store import ResultStore
+
+
+def deal(deal_id: str, scale: float = 1.0, **overrides):
+    record = {
+        'deal_id': deal_id,
+        'rounds': [
+            {'name': 'Series A', 'investment': 20 * scale, 'shares': 3_000_000},
+            {'name': 'Series B', 'investment': 50 * scale, 'shares': 2_000_000,
+             'liquidation_pref': 1.5},
+            {'name': 'Series C', 'investment': 30 * scale, 'shares': 1_000_000,
+             'participating': True, 'participation_cap': 3.0},
+        ],
+        'global': {'founders_shares': 1_000_000, 'current_valuation': 100 * scale,
+                   'exit_valuation': 500 * scale},
+        'fund': {'committed_capital': 500},
+    }
+    record.update(overrides)
+    return record
+
+
+def deals(n: int):
+    return [deal(f'D-{i:03d}', scale=1 + i / 10) for i in range(n)]
+
+
+def test_bad_deal_is_recorded_and_batch_continues():
+    records = deals(3)
+    records.insert(1, deal('BAD', rounds=[{'name': 'Series A', 'investment': 'abc', 'shares': 1}]))
+    records.insert(3, deal('EMPTY', rounds=[]))
+    results = list(batch.run_batch(records, workers=1, chunk_size=2))
+
+    assert [r['deal_id'] for r in results] == ['D-000', 'BAD', 'D-001', 'EMPTY', 'D-002']
+    assert results[1]['error'].startswith('ValueError')
+    assert 'error' in results[3]
+    for r in (results[0], results[2], results[4]):
+        assert 'error' not in r
+        assert set(r['partial_valuations']) == {'Series A', 'Series B', 'Series C'}
+
+
+def test_workers_and_store_give_identical_results(tmp_path):
+    records = deals(7)
+    records.append(deal('BAD', rounds=[{'name': 'Series A', 'shares': 'x'}]))
+    serial = list(batch.run_batch(records, workers=1, chunk_size=3))
+    parallel = list(batch.run_batch(records, workers=2, chunk_size=3))
+    assert parallel == serial
+
+    store_path = str(tmp_path / 'results.sqlite')
+    first = list(batch.run_batch(records, workers=2, chunk_size=3, store_path=store_path))
+    second = list(batch.run_batch(records, workers=1, chunk_size=3, store_path=store_path))
+    assert first == serial
+    assert second == serial
+
+    store = ResultStore(store_path)
+    assert store.stats()['entries'] == 7  # 오류 딜은 저장하지 않음
+    store.close()
+
+
+def test_csv_and_jsonl_inputs_match(tmp_path):
+    records = deals(2)
+    jsonl = tmp_path / 'deals.jsonl'
+    jsonl.write_text(''.join(json.dumps(r) + '\n' for r in records), encoding='utf-8')
+
+    columns = ['deal_id', 'round_name', 'investment', 'shares', 'liquidation_pref',
+               'participating', 'participation_cap', 'founders_shares', 'current_valuation',
+               'exit_valuation', 'committed_capital']
+    lines = [','.join(columns)]
+    for r in records:
+        for rd in r['rounds']:
+            row = {'deal_id': r['deal_id'], 'round_name': rd['name'], **rd, **r['global'], **r['fund']}
+            lines.append(','.join(str(row.get(c, '')) for c in columns))
+    csv_path = tmp_path / 'deals.csv'
+    csv_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    out_jsonl, out_csv = tmp_path / 'a.jsonl', tmp_path / 'b.jsonl'
+    assert batch.main([str(jsonl), '-o', str(out_jsonl)]) == 0
+    assert batch.main([str(csv_path), '-o', str(out_csv), '--workers', '2']) == 0
+    from_jsonl = [json.loads(line) for line in out_jsonl.read_text(encoding='utf-8').splitlines()]
+    from_csv = [json.loads(line) for line in out_csv.read_text(encoding='utf-8').splitlines()]
+    assert len(from_jsonl) == 2
+    assert from_csv == from_jsonl
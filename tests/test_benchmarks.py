@@ -0,0 +1,61 @@
+"""
+벤치마크 기준선: 저장한 기준선 대비 threshold를 넘는 시간/할당 증가만 회귀로 판정
+"""
+
+from pathlib import Path
+import importlib.util
+import json
+
+import pytest
+
+BENCH_PATH = Path(__file__).resolve().parents[1] / 'benchmarks' / 'bench_valuation.py'
+CASE = 'calculate_exit_payoffs[n=6]'
+
+
+@pytest.fixture(scope='module')
+def bench():
+    spec = importlib.util.spec_from_file_location('bench_valuation', BENCH_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timings(time_s, peak_kb=100.0):
+    return {CASE: {'time_s': time_s, 'peak_kb': peak_kb}}
+
+
+def run_main(bench, monkeypatch, results, *args):
+    monkeypatch.setattr(bench, 'run', lambda pattern, repeat, stress: results)
+    return bench.main(list(args))
+
+
+def test_saved_baseline_flags_slower_run(bench, monkeypatch, tmp_path, capsys):
+    baseline = str(tmp_path / 'baseline.json')
+    assert run_main(bench, monkeypatch, timings(0.010), '--save', baseline) == 0
+    with open(baseline, encoding='utf-8') as fh:
+        saved = json.load(fh)
+    assert saved['results'] == timings(0.010)
+    assert {'python', 'numpy', 'platform'} <= set(saved['meta'])
+
+    # 허용 범위(+25%) 안은 통과, 넘으면 종료코드 1과 함께 케이스 출력
+    assert run_main(bench, monkeypatch, timings(0.0124), '--compare', baseline) == 0
+    assert '회귀 없음' in capsys.readouterr().out
+    assert run_main(bench, monkeypatch, timings(0.013), '--compare', baseline) == 1
+    out = capsys.readouterr().out
+    assert '회귀 감지 (1건' in out and CASE in out
+
+    # threshold 옵션 반영
+    assert run_main(bench, monkeypatch, timings(0.013), '--compare', baseline, '--threshold', '0.5') == 0
+
+
+def test_compare_checks_time_and_allocation_at_threshold(bench):
+    baseline = timings(0.010, peak_kb=100.0)
+    assert bench.compare(timings(0.0125, peak_kb=125.0), baseline, 0.25) == []
+    assert bench.compare(timings(0.010, peak_kb=126.0), baseline, 0.25) == \
+        [f'{CASE}: peak_kb 100KB → 126KB (+26%)']
+    regressions = bench.compare(timings(0.02, peak_kb=200.0), baseline, 0.25)
+    assert [line.split(': ')[1].split()[0] for line in regressions] == ['time_s', 'peak_kb']
+
+    # 기준선에 없는 새 케이스와 0인 기준값은 판정하지 않음
+    assert bench.compare({'new case': {'time_s': 1.0, 'peak_kb': 1.0}}, baseline, 0.25) == []
+    assert bench.compare(timings(0.02), timings(0.0, peak_kb=0.0), 0.25) == []
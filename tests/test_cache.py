@@ -0,0 +1,225 @@
+"""
+LRUCache: 항목 수·바이트 상한
+memoize: 같은 입력 적중, 라운드 필드 변경 시 실패, use_re별 독립 키
+SharedCache: 바이트 상한 LRU, TTL 만료, 통계, 스레드 간 get_or_compute 중복 계산 방지
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+import threading
+
+import numpy as np
+import pytest
+
+from termsheet import GlobalInput
+from termsheet import cache as cache_module
+from termsheet.cache import (
+    CAP_TABLE_CACHE,
+    OPTION_CACHE,
+    LRUCache,
+    SharedCache,
+    estimate_size,
+    memoize,
+    rounds_snapshot,
+    snapshot,
+)
+from termsheet.pricing import re_option_call
+from termsheet.valuation import calculate_partial_valuations
+
+from conftest import plain_rounds
+
+
+def test_lru_cache_evicts_by_count():
+    cache = LRUCache(maxsize=2)
+    for key in 'abc':
+        cache.put(key, key)
+    assert cache.get('a') is None
+    assert cache.get('c') == 'c'
+    assert cache.stats()['evictions'] == 1
+
+
+def test_lru_cache_evicts_by_bytes():
+    value = np.zeros(1000)  # 약 8KB
+    size = estimate_size(value)
+    cache = LRUCache(maxsize=100, max_bytes=size * 3)
+    for key in range(5):
+        cache.put(key, np.zeros(1000))
+    stats = cache.stats()
+    assert stats['size'] == 3
+    assert stats['bytes'] == size * 3
+    assert cache.get(0) is None and cache.get(4) is not None
+
+    cache.put(4, np.zeros(1))  # 같은 키 덮어쓰기 → 이전 크기 차감
+    assert cache.stats()['bytes'] == size * 2 + estimate_size(np.zeros(1))
+
+
+def test_lru_cache_skips_values_larger_than_limit():
+    cache = LRUCache(maxsize=10, max_bytes=1024)
+    cache.put('big', np.zeros(10_000))
+    assert cache.get('big') is None
+    assert cache.stats()['bytes'] == 0
+
+
+def memo_rounds(investment=20):
+    rounds = plain_rounds(2)
+    rounds[0].investment = investment
+    return rounds
+
+
+def test_memoize_keys_on_round_snapshot_and_use_re():
+    cache = LRUCache(maxsize=16)
+    calls = []
+
+    @memoize(cache, key=lambda rounds, g, use_re: (rounds_snapshot(rounds), snapshot(g), use_re))
+    def value(rounds, g, use_re):
+        calls.append(use_re)
+        return len(calls)
+
+    g = GlobalInput()
+    assert value(memo_rounds(), g, True) == value(memo_rounds(), g, True) == 1  # 내용이 같은 새 객체도 적중
+    assert value(memo_rounds(), g, False) == 2
+    assert value(memo_rounds(investment=21), g, True) == 3
+    changed = memo_rounds()
+    changed[1].liquidation_pref = 1.5
+    assert value(changed, g, True) == 4
+    assert value(memo_rounds(), GlobalInput(volatility=60), True) == 5
+    assert value(memo_rounds(), g, False) == 2
+    assert (cache.hits, cache.misses) == (2, 5)
+
+
+def test_partial_valuations_cache_separates_inputs_and_use_re():
+    CAP_TABLE_CACHE.clear()
+    g = GlobalInput()
+    re_values = calculate_partial_valuations(memo_rounds(), 1_000_000, g, use_re=True)
+    bs_values = calculate_partial_valuations(memo_rounds(), 1_000_000, g, use_re=False)
+    assert re_values != bs_values
+
+    hits = CAP_TABLE_CACHE.hits
+    assert calculate_partial_valuations(memo_rounds(), 1_000_000, g, use_re=True) == re_values
+    assert CAP_TABLE_CACHE.hits > hits
+
+    rounds = memo_rounds()
+    rounds[0].shares = 4_000_000
+    changed = calculate_partial_valuations(rounds, 1_000_000, g, use_re=True)
+    assert changed['Series A'] != re_values['Series A']
+    CAP_TABLE_CACHE.clear()
+
+
+def test_laguerre_price_adds_one_option_cache_entry():
+    OPTION_CACHE.clear()
+    value = re_option_call(100.0, 80.0, 5.0, 0.03, 0.9, method='laguerre', n_nodes=100)
+    assert len(OPTION_CACHE) == 1
+    assert value == pytest.approx(re_option_call(100.0, 80.0, 5.0, 0.03, 0.9), rel=1e-3)
+    OPTION_CACHE.clear()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, 'time', SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+def test_shared_cache_byte_ceiling_evicts_least_recently_used(clock):
+    cache = SharedCache(max_bytes=300, ttl=60)
+    for key in 'abc':
+        cache.put(key, key, size=100)
+    assert cache.get('a') == 'a'  # a가 최근 사용 → b가 가장 오래됨
+    cache.put('d', 'd', size=100)
+
+    assert cache.get('b') is None
+    assert [cache.get(k) for k in 'acd'] == ['a', 'c', 'd']
+    assert (len(cache), cache.bytes, cache.evictions) == (3, 300, 1)
+
+    cache.put('big', 'big', size=301)  # 상한보다 큰 값은 저장하지 않음
+    assert cache.get('big') is None and cache.bytes == 300
+
+    cache.configure(max_bytes=150)  # 상한 축소 → 오래된 순 축출
+    assert list(cache._data) == ['d'] and cache.bytes == 100
+
+
+def test_shared_cache_ttl_expiry(clock):
+    cache = SharedCache(max_bytes=1000, ttl=10)
+    cache.put('default', 1, size=10)
+    cache.put('short', 2, size=10, ttl=1)
+    clock.now = 5
+    assert cache.get('short') is None
+    assert cache.get('default') == 1
+    clock.now = 10
+    assert cache.get('default') is None
+    assert (cache.expirations, len(cache), cache.bytes) == (2, 0, 0)
+
+
+def test_shared_cache_evicts_expired_entries_before_live_ones(clock):
+    cache = SharedCache(max_bytes=200, ttl=10)
+    cache.put('live', 1, size=100, ttl=100)
+    cache.put('stale', 2, size=100)
+    clock.now = 20
+    cache.put('new', 3, size=100)
+
+    assert cache.get('live') == 1 and cache.get('new') == 3
+    assert (cache.evictions, cache.expirations) == (0, 1)
+
+
+def test_shared_cache_stats(clock):
+    cache = SharedCache(max_bytes=1000, ttl=30)
+    cache.put('a', np.zeros(10))
+    cache.get('a')
+    cache.get('a')
+    cache.get('missing')
+    assert cache.stats() == {
+        'size': 1,
+        'bytes': estimate_size(np.zeros(10)),
+        'max_bytes': 1000,
+        'ttl': 30,
+        'hits': 2,
+        'misses': 1,
+        'evictions': 0,
+        'expirations': 0,
+        'hit_rate': 2 / 3,
+    }
+    cache.clear()
+    assert cache.stats()['size'] == 0 and cache.stats()['hit_rate'] == 0.0
+
+
+def test_shared_cache_get_or_compute_runs_once_across_threads():
+    cache = SharedCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        first = pool.submit(cache.get_or_compute, 'key', compute)
+        assert started.wait(5)
+        others = [pool.submit(cache.get_or_compute, 'key', compute) for _ in range(7)]
+        release.set()
+        results = [first.result()] + [f.result() for f in others]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert cache.stats()['misses'] == 1 and cache.stats()['hits'] == 7
+
+
+def test_shared_cache_get_or_compute_retries_after_failure():
+    cache = SharedCache()
+
+    def fail():
+        raise RuntimeError('계산 실패')
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute('key', fail)
+    assert cache.get_or_compute('key', lambda: 42) == 42
+    assert cache.get('key') == 42
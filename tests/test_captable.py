@@ -0,0 +1,229 @@
+"""
+Cap Table 계산: 컴파일된 표 조회, waterfall 직접 계산, 기존 스칼라 구현이 같은 값을 주는지 검사
+"""
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from termsheet import captable
+from termsheet.models import RoundInput
+
+from conftest import FOUNDERS_SHARES, random_rounds
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_direct_table_matches_compiled_table(seed):
+    """구간표 없이(waterfall 직접 계산) 만든 표와 컴파일된 표의 조회 결과가 같음"""
+    rounds = random_rounds(random.Random(seed).randint(1, 12), seed, participating=0.3)
+    arrays = captable.CapTableArrays.from_rounds(rounds, FOUNDERS_SHARES)
+    compiled = captable.CompiledCapTable(arrays, compiled=True)
+    direct = captable.CompiledCapTable(arrays, compiled=False)
+
+    for exit_value in (0.0, 5.0, 50.0, 300.0, 1200.0, 5000.0):
+        expected = compiled.payoffs_at(exit_value)
+        actual = direct.payoffs_at(exit_value)
+        assert list(actual) == list(expected)
+        for party, data in expected.items():
+            assert actual[party] == pytest.approx(data, abs=1e-9)
+
+    max_exit = compiled.breakpoints[-1] * 1.5 + 1.0
+    x, values = direct.exact_curve(max_exit)
+    expected_x, expected_values = compiled.exact_curve(max_exit)
+    np.testing.assert_array_equal(x, expected_x)
+    np.testing.assert_allclose(values, expected_values, rtol=1e-9, atol=1e-9)
+
+
+def test_zero_share_round_is_ignored():
+    """주식수 0인 활성 라운드는 비활성 라운드와 같음 (RV가 다른 시리즈의 전환포인트에 더해지지 않음)"""
+    rounds = random_rounds(4, seed=3)
+    empty = RoundInput(name='Empty', active=True, investment=80, shares=0)
+    inactive = RoundInput(name='Empty', active=False, investment=80, shares=3e6)
+
+    assert captable.calculate_conversion_points(rounds + [empty], FOUNDERS_SHARES) == \
+        captable.calculate_conversion_points(rounds + [inactive], FOUNDERS_SHARES)
+
+    exits = [0.0, 40.0, 150.0, 600.0, 2500.0]
+    with_empty = captable.calculate_exit_payoffs_batch(exits, rounds + [empty], FOUNDERS_SHARES)
+    without = captable.calculate_exit_payoffs_batch(exits, rounds, FOUNDERS_SHARES)
+    assert with_empty['parties'][-1] == 'Empty'
+    assert not with_empty['합계'][-1].any()
+    for k in ('상환', '참가', '전환', '합계'):
+        np.testing.assert_array_equal(with_empty[k][:-1], without[k])
+
+
+def baseline_exit_payoffs(exit_value, rounds, founders_shares):
+    """기존(baseline) 스칼라 구현: 비참가적 라운드만, RVPS 역순 상환 후 지분 배분"""
+    cp_data = captable.calculate_conversion_points(rounds, founders_shares)
+    order = sorted(cp_data, key=lambda name: cp_data[name]['rvps'])
+    converted = [name for name in order if exit_value >= cp_data[name]['conversion_point']]
+
+    payoffs = {}
+    remaining = exit_value
+    for name in reversed(order):
+        if name not in converted:
+            payout = min(cp_data[name]['rv'], remaining)
+            payoffs[name] = payout
+            remaining = max(0, remaining - payout)
+    total_shares = founders_shares + sum(cp_data[name]['shares'] for name in converted)
+    payoffs['창업자'] = founders_shares / total_shares * remaining
+    for name in converted:
+        payoffs[name] = cp_data[name]['shares'] / total_shares * remaining
+    return payoffs
+
+
+def equivalence_exits(table, rng):
+    """breakpoint 자체, 그 바로 앞/뒤, 구간 내부 임의 점, 마지막 breakpoint 너머"""
+    bp = table.breakpoints
+    inner = bp[1:]
+    return np.concatenate([
+        bp, inner * (1 - 1e-7), inner * (1 + 1e-7),
+        [rng.uniform(0, bp[-1] * 2 + 10) for _ in range(50)],
+    ])
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_compiled_table_matches_waterfall(seed):
+    rng = random.Random(seed)
+    rounds = random_rounds(rng.randint(1, 15), seed, participating=0.3)
+    table = captable.compile_cap_table(rounds, FOUNDERS_SHARES)
+    exits = equivalence_exits(table, rng)
+
+    expected = captable.calculate_exit_payoffs_batch(exits, rounds, FOUNDERS_SHARES)
+    actual = table.evaluate(exits)
+    for k in table.COMPONENTS:
+        np.testing.assert_allclose(actual[k], expected[k], rtol=1e-9, atol=1e-9)
+
+    index = {p: i for i, p in enumerate(expected['parties'])}
+    for j, exit_value in enumerate(exits[::7]):
+        for party, data in table.payoffs_at(exit_value).items():
+            for k, value in data.items():
+                assert value == pytest.approx(expected[k][index[party], j * 7], rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_compiled_table_matches_baseline(seed):
+    rng = random.Random(seed)
+    rounds = random_rounds(rng.randint(1, 15), seed)
+    table = captable.compile_cap_table(rounds, FOUNDERS_SHARES)
+
+    for exit_value in equivalence_exits(table, rng):
+        actual = table.payoffs_at(exit_value)
+        expected = baseline_exit_payoffs(exit_value, rounds, FOUNDERS_SHARES)
+        assert set(actual) == set(expected)
+        for party, value in expected.items():
+            assert actual[party]['합계'] == pytest.approx(value, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_exact_curve_matches_waterfall(seed):
+    rounds = random_rounds(random.Random(seed).randint(1, 15), seed, participating=0.3)
+    table = captable.compile_cap_table(rounds, FOUNDERS_SHARES)
+    x, values = table.exact_curve(table.breakpoints[-1] * 1.5 + 1.0)
+
+    expected = captable.calculate_exit_payoffs_batch(x, rounds, FOUNDERS_SHARES)['합계']
+    np.testing.assert_allclose(values, expected, rtol=1e-9, atol=1e-9)
+
+
+def waterfall_totals(arrays, exit_values):
+    """창업자 + 클래스별 합계 수령액 (CompiledCapTable 기본 parties 순서)"""
+    w = arrays.waterfall(exit_values)
+    return np.vstack([w['founders'], w['redeem'] + w['participate'] + w['convert']])
+
+
+@pytest.mark.parametrize('compiled', [True, False])
+@pytest.mark.parametrize('seed', range(10))
+def test_exact_curve_jumps_match_one_sided_limits(seed, compiled):
+    """
+    불연속 지점에서 exact_curve의 첫 값은 왼쪽 극한, 둘째 값은 그 점의 waterfall 값
+    (전환포인트를 손익분기점보다 앞당겨 전환 시 수령액이 점프하게 만듦)
+    """
+    rounds = random_rounds(random.Random(seed).randint(1, 15), seed)
+    arrays = captable.CapTableArrays.from_rounds(rounds, FOUNDERS_SHARES)
+    arrays.conversion_point = arrays.conversion_point * 0.8
+    table = captable.CompiledCapTable(arrays, compiled=compiled)
+    x, values = table.exact_curve(table.breakpoints[-1] * 1.5 + 1.0)
+
+    duplicated = np.flatnonzero(np.diff(x) == 0)
+    assert len(duplicated) > 0
+    right = np.setdiff1d(np.arange(len(x)), duplicated)
+    np.testing.assert_allclose(values[:, right], waterfall_totals(arrays, x[right]),
+                               rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(values[:, duplicated],
+                               waterfall_totals(arrays, x[duplicated] * (1 - 1e-12)),
+                               rtol=1e-6, atol=1e-6)
+
+
+# =============================================================================
+# 대규모 Cap Table (1,000+ 클래스)
+# =============================================================================
+def reference_conversion_points(arrays):
+    """참가 클래스마다 후순위 클래스 전체를 갱신하는 O(n·p) 전환포인트 (기존 구현)"""
+    n = len(arrays)
+    threshold = arrays.conversion_value / arrays.shares
+    s = arrays.shares[arrays.order]
+    rv = arrays.redemption_value[arrays.order]
+    price = threshold[arrays.order]
+    conversion_point = price * (arrays.founders_shares + np.cumsum(s)) + rv.sum() - np.cumsum(rv)
+    for j in np.flatnonzero(arrays.participating):
+        later = np.arange(n) < arrays.rank[j]
+        conversion_point += np.where(later, np.minimum(arrays.shares[j] * price, arrays.headroom[j]), 0.0)
+    conversion_point[~np.isfinite(price)] = np.inf
+    result = np.empty(n)
+    result[arrays.order] = conversion_point
+    return result
+
+
+def test_large_table_conversion_points_match_reference():
+    rounds = random_rounds(1000, seed=0, participating=0.5)
+    arrays = captable.CapTableArrays.from_rounds(rounds, FOUNDERS_SHARES)
+    np.testing.assert_allclose(arrays.conversion_point, reference_conversion_points(arrays), rtol=1e-9)
+
+
+def test_large_table_waterfall_is_linear_between_breakpoints():
+    """꺾이는 점 사이 중간점의 수령액 = 양 끝 평균 (빠진 꺾이는 점이 없음)"""
+    rounds = random_rounds(2000, seed=0, participating=0.5)
+    arrays = captable.CapTableArrays.from_rounds(rounds, FOUNDERS_SHARES)
+    bp = np.append(arrays.breakpoints(), arrays.breakpoints()[-1] * 1.5)
+    assert len(bp) > 2000
+
+    def totals(points):
+        out = np.empty((len(arrays) + 1, len(points)))
+        for cols, w in arrays.waterfall_blocks(points):
+            out[0, cols] = w['founders']
+            out[1:, cols] = w['redeem'] + w['participate'] + w['convert']
+        return out
+
+    ends = totals(bp)
+    mid = totals((bp[:-1] + bp[1:]) / 2)
+    np.testing.assert_allclose(mid, (ends[:, :-1] + ends[:, 1:]) / 2, rtol=1e-7, atol=1e-7)
+
+
+def test_large_table_is_evaluated_without_segment_table():
+    rounds = random_rounds(2000, seed=0, participating=0.5)
+    table = captable.compile_cap_table(rounds, FOUNDERS_SHARES)
+    assert not table.compiled
+    assert not hasattr(table, 'slopes')
+
+    exit_value = float(table.breakpoints[len(table.breakpoints) // 2])
+    w = table.arrays.waterfall([exit_value])
+    payoffs = captable.calculate_exit_payoffs(exit_value, rounds, FOUNDERS_SHARES)
+    assert payoffs['창업자']['합계'] == pytest.approx(w['founders'][0])
+    for i, name in enumerate(table.arrays.names):
+        assert payoffs[name]['합계'] == pytest.approx(
+            w['redeem'][i, 0] + w['participate'][i, 0] + w['convert'][i, 0], abs=1e-9)
+
+    data = captable.exit_diagram_data(table)
+    assert data['payoffs'].shape == (2001, len(data['exit_values']))
+    np.testing.assert_allclose(data['payoffs'].sum(axis=0), data['exit_values'], rtol=1e-9)
+
+
+def test_large_table_breakpoints_scale():
+    """4,000 클래스의 전환포인트 + 꺾이는 점 (정렬/누적합, 이전 구현은 수십 초)"""
+    rounds = random_rounds(4000, seed=0, participating=0.5)
+    start = time.perf_counter()
+    arrays = captable.CapTableArrays.from_rounds(rounds, FOUNDERS_SHARES)
+    arrays.breakpoints()
+    assert time.perf_counter() - start < 2.0
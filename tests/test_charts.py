@@ -0,0 +1,49 @@
+"""
+Exit Diagram: Series/Composite Diagram이 payoff 행렬 하나를 공유
+"""
+
+import numpy as np
+import pytest
+
+from conftest import FOUNDERS_SHARES, mixed_rounds
+
+pytest.importorskip('plotly')
+
+from termsheet import FundInput, GlobalInput, RoundInput, calculate_exit_payoffs_batch
+from termsheet.captable import compile_cap_table, exit_diagram_data
+from termsheet.charts import create_exit_diagram, create_series_diagrams
+from termsheet.depgraph import build_termsheet_graph
+
+
+def test_both_diagrams_draw_the_shared_payoff_matrix():
+    rounds = mixed_rounds()
+    data = exit_diagram_data(compile_cap_table(rounds, FOUNDERS_SHARES))
+    composite = create_exit_diagram(rounds, FOUNDERS_SHARES, data=data)
+    series = create_series_diagrams(rounds, FOUNDERS_SHARES, data=data)
+
+    assert [t.name for t in composite.data] == data['parties']
+    assert [t.name for t in series.data] == data['parties']
+    for k, payoff in enumerate(data['payoffs']):
+        for fig in (composite, series):
+            np.testing.assert_array_equal(fig.data[k].x, data['exit_values'])
+            np.testing.assert_array_equal(fig.data[k].y, payoff)
+
+    # 공유 행렬은 waterfall 직접 계산과 같은 값
+    direct = calculate_exit_payoffs_batch(data['exit_values'], rounds, FOUNDERS_SHARES)
+    rows = [direct['parties'].index(p) for p in data['parties']]
+    np.testing.assert_allclose(data['payoffs'], direct['합계'][rows], rtol=1e-9, atol=1e-9)
+
+
+def test_graph_computes_diagram_data_once_for_both_figures():
+    graph = build_termsheet_graph(shared=None)
+    graph.update(mixed_rounds(), GlobalInput(), FundInput())
+    graph['series_figure']
+    graph['exit_figure']
+    assert graph.recomputes['diagram_data'] == 1
+    assert graph.recomputes['cap_table'] == 1
+
+
+def test_no_valid_series_gives_empty_figures():
+    rounds = [RoundInput(name='Series A')]
+    assert len(create_exit_diagram(rounds, FOUNDERS_SHARES).data) == 0
+    assert len(create_series_diagrams(rounds, FOUNDERS_SHARES).data) == 0
@@ -0,0 +1,128 @@
+"""
+의존성 그래프: 바뀐 입력 필드에 의존하는 노드만 다시 계산
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from termsheet import FundInput, GlobalInput, RoundInput
+from termsheet.depgraph import DependencyGraph, build_termsheet_graph
+from termsheet.store import ResultStore
+
+from conftest import plain_rounds
+
+VALUE_NODES = ('conversion_order', 'ownership', 'cap_table', 'conversion_points',
+               'partial_valuations', 'gp_lp', 'diagram_data')
+FIGURE_NODES = ('ownership_figure', 'series_figure', 'exit_figure')
+
+
+def computed_graph(nodes=VALUE_NODES):
+    graph = build_termsheet_graph(shared=None)
+    graph.update(plain_rounds(2), GlobalInput(), FundInput())
+    for name in nodes:
+        graph[name]
+    return graph
+
+
+def recompute_counts(graph, nodes):
+    return {name: graph.recomputes[name] for name in nodes}
+
+
+def test_fund_change_recomputes_only_gp_lp():
+    graph = computed_graph()
+    before = recompute_counts(graph, VALUE_NODES)
+
+    stale = graph.update(plain_rounds(2), GlobalInput(), FundInput(management_fee_rate=2.5))
+    assert stale == {'gp_lp'}
+    for name in VALUE_NODES:
+        graph[name]
+
+    after = recompute_counts(graph, VALUE_NODES)
+    assert after['gp_lp'] == before['gp_lp'] + 1
+    assert {k: v for k, v in after.items() if k != 'gp_lp'} == \
+        {k: v for k, v in before.items() if k != 'gp_lp'}
+
+
+def test_volatility_change_keeps_cap_table_and_diagrams():
+    graph = computed_graph()
+    stale = graph.update(plain_rounds(2), GlobalInput(volatility=60), FundInput())
+    assert stale == {'partial_valuations', 'gp_lp'}
+    assert graph.is_valid('cap_table') and graph.is_valid('diagram_data')
+
+
+def test_volatility_change_does_not_rebuild_figures():
+    pytest.importorskip('plotly')
+    graph = computed_graph(VALUE_NODES + FIGURE_NODES)
+    before = recompute_counts(graph, FIGURE_NODES + ('diagram_data',))
+
+    graph.update(plain_rounds(2), GlobalInput(volatility=60), FundInput())
+    for name in FIGURE_NODES:
+        graph[name]
+    assert recompute_counts(graph, FIGURE_NODES + ('diagram_data',)) == before
+
+
+def test_round_change_invalidates_downstream_and_unchanged_input_nothing():
+    graph = computed_graph()
+    assert graph.update(plain_rounds(2), GlobalInput(), FundInput()) == set()
+
+    rounds = plain_rounds(2)
+    rounds[1] = replace(rounds[1], shares=2_500_000)
+    stale = graph.update(rounds, GlobalInput(), FundInput())
+    assert {'cap_table', 'conversion_points', 'partial_valuations', 'gp_lp', 'diagram_data',
+            'series_figure', 'exit_figure', 'ownership', 'ownership_figure'} <= stale
+
+    # 표시용 필드(security_type)는 아무것도 무효화하지 않음
+    rounds[0] = replace(rounds[0], security_type='CPS')
+    assert graph.update(rounds, GlobalInput(), FundInput()) == set()
+
+
+def test_invalidate_and_registration_errors():
+    graph = computed_graph()
+    graph.invalidate('cap_table')
+    assert not graph.is_valid('gp_lp') and not graph.is_valid('diagram_data')
+    assert graph.is_valid('conversion_order') and graph.is_valid('ownership')
+
+    with pytest.raises(ValueError):
+        graph.node('orphan', deps=('missing',))
+    with pytest.raises(ValueError):
+        graph.node('bad_field', fields=('global.nope',))(lambda inputs: None)
+    with pytest.raises(RuntimeError):
+        DependencyGraph().get('anything')
+
+
+def test_large_cap_table_nodes_skip_segment_table():
+    """클래스 수가 COMPILE_MAX_CLASSES를 넘으면 cap_table/diagram_data 노드가 구간표 없이 계산"""
+    rounds = [
+        RoundInput(name=f'Class {i + 1:04d}', active=True, investment=10 + i % 50,
+                   shares=1_000_000 + 1_000 * i, participating=i % 2 == 0)
+        for i in range(1000)
+    ]
+    graph = build_termsheet_graph(shared=None)
+    graph.update(rounds, GlobalInput(), FundInput())
+
+    cap_table = graph['cap_table']
+    assert not cap_table.compiled
+    assert set(graph['conversion_points']) == {r.name for r in rounds}
+    data = graph['diagram_data']
+    assert data['payoffs'].shape == (1001, len(data['exit_values']))
+    assert data['payoffs'].sum(axis=0) == pytest.approx(data['exit_values'], rel=1e-9)
+
+
+def test_stored_partial_valuations_ignore_unrelated_global_fields(tmp_path):
+    """exit_valuation만 다른 입력은 저장소 결과를 공유, 가격결정 필드/use_re가 바뀌면 새로 계산"""
+    store = ResultStore(str(tmp_path / 'results.sqlite'))
+
+    def fetch(g, use_re=True):
+        graph = build_termsheet_graph(use_re=use_re, store=store, shared=None)
+        graph.update(plain_rounds(2), g, FundInput())
+        return graph['partial_valuations']
+
+    first = fetch(GlobalInput(exit_valuation=300))
+    assert fetch(GlobalInput(exit_valuation=500)) == first
+    fetch(GlobalInput(exit_valuation=300, volatility=60))
+    fetch(GlobalInput(exit_valuation=300, founders_shares=2_000_000))
+    fetch(GlobalInput(exit_valuation=300), use_re=False)
+    stats = store.stats()
+    store.close()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 4, 4)
@@ -0,0 +1,84 @@
+"""
+작업 서비스: 사용자별 동시 실행 태스크 제한, 취소, 오류/중복 제출 처리
+(태스크는 spawn 워커에서 가져올 수 있는 표준 라이브러리 함수)
+"""
+
+import math
+import operator
+import time
+
+import pytest
+
+from termsheet.jobs import JobService, JobSpec
+
+TIMEOUT = 60
+
+
+@pytest.fixture(scope='module')
+def service():
+    svc = JobService(max_workers=2, per_user_limit=1)
+    yield svc
+    svc.shutdown()
+
+
+def sleeps(n: int, seconds: float = 0.5) -> JobSpec:
+    return JobSpec('sleep', [(time.sleep, (seconds,))] * n)
+
+
+def user_tasks(service, user):
+    """사용자의 (실행 중, 대기) 태스크 수"""
+    with service._lock:
+        return service._in_flight.get(user, 0), len(service._queues.get(user, ()))
+
+
+def test_per_user_limit_queues_tasks_without_blocking_other_users(service):
+    busy = service.submit('busy', sleeps(3))
+    assert user_tasks(service, 'busy') == (1, 2)
+    assert service.status(busy)['status'] == 'running'
+
+    # 다른 사용자는 busy의 대기열과 무관하게 바로 실행
+    other = service.submit('other', JobSpec('add', [(operator.add, (1, 2))]))
+    assert user_tasks(service, 'other') == (1, 0)
+    assert service.stats()['active_users'] == 2
+    assert service.wait(other, TIMEOUT) == 3
+
+    assert service.wait(busy, TIMEOUT) == [None, None, None]
+    info = service.status(busy)
+    assert (info['status'], info['completed'], info['progress']) == ('done', 3, 1.0)
+    assert user_tasks(service, 'busy') == (0, 0)
+
+
+def test_cancel_drops_queued_tasks_and_frees_the_user_slot(service):
+    job_id = service.submit('canceller', sleeps(4))
+    assert user_tasks(service, 'canceller') == (1, 3)
+
+    assert service.cancel(job_id)
+    assert service.status(job_id)['status'] == 'cancelled'
+    assert user_tasks(service, 'canceller')[1] == 0
+    assert service.wait(job_id, TIMEOUT) is None
+    assert not service.cancel(job_id)
+
+    # 실행 중이던 태스크가 끝나면 같은 사용자의 다음 작업이 실행됨
+    follow_up = service.submit('canceller', JobSpec('add', [(operator.add, (2, 3))]))
+    assert service.wait(follow_up, TIMEOUT) == 5
+    assert user_tasks(service, 'canceller') == (0, 0)
+
+
+def test_cancel_user_filters_by_kind(service):
+    keep = service.submit('multi', JobSpec('keep', [(operator.mul, (6, 7))]))
+    drop = service.submit('multi', sleeps(2))
+    assert service.cancel_user('multi', kind='sleep') == 1
+    assert service.status(drop)['status'] == 'cancelled'
+    assert service.wait(keep, TIMEOUT) == 42
+
+
+def test_same_key_returns_active_job_and_errors_are_reported(service):
+    first = service.submit('keyed', sleeps(1), key='inputs-1')
+    assert service.submit('keyed', sleeps(1), key='inputs-1') == first
+    assert service.submit('someone-else', sleeps(1), key='inputs-1') != first
+    service.wait(first, TIMEOUT)
+
+    failed = service.submit('keyed', JobSpec('sqrt', [(math.sqrt, (-1,))]))
+    assert service.wait(failed, TIMEOUT) is None
+    info = service.status(failed)
+    assert info['status'] == 'error' and info['error'].startswith('ValueError')
@@ -0,0 +1,59 @@
+"""
+Monte Carlo Exit 시뮬레이터: 시드 재현성, 워커 수와 무관한 결과, 해석해 교차검증
+"""
+
+import pytest
+
+from termsheet import GlobalInput, RoundInput
+from termsheet.montecarlo import cross_validate, simulate_exit_payoffs
+
+from conftest import FOUNDERS_SHARES, mixed_rounds
+
+N_PATHS = 20_000
+
+
+def simulate(payoff: str, seed: int, workers: int = 1):
+    return simulate_exit_payoffs(mixed_rounds(), FOUNDERS_SHARES, GlobalInput(), N_PATHS,
+                                 block_size=6_000, seed=seed, workers=workers, payoff=payoff)
+
+
+@pytest.mark.parametrize('payoff', ['waterfall', 'options'])
+def test_seed_reproduces_results(payoff):
+    assert simulate(payoff, seed=7) == simulate(payoff, seed=7)
+    assert simulate(payoff, seed=7) != simulate(payoff, seed=8)
+
+
+@pytest.mark.parametrize('payoff', ['waterfall', 'options'])
+def test_workers_do_not_change_results(payoff):
+    """블록별 시드가 SeedSequence에서 파생되므로 워커 수와 무관하게 같은 결과"""
+    assert simulate(payoff, seed=11, workers=2) == simulate(payoff, seed=11, workers=1)
+
+
+def test_waterfall_payoffs_add_up_to_discounted_exit_value():
+    """할인 Exit 가치의 기대값은 현재 기업가치 (위험중립) → 이해관계자 합계도 그 근처"""
+    g = GlobalInput()
+    result = simulate_exit_payoffs(mixed_rounds(), FOUNDERS_SHARES, g, N_PATHS, seed=3)
+    payoffs = result['payoffs']
+    assert list(payoffs) == ['창업자', 'Series A', 'Series B', 'Series C']
+    total = sum(p['mean'] for p in payoffs.values())
+    assert total == pytest.approx(g.current_valuation, rel=0.1)
+    for p in payoffs.values():
+        assert p['ci_low'] <= p['mean'] <= p['ci_high']
+
+
+def test_cross_validate_analytic_within_confidence_interval():
+    g = GlobalInput(volatility=60)
+    report = cross_validate(mixed_rounds(), FOUNDERS_SHARES, g, n_paths=200_000, seed=2024)
+
+    assert set(report) == {'Series A', 'Series B', 'Series C'}
+    for name, row in report.items():
+        assert row['within_ci'], (name, row)
+        assert abs(row['z_score']) < 2.576
+        assert row['stderr'] > 0
+        assert row['mc_waterfall'] > 0
+
+
+def test_no_active_series():
+    result = simulate_exit_payoffs([RoundInput(name='Series A')], FOUNDERS_SHARES, GlobalInput(),
+                                   1_000, seed=1, payoff='options')
+    assert result['payoffs'] == {}
@@ -0,0 +1,28 @@
+"""
+headless 패키지: import termsheet은 숫자 계산 코어만 로드
+"""
+
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _loaded_after(statement: str) -> set:
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                         check=True, cwd=ROOT)
+    return set(out.stdout.split())
+
+
+def test_import_loads_only_numeric_core():
+    loaded = _loaded_after('import termsheet')
+    for module in ('termsheet.depgraph', 'termsheet.store', 'termsheet.charts', 'sqlite3',
+                   'plotly', 'streamlit', 'pandas'):
+        assert module not in loaded
+
+
+def test_lazy_attributes_load_on_access():
+    loaded = _loaded_after('import termsheet; termsheet.DependencyGraph')
+    assert {'termsheet.depgraph', 'termsheet.store', 'sqlite3'} <= loaded
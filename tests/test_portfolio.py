@@ -0,0 +1,68 @@
+"""
+포트폴리오 모델: Carry는 펀드 전체 수익에 한 번 적용, 보유 시리즈 필터(가치 없는 시리즈 제외), 워커 수와 무관한 결과
+"""
+
+import pytest
+
+from termsheet import (
+    FundInput,
+    GlobalInput,
+    calculate_gp_lp_split,
+    calculate_partial_valuations,
+)
+from termsheet.portfolio import Portfolio, Position, value_portfolio
+
+from conftest import FOUNDERS_SHARES, plain_rounds
+
+
+def position(company: str, valuation: float, held=()):
+    return Position(company, plain_rounds(2), FOUNDERS_SHARES, GlobalInput(current_valuation=valuation),
+                    held_series=list(held))
+
+
+def test_carry_applies_to_fund_total_not_per_deal():
+    """승자 딜의 Carry가 패자 딜의 손실과 상계되어 딜별 Carry 합보다 작음"""
+    fund = FundInput()
+    portfolio = Portfolio(fund, [position('Winner', 2000.0), position('Loser', 5.0)])
+    result = value_portfolio(portfolio)
+
+    positions = {p['company']: p for p in result['positions']}
+    total_investment = sum(p['investment'] for p in positions.values())
+    total_value = sum(p['partial_val'] for p in positions.values())
+    assert total_investment == 140
+    expected = calculate_gp_lp_split(total_value, fund, total_investment)
+    for k, v in expected.items():
+        assert result['fund'][k] == pytest.approx(v)
+
+    per_deal_carry = sum(calculate_gp_lp_split(p['partial_val'], fund, p['investment'])['gp_carry']
+                         for p in positions.values())
+    assert 0 < result['fund']['gp_carry'] < per_deal_carry
+    assert sum(p['weight_pct'] for p in positions.values()) == pytest.approx(100)
+
+
+def test_held_series_limits_position():
+    result = value_portfolio(Portfolio(FundInput(), [position('Co', 300.0, held=['Series B', 'Unknown'])]))
+    p = result['positions'][0]
+    expected = calculate_partial_valuations(position('Co', 300.0).rounds, FOUNDERS_SHARES,
+                                            GlobalInput(current_valuation=300.0))
+    assert list(p['series']) == ['Series B']
+    assert p['investment'] == 50
+    assert p['partial_val'] == pytest.approx(expected['Series B'])
+
+
+def test_held_inactive_or_zero_share_series_is_excluded():
+    """가치가 없는 보유 시리즈의 투자금액이 포지션에 더해지지 않음"""
+    rounds = plain_rounds(3)
+    rounds[0].active = False
+    rounds[2].shares = 0
+    held = Position('Co', rounds, FOUNDERS_SHARES, GlobalInput(current_valuation=300.0),
+                    held_series=['Series A', 'Series B', 'Series C'])
+    p = value_portfolio(Portfolio(FundInput(), [held]))['positions'][0]
+    assert list(p['series']) == ['Series B']
+    assert p['investment'] == 50
+    assert p['partial_val'] == pytest.approx(p['series']['Series B']['partial_val']) and p['partial_val'] > 0
+
+
+def test_workers_do_not_change_result():
+    portfolio = Portfolio(FundInput(), [position(f'Co {i}', 20.0 * (i + 1)) for i in range(6)])
+    assert value_portfolio(portfolio, workers=2) == value_portfolio(portfolio, workers=1)
@@ -0,0 +1,101 @@
+"""
+Prewarmer: 끝나거나 취소된 예약은 대기 목록에서 제거, 앱이 조회하는 키로 결과 기록, 입력 변경 시 이전 예약 취소
+"""
+
+import pytest
+
+from termsheet.cache import SharedCache
+from termsheet.depgraph import build_termsheet_graph
+from termsheet.jobs import JobService
+from termsheet.models import FundInput, GlobalInput, RoundInput
+from termsheet.prewarm import Prewarmer
+from termsheet.store import ResultStore, content_hash
+
+from conftest import plain_rounds
+
+
+def _run_pending(prewarmer: Prewarmer, user: str) -> None:
+    pending = prewarmer._pending.get(user)
+    if pending is not None:  # 이미 끝났으면 제거된 상태
+        pending.timer.join()
+
+
+def test_finished_entries_are_dropped():
+    prewarmer = Prewarmer(service=None, delay=0.0)
+    rounds = [RoundInput(name='Series A')]  # 활성 라운드 없음 → 계산할 것 없이 완료
+    prewarmer.schedule('user-1', rounds, GlobalInput(), FundInput())
+    _run_pending(prewarmer, 'user-1')
+
+    assert prewarmer.stats() == {'scheduled': 1, 'completed': 1, 'cancelled': 0, 'pending': 0}
+    assert prewarmer._pending == {}
+
+    # 같은 입력은 다시 예약하지 않음
+    prewarmer.schedule('user-1', rounds, GlobalInput(), FundInput())
+    assert prewarmer.stats()['scheduled'] == 1
+
+
+def test_cancelled_entries_are_dropped():
+    prewarmer = Prewarmer(service=None, delay=60.0)
+    prewarmer.schedule('user-1', [RoundInput(name='Series A')], GlobalInput(), FundInput())
+    prewarmer.cancel('user-1')
+
+    assert prewarmer.stats() == {'scheduled': 1, 'completed': 0, 'cancelled': 1, 'pending': 0}
+    assert prewarmer._pending == {}
+
+
+@pytest.fixture
+def service():
+    svc = JobService(max_workers=1, per_user_limit=1)
+    yield svc
+    svc.shutdown()
+
+
+def test_completed_prewarm_is_read_by_the_app(service, tmp_path):
+    """완료 후 세션 그래프의 노드 조회와 Breakeven 버튼의 저장소 조회가 모두 적중"""
+    store = ResultStore(str(tmp_path / 'results.sqlite'))
+    shared = SharedCache()
+    prewarmer = Prewarmer(service, store, shared=shared, delay=0.0)
+    rounds, g, fund = plain_rounds(), GlobalInput(), FundInput()
+    prewarmer.schedule('user-1', rounds, g, fund)
+    _run_pending(prewarmer, 'user-1')
+    assert prewarmer.stats() == {'scheduled': 1, 'completed': 1, 'cancelled': 0, 'pending': 0}
+
+    # render_breakeven_section과 같은 키
+    breakevens = store.get(content_hash('breakeven', rounds, g, fund))
+    assert set(breakevens) == {r.name for r in rounds}
+
+    # 세션 그래프 (app.get_graph와 같은 옵션): 공유 캐시에서 가져오므로 다시 계산하지 않음
+    graph = build_termsheet_graph(store=store, shared=shared)
+    graph.update(plain_rounds(), GlobalInput(), FundInput())
+    for name in prewarmer.nodes:
+        graph[name]
+    assert not any(graph.recomputes.values())
+
+    # 공유 캐시가 비어도 Partial Valuation은 저장소에서 적중
+    before = store.stats()
+    cold = build_termsheet_graph(store=store, shared=None)
+    cold.update(plain_rounds(), GlobalInput(), FundInput())
+    cold['partial_valuations']
+    after = store.stats()
+    store.close()
+    assert (after['hits'], after['misses']) == (before['hits'] + 1, before['misses'])
+
+
+def test_rescheduling_within_delay_cancels_earlier_timer(monkeypatch):
+    prewarmer = Prewarmer(service=None, delay=0.3)
+    runs = []
+    monkeypatch.setattr(prewarmer, '_prewarm',
+                        lambda user, pending, rounds, g, fund: runs.append(rounds[0].investment) or True)
+
+    first_rounds = plain_rounds()
+    prewarmer.schedule('user-1', first_rounds, GlobalInput(), FundInput())
+    first = prewarmer._pending['user-1']
+    edited = plain_rounds()
+    edited[0].investment = 25
+    prewarmer.schedule('user-1', edited, GlobalInput(), FundInput())
+    _run_pending(prewarmer, 'user-1')
+    first.timer.join()
+
+    assert first.cancelled.is_set()
+    assert runs == [25]
+    assert prewarmer.stats() == {'scheduled': 2, 'completed': 1, 'cancelled': 1, 'pending': 0}
@@ -0,0 +1,83 @@
+"""
+옵션 가격 모델: 스칼라 버전과 배열 버전, RE 옵션 해석해와 Gauss-Laguerre 적분이 같은 값을 주는지 검사
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from termsheet.pricing import (
+    LAGUERRE_MAX_NODES,
+    black_scholes_call,
+    black_scholes_call_array,
+    norm_cdf,
+    norm_cdf_array,
+    re_option_call,
+    re_option_call_array,
+)
+
+# 예외 구간(T ≤ 0, sigma ≤ 0, S ≤ 0, K ≤ 0)과 일반 값을 모두 포함하는 격자
+S_VALUES = (-10.0, 0.0, 1e-6, 50.0, 100.0, 1e4)
+K_VALUES = (-5.0, 0.0, 1e-6, 80.0, 100.0, 250.0)
+T_VALUES = (-1.0, 0.0, 0.25, 5.0)
+R_VALUES = (0.0, 0.035)
+SIGMA_VALUES = (-0.2, 0.0, 0.3, 1.5)
+
+
+def test_norm_cdf_array_matches_scalar():
+    x = np.concatenate([np.linspace(-40, 40, 801), [0.0, -0.0, 1e-12, -1e-12]])
+    expected = np.array([norm_cdf(v) for v in x])
+    np.testing.assert_allclose(norm_cdf_array(x), expected, rtol=0, atol=1e-15)
+
+
+def test_black_scholes_call_array_matches_scalar():
+    grid = np.array(list(itertools.product(S_VALUES, K_VALUES, T_VALUES, R_VALUES, SIGMA_VALUES)))
+    S, K, T, r, sigma = grid.T
+    expected = np.array([black_scholes_call(*point) for point in grid])
+    np.testing.assert_allclose(black_scholes_call_array(S, K, T, r, sigma), expected,
+                               rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('S, K, T, r, sigma, expected', [
+    (100.0, 80.0, 0.0, 0.035, 0.3, 20.0),     # T ≤ 0 → 내재가치
+    (100.0, 120.0, 5.0, 0.035, 0.0, 0.0),     # sigma ≤ 0 → 내재가치
+    (0.0, 80.0, 5.0, 0.035, 0.3, 0.0),        # S ≤ 0 → 내재가치
+    (100.0, 0.0, 5.0, 0.035, 0.3, 100.0),     # K ≤ 0 → S
+])
+def test_black_scholes_call_edge_cases(S, K, T, r, sigma, expected):
+    assert black_scholes_call(S, K, T, r, sigma) == expected
+    assert black_scholes_call_array(S, K, T, r, sigma) == expected
+
+
+def test_black_scholes_call_array_broadcasts():
+    K = np.linspace(10, 500, 50)
+    values = black_scholes_call_array(100.0, K[:, None], 5.0, 0.035, np.array([0.3, 0.9]))
+    assert values.shape == (50, 2)
+    assert np.all(np.diff(values, axis=0) <= 0)  # 행사가격이 높을수록 가치 감소
+
+
+@pytest.mark.parametrize('H', [0.5, 5.0, 10.0])
+@pytest.mark.parametrize('sigma', [0.2, 0.8, 1.5])
+def test_re_option_closed_form_matches_laguerre(H, sigma):
+    S = np.array([1.0, 50.0, 100.0, 150.0, 1000.0])
+    K = np.array([[50.0], [100.0], [200.0]])
+    closed = re_option_call_array(S, K, H, 0.035, sigma)
+    errors = []
+    for n_nodes in (32, 64, LAGUERRE_MAX_NODES):
+        quadrature = re_option_call_array(S, K, H, 0.035, sigma, method='laguerre', n_nodes=n_nodes)
+        errors.append(np.abs(quadrature - closed).max())
+    np.testing.assert_allclose(quadrature, closed, rtol=5e-4, atol=1e-3)
+    assert errors[-1] <= errors[0]  # 노드가 많을수록 해석해에 수렴
+
+    for s, k in [(100.0, 50.0), (100.0, 100.0), (100.0, 200.0)]:
+        assert re_option_call(s, k, H, 0.035, sigma, method='laguerre') == \
+            pytest.approx(re_option_call(s, k, H, 0.035, sigma), rel=1e-3)
+
+
+@pytest.mark.parametrize('n_nodes', [0, -1, LAGUERRE_MAX_NODES + 1, 200])
+def test_re_option_rejects_invalid_node_count(n_nodes):
+    with pytest.raises(ValueError, match='n_nodes'):
+        re_option_call_array(100.0, 80.0, 5.0, 0.035, 0.3, method='laguerre', n_nodes=n_nodes)
+    with pytest.raises(ValueError, match='n_nodes'):
+        re_option_call(100.0, 80.0, 0.0, 0.035, 0.3, method='laguerre', n_nodes=n_nodes)
@@ -0,0 +1,107 @@
+"""
+계측: 중첩 스팬 기록, 비활성 시 @traced 투명성, 스레드별 기록 분리, cProfile 중복 사용 방지
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import pytest
+
+from termsheet import profiling
+from termsheet.profiling import TRACER, span, start_cprofile, start_span, traced
+
+
+@pytest.fixture(autouse=True)
+def tracer_off():
+    TRACER.disable()
+    TRACER.reset()
+    yield
+    TRACER.disable()
+    TRACER.reset()
+
+
+@traced
+def add(a, b=0):
+    """두 수의 합"""
+    return a + b
+
+
+@traced(name='custom.sleep')
+def nap(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def by_name():
+    return {row['name']: row for row in TRACER.report()}
+
+
+def test_nested_spans_record_parent_and_child():
+    TRACER.enable()
+    with span('parent'):
+        with span('child'):
+            nap(0.01)
+        end = start_span('sibling')
+        time.sleep(0.005)
+        end()
+        add(1)
+
+    rows = by_name()
+    assert set(rows) == {'parent', 'child', 'sibling', 'custom.sleep', 'add'}
+    assert rows['parent']['calls'] == rows['child']['calls'] == 1
+    assert rows['custom.sleep']['total_ms'] >= 10
+    assert rows['child']['total_ms'] >= rows['custom.sleep']['total_ms']
+    assert rows['parent']['total_ms'] >= rows['child']['total_ms'] + rows['sibling']['total_ms']
+    assert TRACER.report()[0]['name'] == 'parent'  # 누적 시간 내림차순
+
+
+def test_span_records_even_when_block_raises():
+    TRACER.enable()
+    with pytest.raises(RuntimeError):
+        with span('failing'):
+            raise RuntimeError
+    assert by_name()['failing']['calls'] == 1
+
+
+def test_traced_is_transparent_when_disabled():
+    assert add(2, b=3) == 5
+    with span('ignored'):
+        start_span('ignored too')()
+    assert TRACER.report() == []
+    assert add.__name__ == 'add' and add.__doc__ == '두 수의 합'
+
+    TRACER.enable()
+    assert add(2, b=3) == 5
+    assert by_name()['add']['calls'] == 1
+
+
+def test_tracers_in_different_threads_do_not_mix():
+    def session(label, calls):
+        TRACER.enable()
+        for _ in range(calls):
+            with span(label):
+                add(1)
+        return {row['name']: row['calls'] for row in TRACER.report()}
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        a = pool.submit(session, 'session A', 3)
+        b = pool.submit(session, 'session B', 5)
+        assert a.result() == {'session A': 3, 'add': 3}
+        assert b.result() == {'session B': 5, 'add': 5}
+
+    # 다른 스레드에서 켠 계측은 현재 스레드에 영향 없음
+    assert not TRACER.enabled
+    assert TRACER.report() == []
+
+
+def test_start_cprofile_skips_when_profiler_already_active(monkeypatch):
+    profiler = start_cprofile()
+    assert profiler is not None
+    profiler.disable()
+
+    class Busy:
+        def enable(self):
+            raise ValueError('Another profiling tool is already active')
+
+    monkeypatch.setattr(profiling.cProfile, 'Profile', Busy)
+    assert start_cprofile() is None
@@ -0,0 +1,121 @@
+"""
+시나리오 비교: 기준 시나리오 대비 차이, 내용 기준 캐시/저장소 재사용
+"""
+
+import pytest
+
+from termsheet import CAP_TABLE_CACHE, FundInput, GlobalInput, RoundInput
+from termsheet import scenarios
+from termsheet.batch import analyze_inputs
+from termsheet.store import ResultStore
+
+from conftest import FOUNDERS_SHARES, plain_rounds
+
+
+def base_scenario():
+    g = GlobalInput(founders_shares=FOUNDERS_SHARES, exit_valuation=300)
+    return scenarios.make_scenario('기준안', plain_rounds(), g, FundInput(committed_capital=500))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    CAP_TABLE_CACHE.clear()
+    yield
+    CAP_TABLE_CACHE.clear()
+
+
+def count_analyses(monkeypatch):
+    calls = []
+
+    def counting(s):
+        calls.append(s.name)
+        return analyze_inputs(s.rounds, s.global_input.founders_shares, s.global_input, s.fund_input)
+
+    monkeypatch.setattr(scenarios, '_analyze', counting)
+    return calls
+
+
+def test_diffs_are_relative_to_baseline():
+    base = base_scenario()
+    alt = scenarios.scenario_variant(base, '2x 청산', {'Series A': {'liquidation_pref': 2.0}},
+                                     global_changes={'volatility': 60})
+    rows = scenarios.compare_scenarios(scenarios.evaluate_scenarios([base, alt]), baseline='기준안')
+    assert [(r['scenario'], r['series']) for r in rows] == \
+        [(s, n) for s in ('기준안', '2x 청산') for n in ('Series A', 'Series B', 'Series C')]
+
+    expected = {
+        s.name: scenarios._series_metrics(analyze_inputs(
+            s.rounds, FOUNDERS_SHARES, s.global_input, s.fund_input))
+        for s in (base, alt)
+    }
+    for row in rows:
+        for metric in scenarios.SCENARIO_METRICS:
+            value = expected[row['scenario']][row['series']][metric]
+            assert row[metric] == pytest.approx(value)
+            assert row[f'{metric}_diff'] == pytest.approx(value - expected['기준안'][row['series']][metric])
+    assert all(r['partial_val_diff'] == 0 for r in rows if r['scenario'] == '기준안')
+
+    by_series = {r['series']: r for r in rows if r['scenario'] == '2x 청산'}
+    assert by_series['Series A']['partial_val_diff'] > 0
+
+
+def test_series_missing_from_baseline_and_error_scenarios():
+    base = base_scenario()
+    extra = scenarios.make_scenario(
+        '후속 투자', base.rounds + [RoundInput(name='Series D', active=True, investment=40, shares=500_000)],
+        base.global_input, base.fund_input)
+    empty = scenarios.make_scenario('빈 딜', [], base.global_input, base.fund_input)
+    results = scenarios.evaluate_scenarios([base, extra, empty])
+    assert 'error' in results['빈 딜']
+
+    rows = scenarios.compare_scenarios(results, baseline='기준안')
+    assert {r['scenario'] for r in rows} == {'기준안', '후속 투자'}
+    new_series = next(r for r in rows if r['series'] == 'Series D')
+    assert new_series['partial_val'] is not None
+    assert all(new_series[f'{m}_diff'] is None for m in scenarios.SCENARIO_METRICS)
+
+    with pytest.raises(ValueError):
+        scenarios.compare_scenarios(results, baseline='없는 시나리오')
+    with pytest.raises(ValueError):
+        scenarios.scenario_variant(base, '오타', {'Series Z': {'shares': 1}})
+
+
+def test_variants_are_independent_copies():
+    base = base_scenario()
+    alt = scenarios.scenario_variant(base, '주식수 변경', {'Series B': {'shares': 4_000_000}})
+    assert base.rounds[1].shares == 2_000_000 and alt.rounds[1].shares == 4_000_000
+    alt.rounds[0].investment = 99
+    assert base.rounds[0].investment == 20
+
+
+def test_same_content_is_evaluated_once(monkeypatch):
+    calls = count_analyses(monkeypatch)
+    base = base_scenario()
+    renamed = scenarios.scenario_variant(base, '이름만 다름')
+    alt = scenarios.scenario_variant(base, '1.5x 청산', {'Series B': {'liquidation_pref': 1.5}})
+
+    results = scenarios.evaluate_scenarios([base, renamed, alt])
+    assert calls == ['기준안', '1.5x 청산']
+    assert results['이름만 다름'] == results['기준안']
+
+    scenarios.evaluate_scenarios([alt, base])
+    assert calls == ['기준안', '1.5x 청산']
+
+
+def test_store_results_are_reused_after_cache_clear(monkeypatch, tmp_path):
+    calls = count_analyses(monkeypatch)
+    store = ResultStore(str(tmp_path / 'results.sqlite'))
+    base = base_scenario()
+    alt = scenarios.scenario_variant(base, '2x 청산', {'Series A': {'liquidation_pref': 2.0}})
+
+    first = scenarios.evaluate_scenarios([base, alt], store=store)
+    # 변형마다 저장소 조회는 한 번 (미스 후 재조회 없음)
+    assert (store.stats()['hits'], store.stats()['misses']) == (0, 2)
+    CAP_TABLE_CACHE.clear()
+    second = scenarios.evaluate_scenarios([base, alt], store=store)
+    stats = store.stats()
+    store.close()
+
+    assert calls == ['기준안', '2x 청산']
+    assert (stats['hits'], stats['misses']) == (2, 2)
+    assert second == first
@@ -0,0 +1,55 @@
+"""
+민감도 그리드: 격자점마다 calculate_partial_valuations / calculate_gp_lp_split과 같은 값
+"""
+
+from dataclasses import replace
+import itertools
+
+import numpy as np
+import pytest
+
+from termsheet import (
+    FundInput,
+    GlobalInput,
+    calculate_gp_lp_split,
+    calculate_partial_valuations,
+)
+from termsheet.sensitivity import default_axis, sensitivity_grid
+
+from conftest import FOUNDERS_SHARES, mixed_rounds
+
+
+@pytest.mark.parametrize('use_re', [True, False])
+def test_grid_matches_point_valuations(use_re):
+    rounds, g, fund = mixed_rounds(), GlobalInput(), FundInput()
+    axes = {
+        'volatility': np.array([30.0, 80.0, 140.0]),
+        'holding_period': np.array([1.0, 5.0]),
+        'current_valuation': np.array([40.0, 100.0, 400.0]),
+    }
+    grid = sensitivity_grid(rounds, FOUNDERS_SHARES, g, fund, axes, use_re)
+    assert grid['series'] == ['Series A', 'Series B', 'Series C']
+    assert grid['partial_val'].shape == (3, 3, 2, 3)
+
+    by_name = {r.name: r for r in rounds}
+    for idx in itertools.product(*(range(len(v)) for v in axes.values())):
+        point = replace(g, **{param: float(axes[param][i]) for param, i in zip(axes, idx)})
+        expected = calculate_partial_valuations(rounds, FOUNDERS_SHARES, point, use_re)
+        for k, name in enumerate(grid['series']):
+            assert grid['partial_val'][(k, *idx)] == pytest.approx(expected[name], rel=1e-10)
+            split = calculate_gp_lp_split(expected[name], fund, by_name[name].investment)
+            assert grid['lp_valuation'][(k, *idx)] == pytest.approx(split['lp_valuation'], rel=1e-10)
+            assert grid['gp_carry'][(k, *idx)] == pytest.approx(split['gp_carry'], rel=1e-10, abs=1e-12)
+
+
+def test_risk_free_rate_axis_and_unknown_param():
+    rounds, g, fund = mixed_rounds(), GlobalInput(), FundInput()
+    rates = default_axis('risk_free_rate', g, n=4)
+    grid = sensitivity_grid(rounds, FOUNDERS_SHARES, g, fund, {'risk_free_rate': rates})
+    for i, rate in enumerate(rates):
+        expected = calculate_partial_valuations(rounds, FOUNDERS_SHARES,
+                                                replace(g, risk_free_rate=float(rate)))
+        np.testing.assert_allclose(grid['partial_val'][:, i], list(expected.values()), rtol=1e-10)
+
+    with pytest.raises(ValueError):
+        sensitivity_grid(rounds, FOUNDERS_SHARES, g, fund, {'exit_valuation': rates})
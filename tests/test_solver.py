@@ -0,0 +1,87 @@
+"""
+Breakeven 솔버: 시리즈별 이분법 기준값과 비교, 해가 없는 경우, 참가적 우선주
+"""
+
+from dataclasses import replace
+import math
+import random
+
+import pytest
+
+from termsheet import (
+    FundInput,
+    GlobalInput,
+    RoundInput,
+    calculate_gp_lp_split,
+    calculate_lp_cost,
+    calculate_partial_valuations,
+    solve_breakeven,
+)
+
+from conftest import FOUNDERS_SHARES, random_rounds
+
+
+def bisect_breakeven(r, rounds, g, fund, use_re=True, iterations=200):
+    """기준값: 기업가치를 바꿔 가며 LP Valuation - LP Cost의 부호로 이분법 (해가 없으면 nan)"""
+    lp_cost = calculate_lp_cost(fund, r.investment)
+
+    def f(V):
+        pv = calculate_partial_valuations(rounds, FOUNDERS_SHARES, replace(g, current_valuation=V),
+                                          use_re)[r.name]
+        return calculate_gp_lp_split(pv, fund, r.investment)['lp_valuation'] - lp_cost
+
+    lo, hi = 0.0, 1.0
+    while f(hi) < 0:
+        lo, hi = hi, hi * 2
+        if hi > 1e15:
+            return math.nan
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        lo, hi = (mid, hi) if f(mid) < 0 else (lo, mid)
+    return (lo + hi) / 2
+
+
+@pytest.mark.parametrize('use_re', [True, False])
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_bisection_for_every_series(seed, use_re):
+    rounds = random_rounds(random.Random(seed).randint(1, 6), seed)
+    g, fund = GlobalInput(current_valuation=random.Random(seed).uniform(20, 300)), FundInput()
+    result = solve_breakeven(rounds, FOUNDERS_SHARES, g, fund, use_re)
+
+    assert set(result) == {r.name for r in rounds}
+    for r in rounds:
+        assert result[r.name]['converged']
+        assert result[r.name]['lp_cost'] == pytest.approx(calculate_lp_cost(fund, r.investment))
+        assert result[r.name]['implied_post'] == pytest.approx(
+            bisect_breakeven(r, rounds, g, fund, use_re), rel=1e-6)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_bisection_with_participating_series(seed):
+    rounds = random_rounds(4, seed, participating=0.5)
+    rounds[0].participating = True  # 최소 한 시리즈는 참가적
+    g, fund = GlobalInput(), FundInput()
+    result = solve_breakeven(rounds, FOUNDERS_SHARES, g, fund)
+
+    for r in rounds:
+        assert result[r.name]['converged']
+        assert result[r.name]['implied_post'] == pytest.approx(
+            bisect_breakeven(r, rounds, g, fund), rel=1e-6)
+
+
+def test_no_root_when_carry_caps_lp_value_below_cost():
+    """Carry 100%, 허들 0 → LP Valuation ≤ 투자금액 < LP Cost (관리보수 반영)이라 해가 없음"""
+    rounds = random_rounds(3, seed=0)
+    fund = FundInput(carried_interest=100, hurdle_rate=0)
+    result = solve_breakeven(rounds, FOUNDERS_SHARES, GlobalInput(), fund)
+
+    for r in rounds:
+        assert math.isnan(bisect_breakeven(r, rounds, GlobalInput(), fund, iterations=0))
+        assert math.isnan(result[r.name]['implied_post'])
+        assert not result[r.name]['converged']
+        assert result[r.name]['iterations'] == 0
+
+
+def test_no_active_series():
+    assert solve_breakeven([RoundInput(name='Series A')], FOUNDERS_SHARES,
+                           GlobalInput(), FundInput()) == {}
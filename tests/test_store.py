@@ -0,0 +1,94 @@
+"""
+결과 저장소: content_hash 정규화, 엔진 버전 변경 시 이전 결과 삭제, 크기 제한 LRU 축출
+"""
+
+import itertools
+from types import SimpleNamespace
+
+from termsheet import GlobalInput
+from termsheet import store
+from termsheet.store import ResultStore, content_hash
+
+from conftest import plain_rounds
+
+
+def rounds(investment=20):
+    rounds = plain_rounds(2)
+    rounds[0].investment = investment
+    return rounds
+
+
+def test_content_hash_is_canonical():
+    key = content_hash('analysis', rounds(), GlobalInput())
+
+    # 정수/실수 표기, 리스트/튜플, dict 키 순서는 같은 입력
+    assert content_hash('analysis', rounds(investment=20.0), GlobalInput()) == key
+    assert content_hash('analysis', tuple(rounds()), GlobalInput()) == key
+    assert content_hash('opts', {'a': 1, 'b': [1.0, 2]}) == content_hash('opts', {'b': (1, 2.0), 'a': 1.0})
+
+    # 값, 결과 종류, 데이터클래스 종류가 다르면 다른 키
+    assert content_hash('analysis', rounds(investment=20.5), GlobalInput()) != key
+    assert content_hash('partial_valuations', rounds(), GlobalInput()) != key
+    assert content_hash('analysis', rounds(), GlobalInput(volatility=60)) != key
+
+
+def test_content_hash_includes_engine_version(monkeypatch):
+    key = content_hash('analysis', rounds(), GlobalInput())
+    monkeypatch.setattr(store, 'ENGINE_VERSION', '0.0.0-test')
+    assert content_hash('analysis', rounds(), GlobalInput()) != key
+
+
+def test_results_from_other_engine_version_are_deleted_on_open(tmp_path, monkeypatch):
+    path = str(tmp_path / 'results.sqlite')
+    old = ResultStore(path)
+    old.put('old-key', {'value': 1}, 'analysis')
+    old.close()
+
+    monkeypatch.setattr(store, 'ENGINE_VERSION', '0.0.0-test')
+    new = ResultStore(path)
+    assert new.stats()['entries'] == 0
+    assert new.get('old-key') is None
+    new.put('new-key', {'value': 2})
+    new.close()
+
+    # 같은 버전으로 다시 열면 유지
+    reopened = ResultStore(path)
+    assert reopened.get('new-key') == {'value': 2}
+    reopened.close()
+
+
+def test_fetch_computes_once_and_counts_hits(tmp_path):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'Series A': 12.5}
+
+    db = ResultStore(str(tmp_path / 'results.sqlite'))
+    first = db.fetch('partial_valuations', compute, rounds(), GlobalInput())
+    second = db.fetch('partial_valuations', compute, rounds(investment=20.0), GlobalInput())
+    stats = db.stats()
+    db.close()
+
+    assert first == second == {'Series A': 12.5}
+    assert len(calls) == 1
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+
+
+def test_evicts_least_recently_accessed_over_max_bytes(tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(store, 'time', SimpleNamespace(time=lambda: float(next(clock))))
+    value = {'payload': 'x' * 100}
+    size = len(store.json.dumps(value, ensure_ascii=False))
+
+    db = ResultStore(str(tmp_path / 'results.sqlite'), max_bytes=3 * size)
+    for key in ('a', 'b', 'c'):
+        db.put(key, value)
+    assert db.get('a') == value  # a가 최근 조회 → b가 가장 오래됨
+    db.put('d', value)
+
+    assert db.get('b') is None
+    assert all(db.get(key) == value for key in ('a', 'c', 'd'))
+    stats = db.stats()
+    db.close()
+    assert (stats['entries'], stats['bytes'], stats['evictions']) == (3, 3 * size, 1)
@@ -0,0 +1,98 @@
+"""
+Partial Valuation: 시리즈 일괄 계산, 참가적 우선주 옵션 분해
+"""
+
+from dataclasses import replace
+import random
+
+import numpy as np
+import pytest
+
+from termsheet import (
+    CAP_TABLE_CACHE,
+    GlobalInput,
+    RoundInput,
+    black_scholes_call_array,
+    calculate_exit_payoffs_batch,
+    calculate_partial_valuation,
+    calculate_partial_valuations,
+    option_legs,
+)
+from termsheet import valuation
+
+from conftest import FOUNDERS_SHARES, plain_rounds, random_rounds
+
+
+@pytest.mark.parametrize('use_re', [True, False])
+@pytest.mark.parametrize('seed', range(10))
+def test_batch_matches_per_series(seed, use_re):
+    rounds = random_rounds(random.Random(seed).randint(1, 8), seed)
+    g = GlobalInput(current_valuation=random.Random(seed).uniform(20, 400))
+    batch = calculate_partial_valuations(rounds, FOUNDERS_SHARES, g, use_re)
+
+    assert set(batch) == {r.name for r in rounds}
+    for r in rounds:
+        assert batch[r.name] == pytest.approx(
+            calculate_partial_valuation(r, rounds, FOUNDERS_SHARES, g, use_re), rel=1e-10, abs=1e-10)
+
+
+def test_batch_prices_each_shared_strike_once(monkeypatch):
+    """한 시리즈의 prior_rv + rv = 다음 시리즈의 prior_rv → 고유 행사가격만 한 번의 호출로 평가"""
+    calls = []
+
+    def counting(S, K, *args):
+        calls.append(np.size(K))
+        return black_scholes_call_array(S, K, *args)
+
+    rounds = random_rounds(6, seed=1)
+    monkeypatch.setattr(valuation, 'black_scholes_call_array', counting)
+    CAP_TABLE_CACHE.clear()
+    calculate_partial_valuations(rounds, FOUNDERS_SHARES, GlobalInput(), use_re=False)
+
+    # 첫 시리즈의 prior_rv 0, 누적 RV 6개, 전환포인트 6개
+    assert calls == [1 + 6 + 6]
+
+
+@pytest.mark.parametrize('cap, liquidation_pref', [(1.0, 1.0), (1.0, 1.5), (1.5, 2.0)])
+def test_noop_cap_matches_non_participating(cap, liquidation_pref):
+    """상한 ≤ 청산우선권이면 참가분이 없으므로 비참가적과 같은 결과"""
+    g = GlobalInput()
+    rounds = plain_rounds()
+    rounds[2].liquidation_pref = liquidation_pref
+    capped = [replace(r) for r in rounds]
+    capped[2].participating = True
+    capped[2].participation_cap = cap
+
+    assert calculate_partial_valuations(capped, FOUNDERS_SHARES, g) == \
+        calculate_partial_valuations(rounds, FOUNDERS_SHARES, g)
+
+
+def test_participation_adds_value_to_participating_series():
+    g = GlobalInput()
+    rounds = plain_rounds()
+    base = calculate_partial_valuations(rounds, FOUNDERS_SHARES, g)
+    rounds[2].participating = True
+    participating = calculate_partial_valuations(rounds, FOUNDERS_SHARES, g)
+
+    assert participating['Series C'] > base['Series C']
+    for r in rounds:
+        assert calculate_partial_valuation(r, rounds, FOUNDERS_SHARES, g) == \
+            pytest.approx(participating[r.name], abs=1e-12)
+
+
+@pytest.mark.parametrize('cap', [0.0, 1.5, 3.0])
+@pytest.mark.parametrize('liquidation_pref', [1.0, 2.0])
+def test_single_series_legs_reproduce_waterfall(cap, liquidation_pref):
+    """시리즈가 하나면 옵션 레그의 만기 payoff가 waterfall과 일치"""
+    rounds = [RoundInput(name='Series A', active=True, investment=40, shares=2_000_000,
+                         liquidation_pref=liquidation_pref, participating=True,
+                         participation_cap=cap)]
+    legs = option_legs(rounds, FOUNDERS_SHARES)
+    exits = np.linspace(0, 3000, 1001)
+    payoff = calculate_exit_payoffs_batch(exits, rounds, FOUNDERS_SHARES)['합계'][1]
+
+    replicated = sum(
+        weight * (np.maximum(exits - strike, 0) if strike > 0 else exits)
+        for strike, weight in zip(legs['strikes'][0], legs['weights'][0])
+    )
+    np.testing.assert_allclose(replicated, payoff, atol=1e-9)